@@ -18,6 +18,10 @@ from modules.calendar_variants.calender_yr_to_yr_cal import (
     g_to_s_yr_cal,  # Convert Gregorian year to julian year
     h_to_s_yr_cal,  # Convert Hijri year to julian year
     s_to_h_yr_cal,  # Convert julian year to Hijri year    
+    convert_year,  # Exact span of overlapping years in another calendar
+    convert_years,  # Vectorised year conversion
+    YearBoundaryTable,  # Year start ordinals of every calendar
+    get_year_boundaries,  # Shared year boundary table
 )
 
 # Functions for calendar variants
@@ -25,6 +29,9 @@ from modules.calendar_variants.calender_yr_to_yr_cal import (
 # These functions handle the conversion of dates between different calendar systems
 from modules.calendar_variants.get_calendar_variants import (
     get_calendar_variants,  # Convert dates between calendar systems
+    get_calendar_variants_span,  # Ordinal interval of a complete or partial date
+    iter_calendar_variants,  # Lazy per-day calendar variants
+    weekday_matches,  # Check a weekday name against a date by day ordinal
     get_calendar_variants_by_lang,  # Language-specific calendar conversion
 )
 
@@ -40,8 +47,15 @@ __all__ = [
     "g_to_s_yr_cal",  # Convert Gregorian year to julian year
     "h_to_s_yr_cal",  # Convert Hijri year to julian year
     "s_to_h_yr_cal",  # Convert julian year to Hijri year 
+    "convert_year",
+    "convert_years",
+    "YearBoundaryTable",
+    "get_year_boundaries",
     
     # Functions for calendar variants
     "get_calendar_variants",
+    "get_calendar_variants_span",
+    "iter_calendar_variants",
+    "weekday_matches",
     "get_calendar_variants_by_lang",
 ]
\ No newline at end of file
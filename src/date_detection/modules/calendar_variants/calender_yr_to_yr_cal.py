@@ -5,100 +5,290 @@ Created on Sun Jun 22 21:38:10 2025
 @author: m
 
 @description: This module provides calendar conversion utilities and functions to get calendar variants.
+
+Year-to-year conversion uses a year-boundary table: the ordinal of the first
+day of every year of every calendar, taken from the mapping data where it
+covers the year start and from calendar arithmetic
+(``data._load_data.calendar_arithmetic``) outside it. A year of one calendar
+is the interval between two consecutive starts, so the years of another
+calendar it overlaps are found with two lookups. The overlap of every year is
+precomputed per calendar pair on first use, so a single lookup is O(1) and
+``convert_years`` converts whole arrays at once.
+
+Example::
+
+    convert_year(1445, 'hijri', 'gregorian')      # (2023, 2024)
+    h_to_g_yr_cal(1445)                           # 2023, the year 1445 AH starts in
 """
 
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import logging
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from data._load_data.calendar_arithmetic import year_starts
+from data._load_data.calendar_table import (
+    CALENDAR_COLUMNS,
+    CalendarTable,
+    get_calendar_table,
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Last year of every calendar in the boundary table
+MAX_YEAR = 9999
+
+# Marker for "no overlapping year" in the converted arrays
+NO_YEAR = 0
+
+# ===================================================================================
+# YEAR BOUNDARY TABLE
+# ===================================================================================
+class YearBoundaryTable:
+    """
+    First-day ordinals of years 1..``max_year`` of every calendar.
+
+    Attributes:
+        starts (Dict[str, np.ndarray]): ``starts[calendar][year]`` is the ordinal
+            of the first day of ``year``; index 0 is unused and
+            ``starts[calendar][max_year + 1]`` closes the last year
+        exact (Dict[str, np.ndarray]): True where the start comes from the mapping data
+
+    Args:
+        table (CalendarTable, optional): Mapping data; arithmetic only when None
+        max_year (int): Last year of every calendar
+    """
+
+    def __init__(self, table: Optional[CalendarTable] = None, max_year: int = MAX_YEAR):
+        self.max_year = max_year
+        self.starts: Dict[str, np.ndarray] = {}
+        self.exact: Dict[str, np.ndarray] = {}
+        self._pairs: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]] = {}
+        years = np.arange(max_year + 2, dtype=np.int64)
+        for calendar in CALENDAR_COLUMNS:
+            starts = year_starts(calendar, np.maximum(years, 1))
+            exact = np.zeros(len(years), dtype=bool)
+            if table is not None:
+                self._splice_table(table, calendar, starts, exact)
+            starts[0] = np.iinfo(np.int64).min
+            self.starts[calendar] = starts
+            self.exact[calendar] = exact
+
+    @staticmethod
+    def _splice_table(table: CalendarTable, calendar: str, starts: np.ndarray, exact: np.ndarray) -> None:
+        """Replace arithmetic starts with the table's wherever the table has the year's first day."""
+        _, year_bounds, _ = table.boundaries(calendar)
+        d, m, _ = CALENDAR_COLUMNS[calendar]
+        first_row_is_new_year = table.fields[0, d] == 1 and table.fields[0, m] == 1
+        for year, (start, _) in year_bounds.items():
+            if 0 < year < len(starts) and (start > table.base or first_row_is_new_year):
+                starts[year] = start
+                exact[year] = True
+
+    # Single years
+    # ===============================================================================
+    def _check_year(self, year: int) -> int:
+        year = int(year)
+        if not 1 <= year <= self.max_year:
+            raise ValueError(f"Year {year} is outside the supported range 1..{self.max_year}")
+        return year
+
+    def year_span(self, calendar: str, year: int) -> Tuple[int, int]:
+        """
+        Half-open ordinal interval ``[start, end)`` of a year.
+
+        Raises:
+            ValueError: If ``year`` is outside 1..``max_year``
+        """
+        starts = self.starts[CalendarTable.normalize_calendar(calendar)]
+        year = self._check_year(year)
+        return int(starts[year]), int(starts[year + 1])
+
+    def overlapping_years(self, year: int, from_calendar: str, to_calendar: str) -> Optional[Tuple[int, int]]:
+        """
+        First and last year of ``to_calendar`` sharing at least one day with
+        ``year`` of ``from_calendar``, O(1).
+
+        Returns:
+            Optional[Tuple[int, int]]: ``(first, last)``, or None when
+            ``year`` is outside years 1..``max_year`` or the overlap falls
+            outside years 1..``max_year`` of ``to_calendar``
+        """
+        first, last = self._pair(from_calendar, to_calendar)
+        year = int(year)
+        if not 1 <= year <= self.max_year:
+            return None
+        if first[year] == NO_YEAR or last[year] == NO_YEAR:
+            return None
+        return int(first[year]), int(last[year])
+
+    # Arrays of years
+    # ===============================================================================
+    def convert_years(self, years, from_calendar: str, to_calendar: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorised ``overlapping_years``.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: First and last overlapping years;
+            ``NO_YEAR`` (0) for years without a result or outside 1..``max_year``
+        """
+        first, last = self._pair(from_calendar, to_calendar)
+        years = np.asarray(years, dtype=np.int64)
+        valid = (years >= 1) & (years <= self.max_year)
+        index = np.where(valid, years, 0)
+        return np.where(valid, first[index], NO_YEAR), np.where(valid, last[index], NO_YEAR)
+
+    def _pair(self, from_calendar: str, to_calendar: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Overlap arrays of a calendar pair, built on first use."""
+        key = (CalendarTable.normalize_calendar(from_calendar), CalendarTable.normalize_calendar(to_calendar))
+        if key not in self._pairs:
+            source, target = self.starts[key[0]], self.starts[key[1]]
+            # Year of ``target`` containing the first and the last day of each ``source`` year
+            first = np.searchsorted(target, source[:-1], side="right") - 1
+            last = np.searchsorted(target, source[1:] - 1, side="right") - 1
+            # Days past the closing start of ``target`` have no year
+            first[first > self.max_year] = NO_YEAR
+            last[last > self.max_year] = NO_YEAR
+            first[0] = last[0] = NO_YEAR
+            self._pairs[key] = (first, last)
+        return self._pairs[key]
+
+
+@lru_cache(maxsize=None)
+def get_year_boundaries() -> YearBoundaryTable:
+    """Process-wide ``YearBoundaryTable``; arithmetic only if the mapping data is missing."""
+    try:
+        table = get_calendar_table()
+    except (FileNotFoundError, ValueError) as e:
+        logger.warning(f"Mapping data unavailable, using calendar arithmetic for years: {e}")
+        table = None
+    return YearBoundaryTable(table)
+
+
+# ===================================================================================
+# UTILITY FUNCTIONS
+# ===================================================================================
+def convert_year(year: int, from_calendar: str, to_calendar: str) -> Optional[Tuple[int, int]]:
+    """
+    Exact span of ``to_calendar`` years overlapping ``year`` of ``from_calendar``.
+    Args:
+        year (int): Year to convert.
+        from_calendar (str): Calendar of ``year``.
+        to_calendar (str): Target calendar.
+    Returns:
+        Optional[Tuple[int, int]]: First and last overlapping year, or None
+        (also for years outside 1..``MAX_YEAR``).
+    """
+    return get_year_boundaries().overlapping_years(year, from_calendar, to_calendar)
+
+# ===================================================================================
+# UTILITY FUNCTIONS
+# ===================================================================================
+def convert_years(years, from_calendar: str, to_calendar: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised ``convert_year``.
+    Args:
+        years (array-like): Years to convert.
+        from_calendar (str): Calendar of ``years``.
+        to_calendar (str): Target calendar.
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: First and last overlapping years, 0 where there is none.
+    """
+    return get_year_boundaries().convert_years(years, from_calendar, to_calendar)
+
+
+def _start_year(year: int, from_calendar: str, to_calendar: str) -> Optional[int]:
+    span = convert_year(year, from_calendar, to_calendar)
+    return None if span is None else span[0]
+
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def h_to_g_yr_cal(h_year: int) -> int:
+def h_to_g_yr_cal(h_year: int) -> Optional[int]:
     """
     Convert Hijri year to Gregorian year.
     Args:
         h_year (int): Hijri year to convert.
-        Returns:
-        int: Corresponding Gregorian year.
+    Returns:
+        Optional[int]: Gregorian year in which the Hijri year starts
+            (see ``convert_year`` for the full span), None for years
+            outside 1..``MAX_YEAR``.
     """
-    # Approximate conversion formula
-    # The conversion is not exact due to the differences in calendar systems
-    return int(h_year * 0.97 + 622)
+    return _start_year(h_year, 'hijri', 'gregorian')
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def g_to_h_yr_cal(g_year: int) -> int:
+def g_to_h_yr_cal(g_year: int) -> Optional[int]:
     """
     Convert Gregorian year to Hijri year.
     Args:
         g_year (int): Gregorian year to convert.
     Returns:
-        int: Corresponding Hijri year.
+        Optional[int]: Hijri year current on 1 January of the Gregorian year.
     """
-    # Approximate conversion formula
-    # The conversion is not exact due to the differences in calendar systems
-    return int((g_year - 622) / 0.97)
+    return _start_year(g_year, 'gregorian', 'hijri')
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def s_to_g_yr_cal(s_year: int) -> int:
+def s_to_g_yr_cal(s_year: int) -> Optional[int]:
     """
     Convert julian year to Gregorian year.
     Args:
         s_year (int): julian year to convert.
     Returns:
-        int: Corresponding Gregorian year.
+        Optional[int]: Gregorian year in which the julian year starts.
     """
-    # Approximate conversion formula
-    return int(s_year + 621)
+    return _start_year(s_year, 'julian', 'gregorian')
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def g_to_s_yr_cal(g_year: int) -> int:
+def g_to_s_yr_cal(g_year: int) -> Optional[int]:
     """
     Convert Gregorian year to julian year.
     Args:
         g_year (int): Gregorian year to convert.
     Returns:
-        int: Corresponding julian year.
+        Optional[int]: julian year current on 1 January of the Gregorian year.
     """
-    # Approximate conversion formula
-    # The conversion is not exact due to the differences in calendar systems
-    # The julian calendar is approximately 621 years behind the Gregorian calendar
-    return int(g_year - 621)
+    return _start_year(g_year, 'gregorian', 'julian')
 
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def s_to_h_yr_cal(s_year: int) -> int:
+def s_to_h_yr_cal(s_year: int) -> Optional[int]:
     """
     Convert julian year to Hijri year.
     Args:
         s_year (int): julian year to convert.
     Returns:
-        int: Corresponding Hijri year.
+        Optional[int]: Hijri year current on the first day of the julian year.
     """
-    # Approximate conversion formula
-    # The conversion is not exact due to the differences in calendar systems
-    # The Hijri calendar is approximately 622 years behind the julian calendar
-    return int((s_year - 621) / 0.97 + 622)
+    return _start_year(s_year, 'julian', 'hijri')
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def h_to_s_yr_cal(h_year: int) -> int:
+def h_to_s_yr_cal(h_year: int) -> Optional[int]:
     """
     Convert Hijri year to julian year.
     Args:
         h_year (int): Hijri year to convert.
     Returns:
-        int: Corresponding julian year.
+        Optional[int]: julian year current on the first day of the Hijri year.
     """
-    # Approximate conversion formula
-    # The conversion is not exact due to the differences in calendar systems
-    # The julian calendar is approximately 621 years behind the Hijri calendar
-    return int((h_year - 622) * 0.97 + 621)  
-
-
-
+    return _start_year(h_year, 'hijri', 'julian')
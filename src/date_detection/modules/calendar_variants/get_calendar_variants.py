@@ -7,10 +7,7 @@ Created on Sun Jun 22 21:38:10 2025
 @description: This module provides calendar conversion utilities and functions to get calendar variants.
 """
 
-import numpy as np
-import pandas as pd
-from typing import Dict, List, Optional
-import os
+from typing import Dict, Iterator, List, Optional, Tuple
 
 # Import path helper to ensure modules directory is in sys.path
 # ===================================================================================
@@ -25,8 +22,9 @@ if __name__ == "__main__":
 from modules.normalizers import normalize_month
 from modules.normalizers import normalize_era
 from modules.normalizers import normalize_weekday
+from modules.normalizers import weekday_index
 
-from data._load_data import load_mapping_date
+from data._load_data import get_calendar_table, weekday_of_date
     
 # ===================================================================================
 # Function to get calendar variants by language
@@ -130,124 +128,144 @@ def get_calendar_variants_by_lang(
 # ===================================================================================
 # Function to get calendar variants
 # ===================================================================================
+CALENDARS = ('gregorian', 'hijri', 'julian')
+
+
+def _validate_input_date(input_date: Dict[str, any]) -> str:
+    """Check the required keys of ``input_date`` and return its calendar."""
+    # Check if input_date has required keys
+    if 'calendar' not in input_date or 'year' not in input_date:
+        raise ValueError("Input date must contain 'calendar' and 'year' keys")
+
+    # Normalize calendar input
+    if not isinstance(input_date['calendar'], str):
+        raise ValueError("'calendar' must be a string")
+
+    cal = input_date['calendar'].lower()
+    if cal not in CALENDARS:
+        raise ValueError(
+            f"Unsupported calendar: {cal}. Supported calendars: {list(CALENDARS)}"
+        )
+    return cal
+
+
+def get_calendar_variants_span(input_date: Dict[str, any]) -> Optional[Tuple[int, int]]:
+    """
+    Resolve a complete or partial date to a day-ordinal interval ``[start, end)``.
+
+    Year-only and month-year dates resolve in O(1) from the precomputed month
+    and year boundaries of the calendar table, without touching the days.
+
+    Args:
+        input_date: Dictionary with 'calendar' and 'year' (required), 'day' and
+                   'month' (optional)
+
+    Returns:
+        ``(start, end)`` ordinals, or None when the date is not in the table or a
+        day is given without a month (not a contiguous interval)
+    """
+    cal = _validate_input_date(input_date)
+    return get_calendar_table().partial_span(
+        cal,
+        day=input_date.get('day'),
+        month=input_date.get('month'),
+        year=input_date['year'],
+    )
+
+
+def _date_variants(day_info: Dict[str, any]) -> List[Dict[str, any]]:
+    """Split a ``CalendarTable.from_ordinal`` dict into one dict per calendar."""
+    return [
+        {
+            "weekday": day_info['weekday'],
+            "weekday_index": day_info['weekday_index'],
+            **day_info[calendar],
+            "calendar": calendar,
+        }
+        for calendar in CALENDARS
+    ]
+
+
+def weekday_matches(weekday, input_date: Dict[str, any]) -> Optional[bool]:
+    """
+    Check a detected weekday against a complete date, e.g. "يوم الجمعة 15 رمضان 1445".
+
+    The weekday name is resolved to its index (0 = Sunday) through a
+    precomputed lookup and compared with ``ordinal % 7`` of the date; no
+    calendar variants or weekday names are built.
+
+    Args:
+        weekday: Weekday name in any supported language, or number (1-7)
+        input_date: Dictionary with 'calendar', 'day', 'month' and 'year'
+
+    Returns:
+        True or False, or None when the weekday or the date cannot be resolved
+    """
+    cal = _validate_input_date(input_date)
+    expected = weekday_index(weekday)
+    if expected is None or not input_date.get('day') or not input_date.get('month'):
+        return None
+    actual = weekday_of_date(cal, input_date['day'], input_date['month'], input_date['year'])
+    return None if actual is None else actual == expected
+
+
+def iter_calendar_variants(input_date: Dict[str, any]) -> Iterator[List[Dict[str, any]]]:
+    """
+    Lazily yield the calendar variants of every day matching ``input_date``.
+
+    Args:
+        input_date: See ``get_calendar_variants``
+
+    Yields:
+        List of three dictionaries (gregorian, hijri, julian) per matching day
+    """
+    cal = _validate_input_date(input_date)
+    table = get_calendar_table()
+    day = input_date.get('day')
+
+    if day is not None and input_date.get('month') is None:
+        # Same day number in every month of the year: filter the year lazily
+        span = table.year_span(cal, input_date['year'])
+        if span is None:
+            return
+        for day_info in table.iter_days(*span):
+            if day_info[cal]['day'] == day:
+                yield _date_variants(day_info)
+        return
+
+    span = get_calendar_variants_span(input_date)
+    if span is None:
+        return
+    for day_info in table.iter_days(*span):
+        yield _date_variants(day_info)
+
+
 def get_calendar_variants(input_date: Dict[str, any]) -> List[Dict[str, any]]:
     """
     Convert a date from one calendar system to equivalent dates in all
     supported calendars.
-    
+
+    For partial dates prefer ``get_calendar_variants_span`` (an ordinal
+    interval) or ``iter_calendar_variants`` (lazy), which avoid building three
+    dictionaries per day.
+
     Args:
         input_date: Dictionary with keys 'calendar' and 'year' (required),
                    'day' and 'month' (optional)
                    calendar should be one of: 'gregorian', 'hijri', 'julian'
                    If 'day' or 'month' is missing, returns all matching dates
-    
+
     Returns:
         List of dictionaries, each containing date info for one calendar system
+        ('weekday' name and 'weekday_index', 0 = Sunday, included)
         Empty list if no matching date found
-    
+
     Raises:
         ValueError: If calendar type is not supported or required fields missing
-        KeyError: If required columns are missing from DataFrame
     """
-    date_df = load_mapping_date()
-    
-    
-    # Check if input_date has required keys
-    if 'calendar' not in input_date or 'year' not in input_date:
-        raise ValueError("Input date must contain 'calendar' and 'year' keys")
-    
-    # Normalize calendar input
-    if not isinstance(input_date['calendar'], str):
-        raise ValueError("'calendar' must be a string")
-    
-    cal = input_date['calendar'].lower()
-    
-    # Validate required fields
-    if 'year' not in input_date:
-        raise ValueError("'year' is required in input_date")
-    
-    year = input_date['year']
-    day = input_date.get('day')  # None if not provided
-    month = input_date.get('month')  # None if not provided
-    
-    # Column maps for each calendar type
-    calendar_columns = {
-        'gregorian': ['Gregorian Day', 'Gregorian Month', 'Gregorian Year'],
-        'hijri': ['Hijri Day', 'Hijri Month', 'Hijri Year'],
-        'julian': ['Solar Hijri Day', 'Solar Hijri Month', 'Solar Hijri Year']
-    }
-    
-    if cal not in calendar_columns:
-        supported_cals = list(calendar_columns.keys())
-        raise ValueError(
-            f"Unsupported calendar: {cal}. Supported calendars: {supported_cals}"
-        )
-    
-    # Validate DataFrame has required columns
-    required_columns = set()
-    for cols in calendar_columns.values():
-        required_columns.update(cols)
-    required_columns.add('Week Day')
-    
-    missing_columns = required_columns - set(date_df.columns)
-    if missing_columns:
-        raise KeyError(f"DataFrame missing required columns: {missing_columns}")
-    
-    day_col, month_col, year_col = calendar_columns[cal]
-    
-    # Convert to numpy arrays for fast indexing
-    try:
-        d = date_df[day_col].to_numpy()
-        m = date_df[month_col].to_numpy()
-        y = date_df[year_col].to_numpy()
-    except Exception as e:
-        raise ValueError(f"Error converting columns to numpy arrays: {e}")
-    
-    # Get matching index using numpy - build mask conditionally
-    mask = (y == year)  # Always filter by year
-    
-    if month is not None:
-        mask = mask & (m == month)
-    
-    if day is not None:
-        mask = mask & (d == day)
-    
-    idx = np.where(mask)[0]
-    
-    if len(idx) == 0:
-        return []  # No match found
-    
-    # Get data for all matching rows (not just first one)
     results = []
-    for i in idx:
-        row = date_df.iloc[i]
-        
-        # Create result set for this matching date
-        date_variants = [
-            {
-                "weekday": row['Week Day'],
-                "day": int(row['Gregorian Day']),
-                "month": int(row['Gregorian Month']),
-                "year": int(row['Gregorian Year']),
-                "calendar": "gregorian"
-            },
-            {
-                "weekday": row['Week Day'],
-                "day": int(row['Hijri Day']),
-                "month": int(row['Hijri Month']),
-                "year": int(row['Hijri Year']),
-                "calendar": "hijri"
-            },
-            {
-                "weekday": row['Week Day'],
-                "day": int(row['Solar Hijri Day']),
-                "month": int(row['Solar Hijri Month']),
-                "year": int(row['Solar Hijri Year']),
-                "calendar": "julian"
-            }
-        ]
+    for date_variants in iter_calendar_variants(input_date):
         results.extend(date_variants)
-    
     return results
 
 # ===================================================================================
@@ -330,3 +348,20 @@ if __name__ == "__main__":
     }
     result = get_calendar_variants(input_date)
     print_results(result, "All dates in 2024")
+
+    print("\n=== Test 5: Year as an ordinal interval ===")
+    input_date = {
+        'calendar': 'hijri',
+        'year': 1445
+    }
+    start, end = get_calendar_variants_span(input_date)
+    print(f"Hijri 1445: [{start}, {end}) = {end - start} days")
+
+    print("\n=== Test 6: Weekday check ===")
+    input_date = {
+        'calendar': 'hijri',
+        'day': 15,
+        'month': 9,
+        'year': 1445
+    }
+    print(f"يوم الجمعة 15 رمضان 1445: {weekday_matches('الجمعة', input_date)}")
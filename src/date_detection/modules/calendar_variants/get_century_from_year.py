@@ -17,7 +17,7 @@ if __name__ == "__main__":
     # Ensure the modules directory is in sys.path for imports
     add_modules_to_sys_path()
 
-from modules.calendar_variants import get_ordinal_suffix
+from modules.calendar_variants.get_ordinal_suffix import get_ordinal_suffix
 
 # ===================================================================================
 # UTILITY FUNCTIONS
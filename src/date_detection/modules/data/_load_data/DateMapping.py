@@ -67,12 +67,16 @@ License: MIT
 Requires: pandas>=1.3.0
 """
 
+import io
+import json
 import os
 import pandas as pd
-from typing import Optional, Dict, List, Any, Union, Tuple
+from typing import Optional, Dict, Iterator, List, Any, Union, Tuple
 from dataclasses import dataclass
 import logging
 
+from data._load_data.calendar_arithmetic import WEEKDAY_NAMES
+
 # Configure logging for the module
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -85,7 +89,8 @@ SUPPORTED_CALENDARS = {
     'julian': ['Solar Hijri Day', 'Solar Hijri Month', 'Solar Hijri Year']  # Note: 'julian' maps to Solar Hijri
 }
 
-# Column name for weekday information in the CSV file
+# Column name for weekday information in the CSV file; weekdays are computed
+# from the day ordinal (``WEEKDAY_NAMES[ordinal % 7]``) rather than read from it
 WEEKDAY_COLUMN = 'Week Day'
 
 # Default CSV file path relative to this module
@@ -117,8 +122,11 @@ class DateMapping:
         df (Optional[pd.DataFrame]): DataFrame containing the calendar mapping data.
             This is loaded automatically during initialization.
         csv_path (str): Path to the CSV file containing mapping data.
+        use_manifest (bool): Trust a CSV whose checksum matches its build-time
+            manifest (see ``mapping_manifest``) instead of validating it.
         _data_loaded (bool): Internal flag indicating successful data loading.
         _date_ranges (Dict[str, Dict[str, int]]): Cached date ranges for each calendar.
+        _manifest (Dict[str, Any]): Manifest of trusted data, if any.
     
     Example:
         Initialize and perform basic operations::
@@ -143,6 +151,9 @@ class DateMapping:
     csv_path: str = DEFAULT_CSV_PATH
     _data_loaded: bool = False
     _date_ranges: Optional[Dict[str, Dict[str, int]]] = None
+    _calendar_table: Optional[Any] = None
+    use_manifest: bool = True
+    _manifest: Optional[Dict[str, Any]] = None
     
     def __post_init__(self) -> None:
         """
@@ -158,11 +169,24 @@ class DateMapping:
         The initialization is fail-safe: if data loading fails, the object
         is still created but with limited functionality.
         
+        When a process-wide calendar table is installed (a worker attached to
+        a ``shared_table.SharedCalendarTable``) and the default CSV is used,
+        the CSV is not read: conversions use the installed table and the
+        DataFrame is only built from it when a DataFrame-based method needs it.
+        
         Raises:
             FileNotFoundError: If the calendar mapping CSV file cannot be found
             ValueError: If the CSV file has incorrect structure or missing columns
             RuntimeError: If there are issues with data processing
         """
+        from data._load_data.calendar_table import installed_calendar_table
+
+        if self.df is None and self.csv_path == DEFAULT_CSV_PATH and installed_calendar_table() is not None:
+            self._calendar_table = installed_calendar_table()
+            self._data_loaded = True
+            self._manifest = self._installed_table_manifest()
+            logger.debug("Using the installed calendar table, DataFrame deferred")
+            return
         try:
             self.df = self._load_mapping_data()
             self._data_loaded = True
@@ -188,6 +212,9 @@ class DateMapping:
             else:
                 print("Calendar data not available")
         """
+        if self._data_loaded and self.df is None and self._calendar_table is not None:
+            # Deferred DataFrame of an installed (shared) table
+            self.df = self._calendar_table.to_dataframe()
         return self._data_loaded and self.df is not None and not self.df.empty
     
     def _load_mapping_data(self) -> pd.DataFrame:
@@ -230,6 +257,12 @@ class DateMapping:
         if not os.access(file_path, os.R_OK):
             raise PermissionError(f"Cannot read calendar data file: {file_path}")
         
+        # Files validated by the build step (mapping_manifest.py) skip cleaning
+        if self.use_manifest:
+            trusted = self._load_trusted_data(file_path)
+            if trusted is not None:
+                return trusted
+        
         try:
             # Load CSV with UTF-8 encoding to handle international characters
             logger.info(f"Loading calendar data from: {file_path}")
@@ -282,8 +315,7 @@ class DateMapping:
                     df[col] = df[col].astype(int)
             
             # Validate weekday column contains valid values
-            valid_weekdays = {'Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday'}
-            invalid_weekdays = set(df[WEEKDAY_COLUMN].unique()) - valid_weekdays
+            invalid_weekdays = set(df[WEEKDAY_COLUMN].unique()) - set(WEEKDAY_NAMES)
             if invalid_weekdays:
                 logger.warning(f"Found unexpected weekday values: {invalid_weekdays}")
             
@@ -301,6 +333,51 @@ class DateMapping:
         except Exception as e:
             raise RuntimeError(f"Failed to load calendar data: {str(e)}")
     
+    def _load_trusted_data(self, file_path: str) -> Optional[pd.DataFrame]:
+        """
+        Load a CSV validated at build time, without cleaning.
+        
+        The file is trusted when a manifest exists next to it and the file's
+        SHA-256 matches the manifest; it is then parsed with fixed integer
+        dtypes, and no dropna, numeric coercion, range checks or sort run.
+        
+        Args:
+            file_path: Absolute path of the CSV
+            
+        Returns:
+            Optional[pd.DataFrame]: Data, or None when the file is not covered
+            by a matching manifest (the validating loader is used instead)
+        """
+        from data._load_data.mapping_manifest import load_manifest, sha256_hex
+        
+        manifest = load_manifest(file_path)
+        if manifest is None:
+            return None
+        
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        if sha256_hex(raw) != manifest['sha256']:
+            logger.warning(f"Calendar data does not match its manifest, validating: {file_path}")
+            return None
+        
+        dtypes = {col: 'int32' for cols in SUPPORTED_CALENDARS.values() for col in cols}
+        df = pd.read_csv(io.BytesIO(raw), encoding='utf-8', dtype=dtypes)
+        self._manifest = manifest
+        logger.info(f"Loaded {len(df):,} verified calendar mapping records from {file_path}")
+        return df
+    
+    def _installed_table_manifest(self) -> Optional[Dict[str, Any]]:
+        """Manifest of the default CSV if it describes the installed calendar table."""
+        from data._load_data.mapping_manifest import load_manifest
+        
+        file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), self.csv_path))
+        manifest = load_manifest(file_path) if self.use_manifest else None
+        table = self._calendar_table
+        if manifest is None or manifest['total_records'] != len(table) \
+                or manifest['gregorian_range']['first_ordinal'] != table.base:
+            return None
+        return manifest
+    
     def _validate_date_ranges(self, df: pd.DataFrame) -> None:
         """
         Validate that date ranges in the DataFrame are reasonable.
@@ -364,8 +441,9 @@ class DateMapping:
         """
         Get the weekday name for a specific date in the given calendar system.
         
-        This method looks up the weekday for a specific date using the pre-calculated
-        mapping data. The lookup is fast and accurate, based on astronomical calculations.
+        The date is resolved to its day ordinal in the calendar table and the
+        weekday computed as ``ordinal % 7``; the 'Week Day' column is not read.
+        Use ``get_weekday_index`` for the index (0 = Sunday) instead of the name.
         
         Args:
             calendar (str): Calendar system ('gregorian', 'hijri', 'julian', or aliases)
@@ -402,37 +480,36 @@ class DateMapping:
             mapping data, which may occur for dates outside the available range
             or invalid date combinations.
         """
-        if not self.is_data_loaded():
-            raise RuntimeError("Calendar mapping data is not loaded. Check initialization.")
-        
+        weekday = self.get_weekday_index(calendar, day, month, year)
+        return None if weekday is None else WEEKDAY_NAMES[weekday]
+
+    def get_weekday_index(self, calendar: str, day: int, month: int, year: int) -> Optional[int]:
+        """
+        Weekday index of a date in the mapping data, 0 = Sunday ... 6 = Saturday.
+
+        Args:
+            calendar (str): Calendar system ('gregorian', 'hijri', 'julian', or aliases)
+            day (int): Day of the month
+            month (int): Month of the year
+            year (int): Year in the specified calendar system
+
+        Returns:
+            Optional[int]: Weekday index, or None if the date is not in the mapping data
+
+        Raises:
+            ValueError: If the calendar parameter is not supported
+            RuntimeError: If calendar data is not loaded
+        """
         # Normalize and validate calendar name
         calendar = self._normalize_calendar_name(calendar)
-        
-        # Get column names for the specified calendar system
-        day_col, month_col, year_col = SUPPORTED_CALENDARS[calendar]
-        
-        # Create filter mask to find matching date
-        mask = (
-            (self.df[day_col] == day) & 
-            (self.df[month_col] == month) & 
-            (self.df[year_col] == year)
-        )
-        
-        # Find matching rows
-        matching_rows = self.df[mask]
-        
-        # Return weekday if found, None otherwise
-        if matching_rows.empty:
+
+        weekday = self.calendar_table.weekday(calendar, day, month, year)
+        if weekday is None:
             logger.debug(f"Date not found: {calendar} {day}/{month}/{year}")
-            return None
-        
-        # Log if multiple matches found (shouldn't happen with clean data)
-        if len(matching_rows) > 1:
-            logger.warning(f"Multiple matches found for {calendar} {day}/{month}/{year}")
-        
-        return matching_rows.iloc[0][WEEKDAY_COLUMN]
+        return weekday
     
-    def get_date_alternative_calendar(self, calendar: str, day: int, month: int, year: int) -> Optional[Dict[str, Any]]:
+    def get_date_alternative_calendar(self, calendar: str, day: int, month: int, year: int,
+                                      method: str = 'auto') -> Optional[Dict[str, Any]]:
         """
         Get equivalent dates in all supported calendar systems for a specific date.
         
@@ -445,6 +522,12 @@ class DateMapping:
             day (int): Day of the month in the source calendar
             month (int): Month of the year in the source calendar  
             year (int): Year in the source calendar
+            method (str): Conversion backend:
+            
+                * ``'auto'`` (default): mapping data inside its range, calendar
+                  arithmetic (tabular Islamic, 33-year Solar Hijri) outside it
+                * ``'table'``: mapping data only
+                * ``'arithmetic'``: calendar arithmetic only
             
         Returns:
             Optional[Dict[str, Any]]: Dictionary containing equivalent dates in all
@@ -454,14 +537,16 @@ class DateMapping:
                     'gregorian': {'day': int, 'month': int, 'year': int},
                     'hijri': {'day': int, 'month': int, 'year': int},
                     'julian': {'day': int, 'month': int, 'year': int},
-                    'weekday': str
+                    'weekday': str,
+                    'method': str    # 'table' or 'arithmetic'
                 }
                 
-                Returns None if the date is not found in the mapping data.
+                Returns None if the date does not exist, or with ``'table'``
+                if it is not found in the mapping data.
                 
         Raises:
-            ValueError: If the calendar parameter is not supported
-            RuntimeError: If calendar data is not loaded
+            ValueError: If the calendar or method parameter is not supported
+            RuntimeError: If calendar data is not loaded and method is 'table'
             
         Example:
             Convert between different calendar systems::
@@ -481,61 +566,34 @@ class DateMapping:
                 # Convert from Hijri
                 result = mapper.get_date_alternative_calendar('hijri', 1, 1, 1445)
                 
+                # Before the mapping data: converted arithmetically
+                result = mapper.get_date_alternative_calendar('hijri', 1, 9, 1200)
+                print(result['method'])  # 'arithmetic'
+                
         Note:
             This method is the foundation for calendar conversion functionality.
             It returns complete information for all supported calendar systems,
-            enabling seamless conversion between any two systems.
+            enabling seamless conversion between any two systems. Arithmetic
+            Hijri dates can differ from the mapping data (Umm al-Qura) by a
+            day or two.
         """
-        if not self.is_data_loaded():
-            raise RuntimeError("Calendar mapping data is not loaded. Check initialization.")
-        
+        from data._load_data.calendar_table import convert_date
+
         # Normalize and validate calendar name
         calendar = self._normalize_calendar_name(calendar)
         
-        # Get column names for the specified calendar system
-        day_col, month_col, year_col = SUPPORTED_CALENDARS[calendar]
-        
-        # Create filter mask to find matching date
-        mask = (
-            (self.df[day_col] == day) & 
-            (self.df[month_col] == month) & 
-            (self.df[year_col] == year)
-        )
-        
-        # Find matching rows
-        matching_rows = self.df[mask]
-        
-        if matching_rows.empty:
-            logger.debug(f"Date not found for conversion: {calendar} {day}/{month}/{year}")
-            return None
-        
-        # Get the first matching row (should be unique)
-        row = matching_rows.iloc[0]
-        
-        # Log if multiple matches found
-        if len(matching_rows) > 1:
-            logger.warning(f"Multiple matches found for conversion: {calendar} {day}/{month}/{year}")
-        
-        # Build result dictionary with all calendar systems
-        result = {
-            'gregorian': {
-                'day': int(row['Gregorian Day']),
-                'month': int(row['Gregorian Month']),
-                'year': int(row['Gregorian Year'])
-            },
-            'hijri': {
-                'day': int(row['Hijri Day']),
-                'month': int(row['Hijri Month']),
-                'year': int(row['Hijri Year'])
-            },
-            'julian': {
-                'day': int(row['Solar Hijri Day']),
-                'month': int(row['Solar Hijri Month']),
-                'year': int(row['Solar Hijri Year'])
-            },
-            'weekday': row[WEEKDAY_COLUMN]
-        }
-        
+        try:
+            table = self.calendar_table
+        except RuntimeError:
+            if method == 'table':
+                raise
+            # No mapping data: arithmetic is the only backend left
+            table = None
+            method = 'arithmetic' if method == 'auto' else method
+        
+        result = convert_date(calendar, day, month, year, method=method, table=table)
+        if result is None:
+            logger.debug(f"Date not found for conversion: {calendar} {day}/{month}/{year} ({method})")
         return result
     
     def get_dates_by_month_year(self, calendar: str, month: int, year: int) -> List[Dict[str, Any]]:
@@ -589,47 +647,74 @@ class DateMapping:
         # Normalize and validate calendar name
         calendar = self._normalize_calendar_name(calendar)
         
-        # Get column names for the specified calendar system
-        day_col, month_col, year_col = SUPPORTED_CALENDARS[calendar]
-        
-        # Create filter mask to find matching month and year
-        mask = (self.df[month_col] == month) & (self.df[year_col] == year)
-        
-        # Find matching rows
-        matching_rows = self.df[mask]
-        
-        if matching_rows.empty:
+        results = list(self.iter_dates_by_month_year(calendar, month, year))
+        if not results:
             logger.debug(f"No dates found for {calendar} {month}/{year}")
             return []
-        
-        # Build list of results for all matching dates
-        results = []
-        for _, row in matching_rows.iterrows():
-            result = {
-                'gregorian': {
-                    'day': int(row['Gregorian Day']),
-                    'month': int(row['Gregorian Month']),
-                    'year': int(row['Gregorian Year'])
-                },
-                'hijri': {
-                    'day': int(row['Hijri Day']),
-                    'month': int(row['Hijri Month']),
-                    'year': int(row['Hijri Year'])
-                },
-                'julian': {
-                    'day': int(row['Solar Hijri Day']),
-                    'month': int(row['Solar Hijri Month']),
-                    'year': int(row['Solar Hijri Year'])
-                },
-                'weekday': row[WEEKDAY_COLUMN]
-            }
-            results.append(result)
-        
-        # Sort results by day for consistent ordering
-        results.sort(key=lambda x: x[calendar]['day'])
-        
+
         logger.debug(f"Found {len(results)} dates for {calendar} {month}/{year}")
         return results
+
+    @property
+    def calendar_table(self):
+        """
+        Day-ordinal ``CalendarTable`` view of the loaded data, built on first use.
+
+        Raises:
+            RuntimeError: If calendar data is not loaded
+        """
+        if self._calendar_table is None:
+            if not self.is_data_loaded():
+                raise RuntimeError("Calendar mapping data is not loaded. Check initialization.")
+            from data._load_data.calendar_table import CalendarTable
+
+            self._calendar_table = CalendarTable.from_dataframe(self.df)
+        return self._calendar_table
+
+    def get_date_span(self, calendar: str, day: Optional[int] = None, month: Optional[int] = None,
+                      year: Optional[int] = None, century: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Resolve a complete or partial date to a day-ordinal interval ``[start, end)``.
+
+        Month-year, year-only and century dates are resolved in O(1) from
+        precomputed month and year boundaries; no per-day records are built.
+
+        Args:
+            calendar (str): Calendar system ('gregorian', 'hijri', 'julian', or aliases)
+            day (int, optional): Day of the month
+            month (int, optional): Month of the year
+            year (int, optional): Year in the specified calendar system
+            century (int, optional): Century, used when no year is given
+
+        Returns:
+            Optional[Tuple[int, int]]: Ordinals (``date.toordinal()`` numbering),
+            or None if the date is not covered by the mapping data
+
+        Example::
+
+            mapper = DateMapping()
+            start, end = mapper.get_date_span('hijri', year=1445)
+            print(f"1445 AH has {end - start} days")
+        """
+        calendar = self._normalize_calendar_name(calendar)
+        return self.calendar_table.partial_span(calendar, day=day, month=month, year=year, century=century)
+
+    def iter_dates_by_month_year(self, calendar: str, month: int, year: int) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield the dates of a month, in the format of ``get_dates_by_month_year``.
+
+        Args:
+            calendar (str): Calendar system ('gregorian', 'hijri', 'julian', or aliases)
+            month (int): Month of the year (1-12)
+            year (int): Year in the specified calendar system
+
+        Yields:
+            Dict[str, Any]: Same structure as returned by get_date_alternative_calendar()
+        """
+        span = self.get_date_span(calendar, month=month, year=year)
+        if span is None:
+            return
+        yield from self.calendar_table.iter_days(*span)
     
     def validate_date(self, calendar: str, day: int, month: int, year: int) -> bool:
         """
@@ -669,12 +754,8 @@ class DateMapping:
             This method is more efficient than get_weekday_by_date() when you
             only need to check validity without retrieving additional information.
         """
-        if not self.is_data_loaded():
-            return False
-        
         try:
-            result = self.get_weekday_by_date(calendar, day, month, year)
-            return result is not None
+            return self.get_weekday_index(calendar, day, month, year) is not None
         except ValueError:
             # Invalid calendar system
             return False
@@ -723,7 +804,24 @@ class DateMapping:
         Note:
             This method always returns a dictionary, even if data loading failed.
             Check the 'data_loaded' key to determine if the data is available.
+            For data validated at build time the statistics come from the
+            manifest and nothing is recomputed.
         """
+        if self._data_loaded and self._manifest is not None:
+            manifest = self._manifest
+            return {
+                'data_loaded': True,
+                'supported_calendars': self.get_supported_calendars(),
+                'calendar_aliases': CALENDAR_ALIASES.copy(),
+                'file_path': os.path.abspath(os.path.join(os.path.dirname(__file__), self.csv_path)),
+                'total_records': manifest['total_records'],
+                'date_ranges': self.get_data_range(),
+                'weekdays': list(manifest['weekdays']),
+                'csv_columns': list(manifest['csv_columns']),
+                'sample_record': dict(manifest['sample_record']),
+                'data_quality': self._get_data_quality_metrics(),
+            }
+        
         base_info = {
             'data_loaded': self.is_data_loaded(),
             'supported_calendars': self.get_supported_calendars(),
@@ -775,6 +873,9 @@ class DateMapping:
         Returns:
             Dict[str, Any]: Data quality metrics
         """
+        if self._data_loaded and self._manifest is not None:
+            return json.loads(json.dumps(self._manifest['data_quality']))
+        
         if not self.is_data_loaded():
             return {'status': 'no_data'}
         
@@ -858,13 +959,15 @@ class DateMapping:
             These ranges represent the actual data available in the CSV file.
             Dates outside these ranges cannot be converted between calendar systems.
         """
-        if not self.is_data_loaded():
-            return {}
-        
         # Use cached ranges if available
+        if self._date_ranges is None and self._data_loaded and self._manifest is not None:
+            self._date_ranges = {calendar: dict(info) for calendar, info in self._manifest['date_ranges'].items()}
         if self._date_ranges is not None:
             return self._date_ranges.copy()
         
+        if not self.is_data_loaded():
+            return {}
+        
         ranges = {}
         
         for calendar, columns in SUPPORTED_CALENDARS.items():
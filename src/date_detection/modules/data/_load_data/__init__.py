@@ -1,6 +1,20 @@
 
 from .DateMapping import DateMapping
+from .calendar_table import CalendarTable, get_calendar_table, convert_date, install_calendar_table, weekday_of_date
+from .shared_table import SharedCalendarTable, SharedTableHandle, attach_calendar_table, init_worker
+from .calendar_arithmetic import year_starts, weekday_of
 
 __all__ = [
-    "DateMapping"
+    "DateMapping",
+    "CalendarTable",
+    "get_calendar_table",
+    "convert_date",
+    "weekday_of_date",
+    "install_calendar_table",
+    "SharedCalendarTable",
+    "SharedTableHandle",
+    "attach_calendar_table",
+    "init_worker",
+    "year_starts",
+    "weekday_of"
 ]
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Calendar Conversion Benchmark
+=============================
+
+Compare the two backends of ``convert_date`` on every day of the mapping data:
+
+* speed of single-date conversion (table lookup vs calendar arithmetic)
+* speed of vectorised date -> ordinal conversion
+* agreement: how many days the arithmetic result is away from the table
+
+Run from this directory::
+
+    python benchmark_conversion.py [sample_size]
+
+Author: m.lotfi
+"""
+
+import sys
+import time
+from typing import Any, Dict
+
+import numpy as np
+
+if __name__ == "__main__":
+    # Running as a script: make ``data._load_data`` importable
+    import os
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from data._load_data import calendar_arithmetic
+from data._load_data.calendar_table import CALENDAR_COLUMNS, CalendarTable, convert_date, get_calendar_table
+
+
+def _per_call(function, dates) -> float:
+    """Mean seconds per call of ``function(calendar, day, month, year)``."""
+    start = time.perf_counter()
+    for date in dates:
+        function(*date)
+    return (time.perf_counter() - start) / max(len(dates), 1)
+
+
+def benchmark_conversion(table: CalendarTable = None, sample_size: int = 10_000, seed: int = 0) -> Dict[str, Any]:
+    """
+    Benchmark table and arithmetic conversion over the rows of ``table``.
+
+    Args:
+        table (CalendarTable, optional): Mapping data, defaults to the shared table
+        sample_size (int): Dates timed with single-date conversion, per calendar
+        seed (int): Seed of the sample
+
+    Returns:
+        Dict[str, Any]: Per calendar: ``table_us`` and ``arithmetic_us`` (single
+        call), ``table_vector_ns`` and ``arithmetic_vector_ns`` (per date,
+        vectorised), ``agreement`` (share of days converted identically) and
+        ``max_offset_days``
+    """
+    table = table or get_calendar_table()
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(len(table), size=min(sample_size, len(table)), replace=False)
+    ordinals = np.arange(table.min_ordinal, table.max_ordinal + 1)
+    report: Dict[str, Any] = {}
+
+    for calendar, (d, m, y) in CALENDAR_COLUMNS.items():
+        days, months, years = table.fields[:, d], table.fields[:, m], table.fields[:, y]
+        dates = [(calendar, int(days[i]), int(months[i]), int(years[i])) for i in sample]
+
+        table_us = _per_call(lambda *date: convert_date(*date, method='table', table=table), dates)
+        arithmetic_us = _per_call(lambda *date: convert_date(*date, method='arithmetic'), dates)
+
+        start = time.perf_counter()
+        table.to_ordinals(calendar, days, months, years)
+        table_vector = time.perf_counter() - start
+        start = time.perf_counter()
+        arithmetic = calendar_arithmetic.to_ordinals(calendar, days, months, years)
+        arithmetic_vector = time.perf_counter() - start
+
+        # Rows the arithmetic rejects (a 30th day the tabular month lacks) count as disagreements
+        valid = arithmetic >= 0
+        offsets = np.abs(arithmetic[valid] - ordinals[valid])
+        report[calendar] = {
+            'table_us': table_us * 1e6,
+            'arithmetic_us': arithmetic_us * 1e6,
+            'table_vector_ns': table_vector / len(table) * 1e9,
+            'arithmetic_vector_ns': arithmetic_vector / len(table) * 1e9,
+            'agreement': float(np.count_nonzero(offsets == 0)) / len(table),
+            'max_offset_days': int(offsets.max()) if len(offsets) else None,
+        }
+    return report
+
+
+def main():
+    """Print the benchmark report."""
+    sample_size = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print("Calendar Conversion Benchmark")
+    print("=" * 50)
+    table = get_calendar_table()
+    print(f"Mapping data: {len(table):,} days, sample of {sample_size:,} dates per calendar")
+    print()
+    for calendar, row in benchmark_conversion(table, sample_size).items():
+        print(f"{calendar.title()}:")
+        print(f"   single date:  table {row['table_us']:.1f} us, arithmetic {row['arithmetic_us']:.1f} us")
+        print(f"   vectorised:   table {row['table_vector_ns']:.0f} ns/date, "
+              f"arithmetic {row['arithmetic_vector_ns']:.0f} ns/date")
+        print(f"   agreement:    {row['agreement']:.1%} of days, max offset {row['max_offset_days']} days")
+
+
+if __name__ == "__main__":
+    main()
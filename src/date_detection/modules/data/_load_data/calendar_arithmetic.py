@@ -0,0 +1,279 @@
+"""
+Calendar Arithmetic
+===================
+
+Closed-form calendar rules, used where the mapping CSV has no rows.
+
+All functions work on day ordinals (``datetime.date.toordinal()`` numbering,
+like ``CalendarTable``) and accept scalars or NumPy arrays:
+
+* Gregorian   - proleptic Gregorian calendar
+* Hijri       - tabular Islamic calendar (30-year cycle, leap years
+                2, 5, 7, 10, 13, 16, 18, 21, 24, 26, 29), Thursday epoch.
+                The mapping data follows Umm al-Qura and agrees with it
+                within a day or two.
+* Solar Hijri - 33-year arithmetic rule (leap when ``(25 * y + 11) % 33 < 8``).
+                The mapping data numbers the Solar Hijri year from Mehr
+                (month 1 of the CSV is the seventh month of the civil
+                calendar), so the ``'julian'`` year start here is Mehr 1,
+                the civil New Year (Nowruz) is ``persian_new_year``.
+
+Day-level conversion (``to_ordinal`` / ``from_ordinal``) mirrors
+``CalendarTable`` so either can back ``calendar_table.convert_date``; dates
+that do not exist in a calendar (30 Safar, 31 Mehr, ...) are rejected by a
+round trip.
+
+Example::
+
+    year_starts('hijri', 1445)                       # 738720 (19 Jul 2023)
+    year_starts('gregorian', np.arange(1900, 1910))  # vectorised
+    from_ordinal(to_ordinal('hijri', 1, 9, 1200))    # all calendars, 1786 CE
+
+Author: m.lotfi
+"""
+
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+# Ordinal of 1 Muharram 1 AH (Thursday 15 July 622, Julian calendar)
+ISLAMIC_EPOCH = 227014
+
+# Ordinal of 1 Farvardin 1 SH under the 33-year rule (Thursday 18 March 622, Julian calendar)
+PERSIAN_EPOCH = 226895
+
+# Days from Farvardin 1 to Mehr 1 (six months of 31 days)
+MEHR_OFFSET = 186
+
+# Weekday index of an ordinal is ``ordinal % 7``, Sunday = 0 (ordinal 7 is Sunday 7 January 1)
+WEEKDAY_NAMES = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+# Day of year before each Gregorian month, common years
+_GREGORIAN_MONTH_OFFSET_LIST = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
+_GREGORIAN_MONTH_OFFSETS = np.array(_GREGORIAN_MONTH_OFFSET_LIST, dtype=np.int64)
+
+
+def _is_array(value) -> bool:
+    return isinstance(value, np.ndarray) and value.ndim > 0
+
+
+def _as_int64(values):
+    """int64 array for sequences and arrays, Python int for scalars."""
+    if isinstance(values, (np.ndarray, list, tuple)):
+        values = np.asarray(values, dtype=np.int64)
+        return values if values.ndim else int(values)
+    return int(values)
+
+
+def gregorian_year_start(years):
+    """Ordinal of 1 January of proleptic Gregorian ``years``."""
+    y = _as_int64(years) - 1
+    return 365 * y + y // 4 - y // 100 + y // 400 + 1
+
+
+def hijri_year_start(years):
+    """Ordinal of 1 Muharram of tabular Islamic ``years``."""
+    y = _as_int64(years)
+    return ISLAMIC_EPOCH + 354 * (y - 1) + (3 + 11 * y) // 30
+
+
+def persian_new_year(years):
+    """Ordinal of 1 Farvardin (Nowruz) of Solar Hijri ``years``, 33-year rule."""
+    y = _as_int64(years)
+    return PERSIAN_EPOCH + 365 * (y - 1) + (8 * y + 21) // 33
+
+
+def solar_hijri_year_start(years):
+    """Ordinal of the first day of ``years`` as numbered in the mapping data (Mehr 1)."""
+    return persian_new_year(years) + MEHR_OFFSET
+
+
+# ===================================================================================
+# DAY CONVERSIONS
+# ===================================================================================
+# ``*_to_ordinal`` functions do not validate their input; ``to_ordinal`` does.
+# Scalars stay Python ints throughout, arrays are handled with NumPy.
+
+def _select(condition, if_true, if_false):
+    """``np.where`` for arrays, a conditional expression for scalars."""
+    if _is_array(condition):
+        return np.where(condition, if_true, if_false)
+    return if_true if condition else if_false
+
+
+def _year_of(ordinals, year_start, days_per_year: float, epoch: int):
+    """Year containing ``ordinals``: estimate from the mean year length, then correct."""
+    o = _as_int64(ordinals)
+    if _is_array(o):
+        year = np.floor((o - epoch) / days_per_year).astype(np.int64) + 1
+    else:
+        year = int((o - epoch) // days_per_year) + 1
+    year = _select(year_start(year + 1) <= o, year + 1, year)
+    return _select(year_start(year) > o, year - 1, year)
+
+
+def _is_gregorian_leap(years):
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
+def _gregorian_month_offset(month):
+    return _GREGORIAN_MONTH_OFFSETS[month - 1] if _is_array(month) else _GREGORIAN_MONTH_OFFSET_LIST[month - 1]
+
+
+def gregorian_to_ordinal(day, month, year):
+    """Ordinal of a proleptic Gregorian date."""
+    day, month, year = _as_int64(day), _as_int64(month), _as_int64(year)
+    leap_shift = _select((month > 2) & _is_gregorian_leap(year), 1, 0)
+    return gregorian_year_start(year) + _gregorian_month_offset(month) + leap_shift + day - 1
+
+
+def ordinal_to_gregorian(ordinals) -> Tuple[Any, Any, Any]:
+    """(day, month, year) of proleptic Gregorian ``ordinals``."""
+    o = _as_int64(ordinals)
+    year = _year_of(o, gregorian_year_start, 365.2425, 1)
+    prior = o - gregorian_year_start(year)
+    leap = _is_gregorian_leap(year)
+    # Shift days after February of leap years back onto the common-year table
+    shifted = _select(leap & (prior >= 60), prior - 1, prior)
+    if _is_array(o):
+        month = np.searchsorted(_GREGORIAN_MONTH_OFFSETS, shifted, side='right')
+    else:
+        month = bisect_right(_GREGORIAN_MONTH_OFFSET_LIST, shifted)
+    day = prior - _gregorian_month_offset(month) - _select(leap & (month > 2), 1, 0) + 1
+    # 29 February falls on the March offset of the shifted table
+    feb29 = leap & (prior == 59)
+    return _select(feb29, 29, day), _select(feb29, 2, month), year
+
+
+def hijri_to_ordinal(day, month, year):
+    """Ordinal of a tabular Islamic date."""
+    day, month = _as_int64(day), _as_int64(month)
+    return hijri_year_start(year) + 29 * (month - 1) + month // 2 + day - 1
+
+
+def ordinal_to_hijri(ordinals) -> Tuple[Any, Any, Any]:
+    """(day, month, year) of tabular Islamic ``ordinals``."""
+    o = _as_int64(ordinals)
+    year = _year_of(o, hijri_year_start, 10631 / 30, ISLAMIC_EPOCH)
+    prior = o - hijri_year_start(year)
+    month = np.minimum(12, (2 * prior) // 59 + 1) if _is_array(o) else min(12, (2 * prior) // 59 + 1)
+    day = prior - (29 * (month - 1) + month // 2) + 1
+    return day, month, year
+
+
+def _persian_month_offset(month):
+    return _select(month <= 7, 31 * (month - 1), 30 * (month - 1) + 6)
+
+
+def persian_to_ordinal(day, month, year):
+    """Ordinal of a civil Solar Hijri date (month 1 = Farvardin)."""
+    day, month = _as_int64(day), _as_int64(month)
+    return persian_new_year(year) + _persian_month_offset(month) + day - 1
+
+
+def ordinal_to_persian(ordinals) -> Tuple[Any, Any, Any]:
+    """(day, month, year) of civil Solar Hijri ``ordinals`` (month 1 = Farvardin)."""
+    o = _as_int64(ordinals)
+    year = _year_of(o, persian_new_year, 365 + 8 / 33, PERSIAN_EPOCH)
+    prior = o - persian_new_year(year)
+    late = (prior - 6) // 30 + 1
+    late = np.minimum(12, late) if _is_array(o) else min(12, late)
+    month = _select(prior < MEHR_OFFSET, prior // 31 + 1, late)
+    return prior - _persian_month_offset(month) + 1, month, year
+
+
+def solar_hijri_to_ordinal(day, month, year):
+    """Ordinal of a Solar Hijri date numbered like the mapping data (month 1 = Mehr)."""
+    month, year = _as_int64(month), _as_int64(year)
+    civil_month = (month + 5) % 12 + 1
+    return persian_to_ordinal(day, civil_month, _select(month >= 7, year + 1, year))
+
+
+def ordinal_to_solar_hijri(ordinals) -> Tuple[Any, Any, Any]:
+    """(day, month, year) of ``ordinals`` numbered like the mapping data (month 1 = Mehr)."""
+    day, civil_month, civil_year = ordinal_to_persian(ordinals)
+    month = (civil_month + 5) % 12 + 1
+    return day, month, _select(civil_month <= 6, civil_year - 1, civil_year)
+
+
+# Calendar name (as in CalendarTable) -> (date -> ordinal, ordinal -> date)
+DAY_FUNCTIONS: Dict[str, Tuple[Callable, Callable]] = {
+    'gregorian': (gregorian_to_ordinal, ordinal_to_gregorian),
+    'hijri': (hijri_to_ordinal, ordinal_to_hijri),
+    'julian': (solar_hijri_to_ordinal, ordinal_to_solar_hijri),
+}
+
+
+def to_ordinal(calendar: str, day: int, month: int, year: int) -> Optional[int]:
+    """
+    Ordinal of a date, or None when the date does not exist in ``calendar``.
+
+    Args:
+        calendar (str): 'gregorian', 'hijri' or 'julian' (Solar Hijri, mapping data numbering)
+        day (int): Day of month
+        month (int): Month number
+        year (int): Year
+    """
+    if calendar not in DAY_FUNCTIONS:
+        raise ValueError(f"Unsupported calendar system: '{calendar}'")
+    day, month, year = int(day), int(month), int(year)
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return None
+    forward, backward = DAY_FUNCTIONS[calendar]
+    ordinal = forward(day, month, year)
+    return ordinal if backward(ordinal) == (day, month, year) else None
+
+
+def to_ordinals(calendar: str, days, months, years) -> np.ndarray:
+    """Vectorised ``to_ordinal``; dates that do not exist map to -1."""
+    if calendar not in DAY_FUNCTIONS:
+        raise ValueError(f"Unsupported calendar system: '{calendar}'")
+    days, months, years = (np.asarray(value, dtype=np.int64) for value in (days, months, years))
+    valid = (months >= 1) & (months <= 12) & (days >= 1) & (days <= 31)
+    forward, backward = DAY_FUNCTIONS[calendar]
+    ordinals = np.asarray(forward(np.where(valid, days, 1), np.where(valid, months, 1), years))
+    back_day, back_month, back_year = backward(ordinals)
+    valid &= (back_day == days) & (back_month == months) & (back_year == years)
+    return np.where(valid, ordinals, -1)
+
+
+def weekday_of(ordinals):
+    """Weekday index of ``ordinals``, 0 = Sunday ... 6 = Saturday; works on arrays too."""
+    return _as_int64(ordinals) % 7
+
+
+def from_ordinal(ordinal: int) -> Dict[str, Any]:
+    """All calendar representations of ``ordinal``, shaped like ``CalendarTable.from_ordinal``."""
+    ordinal = int(ordinal)
+    result: Dict[str, Any] = {}
+    for calendar, (_, backward) in DAY_FUNCTIONS.items():
+        day, month, year = backward(ordinal)
+        result[calendar] = {'day': day, 'month': month, 'year': year}
+    result['weekday_index'] = ordinal % 7
+    result['weekday'] = WEEKDAY_NAMES[result['weekday_index']]
+    return result
+
+
+# Calendar name (as in CalendarTable) -> year start function
+YEAR_START_FUNCTIONS: Dict[str, Callable] = {
+    'gregorian': gregorian_year_start,
+    'hijri': hijri_year_start,
+    'julian': solar_hijri_year_start,
+}
+
+
+def year_starts(calendar: str, years):
+    """
+    Ordinal of the first day of ``years`` in ``calendar``.
+
+    Args:
+        calendar (str): 'gregorian', 'hijri' or 'julian' (Solar Hijri)
+        years (int or array-like): Years
+
+    Returns:
+        int or np.ndarray: Ordinals
+    """
+    if calendar not in YEAR_START_FUNCTIONS:
+        raise ValueError(f"Unsupported calendar system: '{calendar}'")
+    return YEAR_START_FUNCTIONS[calendar](years)
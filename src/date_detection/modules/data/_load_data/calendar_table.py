@@ -0,0 +1,478 @@
+"""
+Calendar Ordinal Table
+======================
+
+Array form of the calendar mapping CSV, indexed by day ordinal.
+
+Every row of the mapping file is one day; row ``i`` is the day with proleptic
+Gregorian ordinal ``base + i`` (``datetime.date.toordinal()``). Converting a
+date of any calendar to its ordinal is a binary search over a sorted integer
+key (``year * 512 + month * 32 + day``), converting an ordinal back is a
+single array index. Day counts, containment and overlap between dates of
+different calendars then reduce to integer arithmetic on ordinals.
+
+Partial dates (month-year, year, century) resolve to a half-open ordinal
+interval ``[start, end)`` through month and year boundary tables built once
+per calendar; the days themselves are only enumerated on request, lazily.
+
+Example::
+
+    table = get_calendar_table()
+    start = table.to_ordinal('hijri', 1, 9, 1445)      # 1 Ramadan 1445
+    end = table.to_ordinal('gregorian', 10, 4, 2024)
+    end - start                                        # 30
+    table.from_ordinal(start)['gregorian']             # {'day': 11, 'month': 3, 'year': 2024}
+    table.partial_span('hijri', year=1445)             # (738720, 739074), 354 days
+
+Weekdays are not stored: the weekday of a day is ``ordinal % 7`` (0 = Sunday),
+localised only when a name is needed::
+
+    table.weekday('hijri', 15, 9, 1445)                # 1 (Monday)
+    WEEKDAY_NAMES[table.weekday('hijri', 15, 9, 1445)] # 'Monday'
+
+Outside the rows of the mapping file ``convert_date`` falls back to calendar
+arithmetic (``calendar_arithmetic``); every result names the method that
+produced it::
+
+    convert_date('hijri', 1, 9, 1200)['method']        # 'arithmetic'
+    convert_date('hijri', 1, 9, 1445)['method']        # 'table'
+
+Author: m.lotfi
+"""
+
+import os
+import logging
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from . import calendar_arithmetic
+
+logger = logging.getLogger(__name__)
+
+# Calendar name -> (day, month, year) column positions in the loaded array.
+# Array columns follow the CSV: Hijri D/M/Y, Gregorian D/M/Y, Solar Hijri D/M/Y
+# ('Week Day' is not loaded, it is derived from the ordinal).
+CALENDAR_COLUMNS = {
+    'hijri': (0, 1, 2),
+    'gregorian': (3, 4, 5),
+    'julian': (6, 7, 8),
+}
+
+CALENDAR_ALIASES = {
+    'solar_hijri': 'julian',
+    'persian': 'julian',
+    'islamic': 'hijri',
+    'greg': 'gregorian',
+}
+
+WEEKDAY_NAMES = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+# Conversion methods accepted by ``convert_date``
+CONVERSION_METHODS = ('auto', 'table', 'arithmetic')
+
+# Default CSV file path relative to this module
+DEFAULT_CSV_PATH = "../mapping_date/Hijri-Gregorian-Solar_Hijri-V3.csv"
+
+
+def date_key(day, month, year):
+    """Sortable integer key of a (day, month, year) triple; works on arrays too."""
+    return year * 512 + month * 32 + day
+
+
+class CalendarTable:
+    """
+    Day-ordinal view of the calendar mapping data.
+
+    Attributes:
+        fields (np.ndarray): ``(n, 9)`` int32 array, one row per day
+        base (int): Ordinal of row 0
+        keys (Dict[str, np.ndarray]): Per-calendar sorted ``date_key`` arrays
+
+    Args:
+        fields (np.ndarray): Rows of Hijri/Gregorian/Solar Hijri day, month, year
+            for consecutive days
+        base (int, optional): Ordinal of the first row; derived from the first
+            Gregorian date when omitted
+        keys (Dict[str, np.ndarray], optional): Precomputed ``keys`` of a
+            table validated elsewhere (``shared_table``); used as-is
+    """
+
+    def __init__(self, fields: np.ndarray, base: Optional[int] = None,
+                 keys: Optional[Dict[str, np.ndarray]] = None):
+        fields = np.ascontiguousarray(fields, dtype=np.int32)
+        if fields.ndim != 2 or fields.shape[1] != 9 or not len(fields):
+            raise ValueError(f"Expected a non-empty (n, 9) array, got shape {fields.shape}")
+        if base is None:
+            day, month, year = fields[0, 3:6]
+            base = date(int(year), int(month), int(day)).toordinal()
+        self.fields = fields
+        self.base = int(base)
+        self.keys: Dict[str, np.ndarray] = {}
+        self._boundaries: Dict[str, tuple] = {}
+        if keys is not None:
+            self.keys = dict(keys)
+            return
+        for calendar, (d, m, y) in CALENDAR_COLUMNS.items():
+            key = date_key(fields[:, d].astype(np.int64), fields[:, m], fields[:, y])
+            if np.any(np.diff(key) < 0):
+                raise ValueError(f"{calendar} dates are not in chronological order")
+            self.keys[calendar] = key
+        self._check_gregorian_contiguous()
+
+    def _check_gregorian_contiguous(self) -> None:
+        """The last row must be ``len - 1`` days after the first one."""
+        day, month, year = self.fields[-1, 3:6]
+        last = date(int(year), int(month), int(day)).toordinal()
+        if last - self.base != len(self) - 1:
+            raise ValueError("Calendar table rows are not consecutive days")
+
+    # Construction
+    # ===============================================================================
+    @classmethod
+    def from_csv(cls, csv_path: Optional[str] = None) -> 'CalendarTable':
+        """
+        Load the mapping CSV straight into an int32 array (no DataFrame).
+
+        Args:
+            csv_path (str, optional): Path to the CSV; relative paths are resolved
+                against this module like ``DateMapping.csv_path``
+        """
+        file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), csv_path or DEFAULT_CSV_PATH))
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"Calendar data file not found: {file_path}")
+        fields = np.loadtxt(file_path, delimiter=',', skiprows=1, usecols=range(1, 10), dtype=np.int32, ndmin=2)
+        logger.debug(f"Loaded {len(fields):,} calendar rows from {file_path}")
+        return cls(fields)
+
+    @classmethod
+    def from_dataframe(cls, df) -> 'CalendarTable':
+        """Build from a ``DateMapping.df`` DataFrame (sorted by Gregorian date)."""
+        from data._load_data.DateMapping import SUPPORTED_CALENDARS
+
+        columns = [col for calendar in ('hijri', 'gregorian', 'julian') for col in SUPPORTED_CALENDARS[calendar]]
+        return cls(df[columns].to_numpy(dtype=np.int32))
+
+    def to_dataframe(self):
+        """DataFrame in the layout of ``DateMapping.df`` (CSV columns, weekday names)."""
+        import pandas as pd
+        from data._load_data.DateMapping import SUPPORTED_CALENDARS, WEEKDAY_COLUMN
+
+        df = pd.DataFrame({
+            WEEKDAY_COLUMN: np.array(WEEKDAY_NAMES)[np.arange(self.base, self.base + len(self)) % 7]
+        })
+        for calendar, positions in CALENDAR_COLUMNS.items():
+            for column, position in zip(SUPPORTED_CALENDARS[calendar], positions):
+                df[column] = self.fields[:, position].astype(int)
+        return df
+
+    # Size and range
+    # ===============================================================================
+    def __len__(self) -> int:
+        return len(self.fields)
+
+    @property
+    def min_ordinal(self) -> int:
+        return self.base
+
+    @property
+    def max_ordinal(self) -> int:
+        """Ordinal of the last day in the table (inclusive)."""
+        return self.base + len(self) - 1
+
+    def covers(self, ordinal: int) -> bool:
+        return self.base <= ordinal <= self.max_ordinal
+
+    @staticmethod
+    def normalize_calendar(calendar: str) -> str:
+        calendar = calendar.lower().strip()
+        calendar = CALENDAR_ALIASES.get(calendar, calendar)
+        if calendar not in CALENDAR_COLUMNS:
+            raise ValueError(
+                f"Unsupported calendar system: '{calendar}'. "
+                f"Supported systems: {sorted(list(CALENDAR_COLUMNS) + list(CALENDAR_ALIASES))}"
+            )
+        return calendar
+
+    # Conversions
+    # ===============================================================================
+    def to_ordinal(self, calendar: str, day: int, month: int, year: int) -> Optional[int]:
+        """
+        Ordinal of a date, or None when the date is not in the table.
+
+        Args:
+            calendar (str): 'gregorian', 'hijri', 'julian' or an alias
+            day (int): Day of month
+            month (int): Month number
+            year (int): Year
+        """
+        keys = self.keys[self.normalize_calendar(calendar)]
+        key = date_key(int(day), int(month), int(year))
+        idx = int(np.searchsorted(keys, key))
+        if idx < len(keys) and keys[idx] == key:
+            return self.base + idx
+        return None
+
+    def to_ordinals(self, calendar: str, days, months, years) -> np.ndarray:
+        """
+        Vectorised ``to_ordinal``; dates missing from the table map to -1.
+
+        Returns:
+            np.ndarray: int64 ordinals
+        """
+        keys = self.keys[self.normalize_calendar(calendar)]
+        query = date_key(np.asarray(days, dtype=np.int64), np.asarray(months), np.asarray(years))
+        idx = np.searchsorted(keys, query)
+        clipped = np.minimum(idx, len(keys) - 1)
+        found = (idx < len(keys)) & (keys[clipped] == query)
+        return np.where(found, clipped + self.base, -1)
+
+    def fields_at(self, calendar: str, ordinal: int) -> Optional[Tuple[int, int, int]]:
+        """(day, month, year) of ``ordinal`` in ``calendar``, or None outside the table."""
+        if not self.covers(ordinal):
+            return None
+        row = self.fields[ordinal - self.base]
+        d, m, y = CALENDAR_COLUMNS[self.normalize_calendar(calendar)]
+        return int(row[d]), int(row[m]), int(row[y])
+
+    def from_ordinal(self, ordinal: int) -> Optional[Dict[str, Any]]:
+        """
+        All calendar representations of ``ordinal``, shaped like
+        ``DateMapping.get_date_alternative_calendar``.
+        """
+        if not self.covers(ordinal):
+            return None
+        row = self.fields[ordinal - self.base]
+        result: Dict[str, Any] = {
+            calendar: {'day': int(row[d]), 'month': int(row[m]), 'year': int(row[y])}
+            for calendar, (d, m, y) in CALENDAR_COLUMNS.items()
+        }
+        result['weekday_index'] = ordinal % 7
+        result['weekday'] = WEEKDAY_NAMES[result['weekday_index']]
+        return result
+
+    def weekday(self, calendar: str, day: int, month: int, year: int) -> Optional[int]:
+        """Weekday index of a date (0 = Sunday), or None when the date is not in the table."""
+        ordinal = self.to_ordinal(calendar, day, month, year)
+        return None if ordinal is None else ordinal % 7
+
+    def weekdays(self, calendar: str, days, months, years) -> np.ndarray:
+        """Vectorised ``weekday``; dates missing from the table map to -1."""
+        ordinals = self.to_ordinals(calendar, days, months, years)
+        return np.where(ordinals >= 0, ordinals % 7, -1)
+
+    def convert(self, calendar: str, day: int, month: int, year: int) -> Optional[Dict[str, Any]]:
+        """Table-backed equivalent of ``DateMapping.get_date_alternative_calendar``."""
+        ordinal = self.to_ordinal(calendar, day, month, year)
+        return None if ordinal is None else self.from_ordinal(ordinal)
+
+    # Partial dates
+    # ===============================================================================
+    def boundaries(self, calendar: str):
+        """
+        Month and year boundary tables of a calendar, built on first use.
+
+        Returns:
+            tuple: ``({(year, month): (start, end)}, {year: (start, end)}, sorted years)``
+            with half-open ordinal intervals. Months and years cut by either end
+            of the table are clipped to it.
+        """
+        calendar = self.normalize_calendar(calendar)
+        if calendar not in self._boundaries:
+            _, m, y = CALENDAR_COLUMNS[calendar]
+            months = self.fields[:, y].astype(np.int64) * 16 + self.fields[:, m]
+            years = self.fields[:, y]
+            month_bounds = self._runs(months, lambda key: (int(key) // 16, int(key) % 16))
+            year_bounds = self._runs(years, int)
+            self._boundaries[calendar] = (month_bounds, year_bounds, np.array(sorted(year_bounds)))
+        return self._boundaries[calendar]
+
+    def _runs(self, values: np.ndarray, to_key) -> Dict[Any, Tuple[int, int]]:
+        """Ordinal interval of every run of equal consecutive ``values``."""
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(values)) + 1))
+        ends = np.concatenate((starts[1:], [len(values)]))
+        return {
+            to_key(values[start]): (self.base + int(start), self.base + int(end))
+            for start, end in zip(starts, ends)
+        }
+
+    def day_span(self, calendar: str, day: int, month: int, year: int) -> Optional[Tuple[int, int]]:
+        """Interval of one date (more than one day where the data repeats a date)."""
+        keys = self.keys[self.normalize_calendar(calendar)]
+        key = date_key(int(day), int(month), int(year))
+        lo, hi = np.searchsorted(keys, [key, key + 1])
+        return (self.base + int(lo), self.base + int(hi)) if hi > lo else None
+
+    def month_span(self, calendar: str, month: int, year: int) -> Optional[Tuple[int, int]]:
+        """Interval of a month, O(1)."""
+        return self.boundaries(calendar)[0].get((int(year), int(month)))
+
+    def year_span(self, calendar: str, year: int) -> Optional[Tuple[int, int]]:
+        """Interval of a year, O(1)."""
+        return self.boundaries(calendar)[1].get(int(year))
+
+    def century_span(self, calendar: str, century: int) -> Optional[Tuple[int, int]]:
+        """Interval of a century (years ``(c - 1) * 100 + 1`` to ``c * 100``), clipped to the table."""
+        _, year_bounds, years = self.boundaries(calendar)
+        first, last = (int(century) - 1) * 100 + 1, int(century) * 100
+        lo, hi = np.searchsorted(years, [first, last + 1])
+        if hi <= lo:
+            return None
+        return year_bounds[int(years[lo])][0], year_bounds[int(years[hi - 1])][1]
+
+    def partial_span(self, calendar: str, day: Optional[int] = None, month: Optional[int] = None,
+                     year: Optional[int] = None, century: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Interval ``[start, end)`` of a complete or partial date.
+
+        Resolution uses the most precise consistent level: day-month-year,
+        month-year, year, then century. A day without a month does not
+        describe a contiguous interval and yields None.
+        """
+        if year:
+            if month:
+                if day:
+                    return self.day_span(calendar, day, month, year)
+                return self.month_span(calendar, month, year)
+            return None if day else self.year_span(calendar, year)
+        if century and not (day or month):
+            return self.century_span(calendar, century)
+        return None
+
+    def span_to_calendars(self, start: int, end: int) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        First and last day of ``[start, end)`` in every calendar.
+
+        Returns:
+            Optional[dict]: ``{calendar: {'start': {...}, 'end': {...}}, 'days': n}``
+        """
+        if end <= start or not (self.covers(start) and self.covers(end - 1)):
+            return None
+        first, last = self.from_ordinal(start), self.from_ordinal(end - 1)
+        result: Dict[str, Any] = {
+            calendar: {'start': first[calendar], 'end': last[calendar]}
+            for calendar in CALENDAR_COLUMNS
+        }
+        result['days'] = end - start
+        return result
+
+    def iter_days(self, start: int, end: int) -> Iterator[Dict[str, Any]]:
+        """Lazily yield ``from_ordinal`` for each day of ``[start, end)`` inside the table."""
+        for ordinal in range(max(start, self.base), min(end, self.max_ordinal + 1)):
+            yield self.from_ordinal(ordinal)
+
+
+# Table installed for this process (e.g. attached from shared memory), used
+# instead of loading the default CSV
+_installed_table: Optional[CalendarTable] = None
+
+
+def install_calendar_table(table: Optional[CalendarTable]) -> None:
+    """
+    Make ``table`` the process-wide default table returned by
+    ``get_calendar_table()``; None restores loading from the CSV.
+    """
+    global _installed_table
+    _installed_table = table
+
+
+def installed_calendar_table() -> Optional[CalendarTable]:
+    """Table installed with ``install_calendar_table``, if any."""
+    return _installed_table
+
+
+def get_calendar_table(csv_path: Optional[str] = None) -> CalendarTable:
+    """Process-wide ``CalendarTable`` for a CSV file, loaded on first use."""
+    if csv_path is None and _installed_table is not None:
+        return _installed_table
+    return _load_calendar_table(csv_path)
+
+
+@lru_cache(maxsize=None)
+def _load_calendar_table(csv_path: Optional[str] = None) -> CalendarTable:
+    return CalendarTable.from_csv(csv_path)
+
+
+def convert_date(calendar: str, day: int, month: int, year: int, method: str = 'auto',
+                 table: Optional[CalendarTable] = None) -> Optional[Dict[str, Any]]:
+    """
+    Convert a date to every calendar with the mapping table or calendar arithmetic.
+
+    Args:
+        calendar (str): Source calendar ('gregorian', 'hijri', 'julian' or an alias)
+        day (int): Day of month
+        month (int): Month number
+        year (int): Year
+        method (str): 'table' (mapping data only), 'arithmetic' (calendar
+            arithmetic only) or 'auto' (the table inside its range, arithmetic
+            outside it)
+        table (CalendarTable, optional): Mapping data, defaults to the shared
+            table; with 'auto', a missing table means arithmetic everywhere
+
+    Returns:
+        Optional[Dict[str, Any]]: ``from_ordinal`` layout plus ``'method'``
+        ('table' or 'arithmetic'), or None when the date does not exist.
+        With 'auto', a date inside the table range that the table does not
+        contain is rejected rather than converted arithmetically.
+    """
+    if method not in CONVERSION_METHODS:
+        raise ValueError(f"Unsupported conversion method: '{method}'. Supported: {CONVERSION_METHODS}")
+    calendar = CalendarTable.normalize_calendar(calendar)
+
+    if method != 'arithmetic':
+        if table is None:
+            try:
+                table = get_calendar_table()
+            except (FileNotFoundError, ValueError):
+                if method == 'table':
+                    raise
+                logger.warning("Mapping data unavailable, converting with calendar arithmetic")
+        if table is not None:
+            result = table.convert(calendar, day, month, year)
+            if result is not None:
+                result['method'] = 'table'
+                return result
+        if method == 'table':
+            return None
+
+    ordinal = calendar_arithmetic.to_ordinal(calendar, day, month, year)
+    if ordinal is None or (method == 'auto' and table is not None and table.covers(ordinal)):
+        return None
+    result = calendar_arithmetic.from_ordinal(ordinal)
+    result['method'] = 'arithmetic'
+    return result
+
+
+def weekday_of_date(calendar: str, day: int, month: int, year: int, method: str = 'auto',
+                    table: Optional[CalendarTable] = None) -> Optional[int]:
+    """
+    Weekday index of a date (0 = Sunday ... 6 = Saturday) from its day ordinal.
+
+    Same backends and arguments as ``convert_date``, but only the ordinal is
+    resolved: no calendar fields or names are built.
+
+    Returns:
+        Optional[int]: Weekday index, or None when the date does not exist
+    """
+    if method not in CONVERSION_METHODS:
+        raise ValueError(f"Unsupported conversion method: '{method}'. Supported: {CONVERSION_METHODS}")
+    calendar = CalendarTable.normalize_calendar(calendar)
+
+    if method != 'arithmetic':
+        if table is None:
+            try:
+                table = get_calendar_table()
+            except (FileNotFoundError, ValueError):
+                if method == 'table':
+                    raise
+        if table is not None:
+            weekday = table.weekday(calendar, day, month, year)
+            if weekday is not None or method == 'table':
+                return weekday
+
+    ordinal = calendar_arithmetic.to_ordinal(calendar, day, month, year)
+    if ordinal is None or (method == 'auto' and table is not None and table.covers(ordinal)):
+        return None
+    return calendar_arithmetic.weekday_of(ordinal)
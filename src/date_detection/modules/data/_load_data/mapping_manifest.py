@@ -0,0 +1,226 @@
+"""
+Calendar Mapping Manifest
+=========================
+
+Build-time validation and statistics of the calendar mapping CSV.
+
+``build_manifest`` runs every data-quality check once, offline: required
+columns, missing and non-numeric values, day/month ranges, weekday names,
+consecutive Gregorian days in order, weekdays consistent with the day ordinal,
+chronological order and repeated dates of every calendar. It raises if the
+file would need cleaning. The resulting statistics (row count, year ranges,
+weekdays, sample record, quality metrics) and the file's SHA-256 are written
+to a JSON manifest next to the CSV.
+
+At runtime ``DateMapping`` trusts a CSV whose checksum matches its manifest:
+it is read with fixed dtypes and no cleaning, and ``get_calendar_info``,
+``get_data_range`` and the data-quality metrics are served from the manifest.
+
+Rebuild after changing the CSV, from this directory::
+
+    python mapping_manifest.py [csv_path]
+
+Author: m.lotfi
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+from datetime import date
+from typing import Any, Dict, Optional
+
+if __name__ == "__main__":
+    # Running as a script: make ``data._load_data`` importable
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FORMAT_VERSION = 1
+MANIFEST_SUFFIX = ".manifest.json"
+
+WEEKDAY_NAMES = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday')
+
+# ===================================================================================
+# MANIFEST FILES
+# ===================================================================================
+
+def manifest_path_for(csv_file_path: str) -> str:
+    """Manifest path of a CSV: same directory, ``<name>.manifest.json``."""
+    return os.path.splitext(csv_file_path)[0] + MANIFEST_SUFFIX
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(csv_file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Manifest of a CSV, or None when it is missing, unreadable or of another format version.
+
+    The checksum is not verified here; see ``DateMapping._load_trusted_data``.
+    """
+    path = manifest_path_for(csv_file_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+        return None
+    if manifest.get('format_version') != MANIFEST_FORMAT_VERSION:
+        logger.warning(f"Ignoring manifest {path}: format version {manifest.get('format_version')}")
+        return None
+    return manifest
+
+
+# ===================================================================================
+# BUILD STEP
+# ===================================================================================
+
+def build_manifest(csv_file_path: str) -> Dict[str, Any]:
+    """
+    Validate a mapping CSV and compute its statistics.
+
+    Args:
+        csv_file_path (str): Absolute path of the CSV
+
+    Returns:
+        Dict[str, Any]: Manifest
+
+    Raises:
+        ValueError: If the file fails validation and would need cleaning at load time
+    """
+    import numpy as np
+    import pandas as pd
+    from data._load_data.DateMapping import SUPPORTED_CALENDARS, WEEKDAY_COLUMN
+
+    with open(csv_file_path, 'rb') as f:
+        raw = f.read()
+    df = pd.read_csv(io.BytesIO(raw), encoding='utf-8')
+
+    required = [WEEKDAY_COLUMN] + [col for cols in SUPPORTED_CALENDARS.values() for col in cols]
+    missing_columns = set(required) - set(df.columns)
+    if missing_columns:
+        raise ValueError(f"Missing required columns in CSV: {sorted(missing_columns)}")
+
+    missing_values = int(df[required].isna().sum().sum())
+    numeric = df[required[1:]].apply(pd.to_numeric, errors='coerce')
+    invalid_values = int(numeric.isna().sum().sum()) - int(df[required[1:]].isna().sum().sum())
+    if missing_values or invalid_values:
+        raise ValueError(f"{missing_values} missing and {invalid_values} non-numeric values")
+
+    invalid_weekdays = set(df[WEEKDAY_COLUMN].unique()) - set(WEEKDAY_NAMES)
+    if invalid_weekdays:
+        raise ValueError(f"Unexpected weekday values: {sorted(invalid_weekdays)}")
+
+    date_ranges: Dict[str, Dict[str, int]] = {}
+    coverage: Dict[str, Dict[str, Any]] = {}
+    repeated_dates: Dict[str, int] = {}
+    for calendar, (day_col, month_col, year_col) in SUPPORTED_CALENDARS.items():
+        days, months, years = (numeric[col].to_numpy(dtype=np.int64) for col in (day_col, month_col, year_col))
+        if days.min() < 1 or days.max() > 31:
+            raise ValueError(f"Invalid day range for {calendar}: {days.min()}-{days.max()}")
+        if months.min() < 1 or months.max() > 12:
+            raise ValueError(f"Invalid month range for {calendar}: {months.min()}-{months.max()}")
+        keys = years * 512 + months * 32 + days
+        if np.any(np.diff(keys) < 0):
+            raise ValueError(f"{calendar} dates are not in chronological order")
+        repeated_dates[calendar] = int(np.count_nonzero(np.diff(keys) == 0))
+
+        unique_years = len(np.unique(years))
+        year_span = int(years.max() - years.min() + 1)
+        date_ranges[calendar] = {
+            'min_year': int(years.min()),
+            'max_year': int(years.max()),
+            'total_years': unique_years,
+            'year_span': year_span,
+        }
+        coverage[calendar] = {
+            'year_span': year_span,
+            'unique_years': unique_years,
+            'coverage_ratio': unique_years / year_span if year_span > 0 else 0,
+        }
+
+    day_col, month_col, year_col = SUPPORTED_CALENDARS['gregorian']
+    first, last = numeric.iloc[0], numeric.iloc[-1]
+    first_date = date(int(first[year_col]), int(first[month_col]), int(first[day_col]))
+    last_date = date(int(last[year_col]), int(last[month_col]), int(last[day_col]))
+    if last_date.toordinal() - first_date.toordinal() != len(df) - 1:
+        raise ValueError("Gregorian dates are not consecutive days")
+    ordinals = np.arange(first_date.toordinal(), first_date.toordinal() + len(df))
+    expected_weekdays = np.array(WEEKDAY_NAMES)[ordinals % 7]
+    weekday_mismatches = int(np.count_nonzero(df[WEEKDAY_COLUMN].to_numpy() != expected_weekdays))
+    if weekday_mismatches:
+        raise ValueError(f"{weekday_mismatches} weekdays do not match their Gregorian dates")
+
+    sample_row = df.iloc[len(df) // 2]
+    hijri_cols, julian_cols = SUPPORTED_CALENDARS['hijri'], SUPPORTED_CALENDARS['julian']
+    warnings = [f"{calendar}: {count} repeated dates" for calendar, count in repeated_dates.items() if count]
+
+    return {
+        'format_version': MANIFEST_FORMAT_VERSION,
+        'csv_file': os.path.basename(csv_file_path),
+        'sha256': sha256_hex(raw),
+        'size_bytes': len(raw),
+        'total_records': len(df),
+        'csv_columns': list(df.columns),
+        'weekdays': sorted(df[WEEKDAY_COLUMN].unique().tolist()),
+        'gregorian_range': {
+            'first': first_date.isoformat(),
+            'last': last_date.isoformat(),
+            'first_ordinal': first_date.toordinal(),
+        },
+        'date_ranges': date_ranges,
+        'sample_record': {
+            'gregorian': f"{sample_row[day_col]}/{sample_row[month_col]}/{sample_row[year_col]}",
+            'hijri': "{}/{}/{}".format(*(sample_row[col] for col in hijri_cols)),
+            'julian': "{}/{}/{}".format(*(sample_row[col] for col in julian_cols)),
+            'weekday': sample_row[WEEKDAY_COLUMN],
+        },
+        'data_quality': {
+            'status': 'good',
+            'total_records': len(df),
+            'unique_weekdays': len(df[WEEKDAY_COLUMN].unique()),
+            'date_coverage': coverage,
+            'missing_values': missing_values,
+            'invalid_values': invalid_values,
+            'consecutive_days': True,
+            'weekday_mismatches': weekday_mismatches,
+            'repeated_dates': repeated_dates,
+            'warnings': warnings,
+        },
+    }
+
+
+def write_manifest(csv_file_path: str) -> str:
+    """Build the manifest of a CSV and write it next to the file; returns its path."""
+    manifest = build_manifest(csv_file_path)
+    path = manifest_path_for(csv_file_path)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    logger.info(f"Wrote manifest of {manifest['total_records']:,} records to {path}")
+    return path
+
+
+def main():
+    """Validate the mapping CSV and write its manifest."""
+    from data._load_data.DateMapping import DEFAULT_CSV_PATH
+
+    csv_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_CSV_PATH
+    file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), csv_path))
+    path = write_manifest(file_path)
+    manifest = load_manifest(file_path)
+    print(f"Manifest: {path}")
+    print(f"   Records: {manifest['total_records']:,}")
+    print(f"   SHA-256: {manifest['sha256']}")
+    for warning in manifest['data_quality']['warnings']:
+        print(f"   Warning: {warning}")
+
+
+if __name__ == "__main__":
+    main()
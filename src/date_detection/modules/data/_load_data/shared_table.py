@@ -0,0 +1,153 @@
+"""
+Shared Calendar Table
+=====================
+
+One copy of the calendar conversion arrays for a whole worker pool.
+
+The parent process loads the ``CalendarTable`` once and copies its arrays
+(the ``(n, 9)`` int32 field array and the three sorted int64 key arrays) into
+a single ``multiprocessing.shared_memory`` block. Workers attach to the block
+by name and wrap it in a ``CalendarTable`` without copying, then install it as
+the process-wide table, so ``get_calendar_table``, ``convert_date``,
+``get_calendar_variants``, ``TemporalIndex`` and ``DateMapping``'s
+conversions all read the shared arrays. ``DateMapping`` only builds its
+DataFrame in a worker if a DataFrame-based method is called.
+
+The parent owns the block: closing the ``SharedCalendarTable`` (or leaving its
+``with`` block, or interpreter exit) unmaps and unlinks it. Workers only
+unmap their view when they exit.
+
+Example::
+
+    with SharedCalendarTable() as shared:
+        with multiprocessing.Pool(48, **shared.pool_kwargs()) as pool:
+            results = pool.map(detect_and_convert, documents)
+
+Author: m.lotfi
+"""
+
+import atexit
+import logging
+from multiprocessing import shared_memory
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .calendar_table import (
+    CALENDAR_COLUMNS,
+    CalendarTable,
+    get_calendar_table,
+    install_calendar_table,
+)
+
+logger = logging.getLogger(__name__)
+
+FIELD_COLUMNS = 9
+
+
+class SharedTableHandle(NamedTuple):
+    """Picklable description of a shared calendar table, passed to workers."""
+    name: str
+    rows: int
+    base: int
+
+
+def _layout(rows: int) -> Tuple[Dict[str, tuple], int]:
+    """Byte offset, dtype and shape of every array in the block, and the block size."""
+    layout: Dict[str, tuple] = {'fields': (0, np.int32, (rows, FIELD_COLUMNS))}
+    offset = rows * FIELD_COLUMNS * np.dtype(np.int32).itemsize
+    offset += -offset % np.dtype(np.int64).itemsize
+    for calendar in CALENDAR_COLUMNS:
+        layout[calendar] = (offset, np.int64, (rows,))
+        offset += rows * np.dtype(np.int64).itemsize
+    return layout, offset
+
+
+def _views(buffer, rows: int) -> Dict[str, np.ndarray]:
+    """NumPy arrays over ``buffer`` following ``_layout``."""
+    layout, _ = _layout(rows)
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        for name, (offset, dtype, shape) in layout.items()
+    }
+
+
+class SharedCalendarTable:
+    """
+    Owner of a shared-memory copy of a ``CalendarTable``.
+
+    Args:
+        table (CalendarTable, optional): Table to share, defaults to the
+            process-wide table
+    """
+
+    def __init__(self, table: Optional[CalendarTable] = None):
+        table = table or get_calendar_table()
+        rows = len(table)
+        self._memory: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(
+            create=True, size=_layout(rows)[1]
+        )
+        views = _views(self._memory.buf, rows)
+        views['fields'][:] = table.fields
+        for calendar in CALENDAR_COLUMNS:
+            views[calendar][:] = table.keys[calendar]
+        del views  # release the exported buffers so the block can be closed
+        self.handle = SharedTableHandle(self._memory.name, rows, table.base)
+        atexit.register(self.close)
+        logger.debug(f"Shared {rows:,} calendar rows as {self.handle.name} ({self._memory.size:,} bytes)")
+
+    @property
+    def closed(self) -> bool:
+        return self._memory is None
+
+    def pool_kwargs(self) -> Dict[str, Any]:
+        """``initializer``/``initargs`` for ``multiprocessing.Pool`` or ``ProcessPoolExecutor``."""
+        return {'initializer': init_worker, 'initargs': (self.handle,)}
+
+    def close(self) -> None:
+        """Unmap and unlink the block; safe to call more than once."""
+        if self._memory is None:
+            return
+        memory, self._memory = self._memory, None
+        atexit.unregister(self.close)
+        memory.close()
+        try:
+            memory.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> 'SharedCalendarTable':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def attach_calendar_table(handle: SharedTableHandle) -> CalendarTable:
+    """
+    Wrap a shared block in a ``CalendarTable`` without copying.
+
+    The block stays mapped as long as the returned table is alive. Attach from
+    processes started by ``multiprocessing`` (they share the owner's resource
+    tracker); the owner remains responsible for unlinking.
+    """
+    try:
+        memory = shared_memory.SharedMemory(name=handle.name, track=False)
+    except TypeError:  # Python < 3.13
+        memory = shared_memory.SharedMemory(name=handle.name)
+    views = _views(memory.buf, handle.rows)
+    fields = views.pop('fields')
+    for array in (fields, *views.values()):
+        array.flags.writeable = False
+    table = CalendarTable(fields, base=handle.base, keys=views)
+    # Keep the mapping alive for the lifetime of the table
+    table._shared_memory = memory
+    return table
+
+
+def init_worker(handle: SharedTableHandle) -> None:
+    """
+    Pool initializer: attach to the shared table and install it as this
+    process's default table.
+    """
+    install_calendar_table(attach_calendar_table(handle))
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Wed Aug 06 14:05:33 2025
+
+@author: m.lotfi
+
+@description: Bulk export of detections to columnar formats (Arrow/Parquet, NumPy).
+
+'''
+
+# Columnar export
+# ===================================================================================
+# These classes turn DateDetector.match results into columnar batches
+from modules.exporters.columnar_export import (
+    DetectionBatchBuilder,  # Accumulate detections column by column
+    DetectionWriter,  # Stream batches to Parquet or .npy chunks
+    mapping_converter,  # Converted-calendar columns from a DateMapping
+    DETECTION_SCHEMA,  # Column names and kinds
+)
+
+# Exported functions
+# ===================================================================================
+# This section defines the functions that will be available when this module is imported.
+__all__ = [
+    # Columnar export
+    "DetectionBatchBuilder",  # Accumulate detections column by column
+    "DetectionWriter",  # Stream batches to Parquet or .npy chunks
+    "mapping_converter",  # Converted-calendar columns from a DateMapping
+    "DETECTION_SCHEMA",  # Column names and kinds
+]
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Wed Aug 06 14:05:33 2025
+
+@author: m.lotfi
+@description: Columnar export of ``DateDetector.match`` results.
+
+Detections are appended column by column (no per-row dicts) and emitted as
+Arrow record batches when ``pyarrow`` is installed, or as NumPy structured
+arrays otherwise. ``DetectionWriter`` streams the batches to Parquet files, or
+to ``.npy`` chunk files when only NumPy is available.
+
+Example::
+
+    with DetectionWriter("detections.parquet", converter=mapping_converter(DateMapping())) as writer:
+        for doc_id, text in documents:
+            writer.write(doc_id, detector.match(text))
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# ===================================================================================
+# SCHEMA
+# ===================================================================================
+
+COMPONENTS = ("weekday", "day", "month", "year", "century", "era", "calendar")
+CALENDARS = ("hijri", "gregorian", "julian")
+CONVERTED_FIELDS = ("day", "month", "year")
+
+# Column name -> kind ("str" or "int")
+DETECTION_SCHEMA: Dict[str, str] = {
+    "doc_id": "str",
+    "start": "int",
+    "end": "int",
+    "text": "str",
+    "pattern_name": "str",
+    "tier": "str",
+    "match_type": "str",
+    "priority": "int",
+    **{component: "str" for component in COMPONENTS},
+    **{f"{calendar}_{field}": "int" for calendar in CALENDARS for field in CONVERTED_FIELDS},
+}
+
+# Placeholder for missing integers in the NumPy fallback (Arrow uses nulls)
+INT_NULL = -1
+
+# ===================================================================================
+# HELPERS
+# ===================================================================================
+
+def component_value(groups, raw_groups, idx) -> Optional[str]:
+    """
+    Resolve a component of a pattern's ``date`` map against a match record.
+
+    Args:
+        groups (tuple): Normalised group values of the match
+        raw_groups (tuple): Group values as they appear in the original text
+        idx: Group index (int or digit string), list of indices (first
+            non-empty wins) or a literal value such as ``"hijri"``
+
+    Returns:
+        Optional[str]: Surface value of the component
+    """
+    if idx is None:
+        return None
+    if isinstance(idx, list):
+        for single_idx in idx:
+            value = component_value(groups, raw_groups, single_idx)
+            if value:
+                return value
+        return None
+    if isinstance(idx, str) and not idx.isdigit():
+        return idx
+    position = int(idx) - 1
+    if 0 <= position < len(raw_groups):
+        return raw_groups[position] if raw_groups[position] is not None else groups[position]
+    return None
+
+
+def mapping_converter(date_mapping) -> Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Build a converter backed by ``DateMapping.get_date_alternative_calendar``.
+
+    The converter returns None unless the components hold a calendar and a
+    numeric day, month and year.
+    """
+    def convert(components: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        calendar = components.get("calendar")
+        try:
+            day, month, year = (int(components[name]) for name in CONVERTED_FIELDS)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if not calendar:
+            return None
+        try:
+            return date_mapping.get_date_alternative_calendar(calendar, day, month, year)
+        except ValueError:
+            return None
+    return convert
+
+
+# ===================================================================================
+# BATCH BUILDER
+# ===================================================================================
+
+class DetectionBatchBuilder:
+    """
+    Accumulate detections into parallel column lists.
+
+    Args:
+        normalizer (callable, optional): ``components -> components`` applied
+            before the component columns are filled, e.g.
+            ``detector.normalize_component``
+        converter (callable, optional): ``components -> {calendar: {day, month, year}}``,
+            see ``mapping_converter``
+    """
+
+    def __init__(self, normalizer: Optional[Callable] = None, converter: Optional[Callable] = None):
+        self.normalizer = normalizer
+        self.converter = converter
+        self._columns: Dict[str, List[Any]] = {name: [] for name in DETECTION_SCHEMA}
+
+    def __len__(self) -> int:
+        return len(self._columns["doc_id"])
+
+    def add(self, doc_id: Any, detection: List[Dict[str, Any]]) -> int:
+        """
+        Append every match of one document's ``DateDetector.match`` result.
+
+        Returns:
+            int: Number of rows added
+        """
+        columns = self._columns
+        added = 0
+        for item in detection:
+            metadata = item.get("metadata") or {}
+            date_map = item.get("date") or {}
+            for match in item["matches"]:
+                start, end = match["span"]
+                columns["doc_id"].append(str(doc_id))
+                columns["start"].append(start)
+                columns["end"].append(end)
+                columns["text"].append(match["text"])
+                columns["pattern_name"].append(item.get("pattern_name"))
+                columns["tier"].append(item.get("tier"))
+                columns["match_type"].append(metadata.get("match_type"))
+                columns["priority"].append(metadata.get("priority"))
+
+                components = {
+                    name: component_value(match["groups"], match["raw_groups"], date_map.get(name))
+                    for name in COMPONENTS
+                }
+                if self.normalizer is not None and any(components.values()):
+                    components = {**components, **self.normalizer(components)}
+                for name in COMPONENTS:
+                    value = components.get(name)
+                    columns[name].append(None if value is None else str(value))
+
+                converted = self.converter(components) if self.converter is not None else None
+                for calendar in CALENDARS:
+                    values = (converted or {}).get(calendar) or {}
+                    for field in CONVERTED_FIELDS:
+                        columns[f"{calendar}_{field}"].append(values.get(field))
+                added += 1
+        return added
+
+    def clear(self) -> None:
+        for values in self._columns.values():
+            values.clear()
+
+    def to_arrow(self):
+        """Return the accumulated rows as a ``pyarrow.RecordBatch``."""
+        if pa is None:
+            raise ImportError("pyarrow is required for Arrow export; use to_numpy() instead")
+        arrays = [
+            pa.array(values, type=pa.string() if DETECTION_SCHEMA[name] == "str" else pa.int32())
+            for name, values in self._columns.items()
+        ]
+        return pa.RecordBatch.from_arrays(arrays, names=list(self._columns))
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Return the accumulated rows as a NumPy structured array.
+
+        String columns use fixed-width unicode (``''`` for missing values),
+        integer columns are int32 with ``INT_NULL`` for missing values.
+        """
+        dtype = []
+        data = []
+        for name, values in self._columns.items():
+            if DETECTION_SCHEMA[name] == "str":
+                column = np.array(["" if value is None else value for value in values], dtype=str)
+                if column.dtype.itemsize == 0:
+                    column = column.astype("U1")
+            else:
+                column = np.array([INT_NULL if value is None else value for value in values], dtype=np.int32)
+            dtype.append((name, column.dtype))
+            data.append(column)
+        batch = np.empty(len(self), dtype=dtype)
+        for (name, _), column in zip(dtype, data):
+            batch[name] = column
+        return batch
+
+
+# ===================================================================================
+# STREAMING WRITER
+# ===================================================================================
+
+class DetectionWriter:
+    """
+    Stream detections to disk in fixed-size columnar batches.
+
+    Args:
+        path (str): Output file. With ``format="parquet"`` a single Parquet
+            file; with ``format="npy"`` chunk files ``{path}.{n:05d}.npy``.
+        format (str): ``"parquet"``, ``"npy"`` or ``"auto"`` (Parquet when
+            pyarrow is installed)
+        batch_size (int): Rows per record batch / chunk
+        normalizer (callable, optional): See ``DetectionBatchBuilder``
+        converter (callable, optional): See ``DetectionBatchBuilder``
+    """
+
+    def __init__(self, path: str, format: str = "auto", batch_size: int = 65536,
+                 normalizer: Optional[Callable] = None, converter: Optional[Callable] = None):
+        if format == "auto":
+            format = "parquet" if pq is not None else "npy"
+        if format not in ("parquet", "npy"):
+            raise ValueError(f"Unsupported format: {format}. Supported formats: ['parquet', 'npy']")
+        if format == "parquet" and pq is None:
+            raise ImportError("pyarrow is required to write Parquet files")
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.rows_written = 0
+        self._chunks_written = 0
+        self._builder = DetectionBatchBuilder(normalizer=normalizer, converter=converter)
+        self._parquet_writer = None
+
+    def write(self, doc_id: Any, detection: List[Dict[str, Any]]) -> None:
+        """Append one document's detections, flushing full batches."""
+        self._builder.add(doc_id, detection)
+        if len(self._builder) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending rows as one batch."""
+        if not len(self._builder):
+            return
+        if self.format == "parquet":
+            batch = self._builder.to_arrow()
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.path, batch.schema)
+            self._parquet_writer.write_batch(batch)
+        else:
+            np.save(f"{self.path}.{self._chunks_written:05d}.npy", self._builder.to_numpy())
+        self._chunks_written += 1
+        self.rows_written += len(self._builder)
+        self._builder.clear()
+
+    def close(self) -> None:
+        """Flush pending rows and close the output."""
+        self.flush()
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        logger.debug(f"Wrote {self.rows_written} detections to {self.path} ({self.format})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -27,6 +27,7 @@ from modules.keywords.month_keywords import (
 
 from modules.keywords.numeric_words_keywords import (
     numeric_words_keywords,  # All numeric words for normalization
+    numeric_words_values_ar,  # Value of every Arabic numeric word
 )
 
 from modules.keywords.search_in_keywords import search_in_keywords
@@ -57,5 +58,6 @@ __all__ = [
     
     # Numeric word normalization
     "numeric_words_keywords",  # numeric words
+    "numeric_words_values_ar",  # numeric word values
     "search_in_keywords"
 ]
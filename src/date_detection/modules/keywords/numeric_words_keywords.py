@@ -51,6 +51,57 @@ numeric_words_ar = [
     "التاسع عشر", "التاسعة عشرة", "العشرون", "العشرون"
 ]
 
+# ===================================================================================
+# ARABIC NUMERIC WORD VALUES
+# Value of every written number above (plus common case variants); read by
+# ``normalizers.normalize_numeric_words`` to evaluate phrases such as
+# "ألف وأربعمائة وخمسة وأربعين" -> 1445
+# ===================================================================================
+numeric_words_values_ar = {
+    # 0-10
+    "صفر": 0, "واحد": 1, "واحدة": 1, "أحد": 1, "إحدى": 1,
+    "اثنان": 2, "اثنين": 2, "اثنتان": 2, "اثنتين": 2,
+    "ثلاثة": 3, "ثلاث": 3, "أربعة": 4, "أربع": 4, "خمسة": 5, "خمس": 5,
+    "ستة": 6, "ست": 6, "سبعة": 7, "سبع": 7, "ثمانية": 8, "ثمان": 8, "ثماني": 8,
+    "تسعة": 9, "تسع": 9, "عشرة": 10, "عشر": 10,
+
+    # 11-19
+    "أحد عشر": 11, "إحدى عشرة": 11, "اثنا عشر": 12, "اثني عشر": 12,
+    "اثنتا عشرة": 12, "اثنتي عشرة": 12, "ثلاثة عشر": 13, "ثلاث عشرة": 13,
+    "أربعة عشر": 14, "أربع عشرة": 14, "خمسة عشر": 15, "خمس عشرة": 15,
+    "ستة عشر": 16, "ست عشرة": 16, "سبعة عشر": 17, "سبع عشرة": 17,
+    "ثمانية عشر": 18, "ثماني عشرة": 18, "تسعة عشر": 19, "تسع عشرة": 19,
+
+    # Tens (20-90)
+    "عشرون": 20, "عشرين": 20, "ثلاثون": 30, "ثلاثين": 30, "أربعون": 40, "أربعين": 40,
+    "خمسون": 50, "خمسين": 50, "ستون": 60, "ستين": 60, "سبعون": 70, "سبعين": 70,
+    "ثمانون": 80, "ثمانين": 80, "تسعون": 90, "تسعين": 90,
+
+    # Hundreds (100-900)
+    "مائة": 100, "مئة": 100, "مائتان": 200, "مئتان": 200, "مائتين": 200, "مئتين": 200,
+    "ثلاثمائة": 300, "ثلاثمئة": 300, "أربعمائة": 400, "أربعمئة": 400,
+    "خمسمائة": 500, "خمسمئة": 500, "ستمائة": 600, "ستمئة": 600,
+    "سبعمائة": 700, "سبعمئة": 700, "ثمانمائة": 800, "ثمانمئة": 800,
+    "تسعمائة": 900, "تسعمئة": 900,
+
+    # Thousands and higher (dual forms are complete values, plurals multiply)
+    "ألف": 1000, "ألفان": 2000, "ألفين": 2000, "آلاف": 1000, "آلافًا": 1000, "الاف": 1000,
+    "مليون": 10**6, "مليونان": 2 * 10**6, "مليونين": 2 * 10**6, "ملايين": 10**6,
+    "مليار": 10**9, "ملياران": 2 * 10**9, "مليارين": 2 * 10**9, "مليارات": 10**9,
+
+    # Ordinals
+    "الأول": 1, "الأولى": 1, "الحادي": 1, "الحادية": 1, "الثاني": 2, "الثانية": 2,
+    "الثالث": 3, "الثالثة": 3, "الرابع": 4, "الرابعة": 4, "الخامس": 5, "الخامسة": 5,
+    "السادس": 6, "السادسة": 6, "السابع": 7, "السابعة": 7, "الثامن": 8, "الثامنة": 8,
+    "التاسع": 9, "التاسعة": 9, "العاشر": 10, "العاشرة": 10,
+    "الحادي عشر": 11, "الحادية عشرة": 11, "الثاني عشر": 12, "الثانية عشرة": 12,
+    "الثالث عشر": 13, "الثالثة عشرة": 13, "الرابع عشر": 14, "الرابعة عشرة": 14,
+    "الخامس عشر": 15, "الخامسة عشرة": 15, "السادس عشر": 16, "السادسة عشرة": 16,
+    "السابع عشر": 17, "السابعة عشرة": 17, "الثامن عشر": 18, "الثامنة عشرة": 18,
+    "التاسع عشر": 19, "التاسعة عشرة": 19, "العشرون": 20, "العشرين": 20,
+    "الثلاثون": 30, "الثلاثين": 30,
+}
+
 numeric_words_keywords = [   
     {
         "name": "numeric_words_ar",
@@ -28,6 +28,7 @@ from .normalize_month import (
 from .normalize_weekday import (
     normalize_weekday,  # Main weekday normalization function
     get_weekday_info,  
+    weekday_index,  # Weekday index (0 = Sunday) of a weekday name or number
 )
 
 # Numeric word normalization
@@ -35,6 +36,27 @@ from .normalize_weekday import (
 # This module provides functions to normalize numeric words in Arabic.
 from .normalize_numeric_words import (
     numeric_words_pattern_ar,  # Regex pattern for Arabic numeric words
+    parse_numeric_words,  # Value of an Arabic written number
+    numeric_value,  # Digits of a day/year component written in digits or words
+)
+
+# Text pre-normalisation
+# ===================================================================================
+# This module folds digits, tatweel and Arabic separators in one translate pass.
+from .normalize_text import (
+    TextNormalizer,  # Configurable translate-table normaliser
+    NormalizedText,  # Normalised text with offset map back to the original
+    normalize_text,  # Normalise with the default configuration
+    DEFAULT_TEXT_NORMALIZER,  # Shared default normaliser
+)
+
+# Normalisation caching
+# ===================================================================================
+# This module memoises component normalisation with a bounded LRU/TTL cache.
+from .normalize_cache import (
+    LRUCache,  # Thread-safe LRU cache with optional TTL and stats
+    NormalizationCache,  # Cached normalize_date_output / get_calendar_variants_by_lang
+    freeze_component,  # Hashable form of a match component dict
 )
 
 from .normalize_key import normalize_key
@@ -54,7 +76,21 @@ __all__ = [
     # Weekday normalization and keywords
     "normalize_weekday",  # Main weekday normalization function
     "get_weekday_info",  # All weekday keywords
+    "weekday_index",  # Weekday index (0 = Sunday) of a weekday name or number
     
     # Numeric word normalization
     "numeric_words_pattern_ar",  # Regex pattern for Arabic numeric words
+    "parse_numeric_words",  # Value of an Arabic written number
+    "numeric_value",  # Digits of a day/year component written in digits or words
+
+    # Text pre-normalisation
+    "TextNormalizer",  # Configurable translate-table normaliser
+    "NormalizedText",  # Normalised text with offset map back to the original
+    "normalize_text",  # Normalise with the default configuration
+    "DEFAULT_TEXT_NORMALIZER",  # Shared default normaliser
+
+    # Normalisation caching
+    "LRUCache",  # Thread-safe LRU cache with optional TTL and stats
+    "NormalizationCache",  # Cached normalize_date_output / get_calendar_variants_by_lang
+    "freeze_component",  # Hashable form of a match component dict
 ]
\ No newline at end of file
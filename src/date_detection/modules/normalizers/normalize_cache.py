@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sun Aug 03 18:40:05 2025
+
+@author: m.lotfi
+@description: Bounded LRU/TTL caching for the component normalisers.
+
+``normalize_date_output`` and ``get_calendar_variants_by_lang`` re-run era,
+month and weekday normalisation for every match component dict, although the
+same surface strings ("رمضان", "هـ", "الجمعة") repeat throughout a corpus. The
+component dict is turned into a hashable key with ``freeze_component`` and the
+result is kept in a size-bounded LRU cache with an optional time-to-live.
+
+Example::
+
+    cache = NormalizationCache(maxsize=1024, ttl=3600)
+    result = cache.normalize_date_output({"year": "1445", "month": "رمضان", "era": "هـ"})
+    cache.stats()["normalize_date_output"]["hit_rate"]
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+# ===================================================================================
+# CONSTANTS
+# ===================================================================================
+
+DEFAULT_CACHE_SIZE = 4096
+_MISSING = object()
+
+# ===================================================================================
+# HASHABLE COMPONENT FORM
+# ===================================================================================
+
+def freeze_component(component: Any) -> Hashable:
+    """
+    Convert a match component (nested dicts/lists of strings) to a hashable key.
+
+    Args:
+        component: Dictionary of date components, possibly nested
+
+    Returns:
+        Hashable: ``frozenset`` of the items for flat dicts, sorted tuple form otherwise
+
+    Example:
+        >>> freeze_component({"year": "1445", "month": {"name": "رمضان"}})
+        (('month', frozenset({('name', 'رمضان')})), ('year', '1445'))
+    """
+    if isinstance(component, dict):
+        try:
+            # Fast path: flat dict of strings/ints
+            return frozenset(component.items())
+        except TypeError:
+            return tuple(sorted((key, freeze_component(value)) for key, value in component.items()))
+    if isinstance(component, (list, tuple)):
+        return tuple(freeze_component(value) for value in component)
+    return component
+
+
+def _copy_result(value: Any) -> Any:
+    """Copy a cached result so callers can mutate it without touching the cache."""
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    return value
+
+
+# ===================================================================================
+# LRU / TTL CACHE
+# ===================================================================================
+
+@dataclass
+class CacheStats:
+    """Counters of a single cache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU cache with optional time-to-live.
+
+    Args:
+        maxsize (int): Maximum number of entries, ``0`` disables caching
+        ttl (float, optional): Entry lifetime in seconds, ``None`` for no expiry
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = None):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default``, updating stats."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self._stats.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._stats.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry."""
+        if not self.maxsize:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._stats.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._stats = CacheStats()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters, hit rate and current size."""
+        return {**self._stats.to_dict(), "size": len(self._data), "maxsize": self.maxsize}
+
+
+# ===================================================================================
+# NORMALISATION CACHE
+# ===================================================================================
+
+class NormalizationCache:
+    """
+    Memoised front-end for ``normalize_date_output`` and
+    ``get_calendar_variants_by_lang``.
+
+    Each function gets its own LRU cache keyed by ``(lang, freeze_component(...))``.
+    Results are copied on the way out, so callers may mutate them freely.
+    Exceptions are not cached.
+
+    Args:
+        maxsize (int): Maximum entries per function, ``0`` disables caching
+        ttl (float, optional): Entry lifetime in seconds
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE, ttl: Optional[float] = None):
+        self.date_output_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.calendar_variants_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def normalize_date_output(self, match_component: Dict[str, Any], lang: str = "ar") -> Dict[str, Any]:
+        """Cached ``normalize_date_output(match_component, lang)``."""
+        from modules.normalizers.normalize_date_output import normalize_date_output
+
+        key = (lang, freeze_component(match_component))
+        result = self.date_output_cache.get_or_compute(
+            key, lambda: normalize_date_output(match_component, lang=lang)
+        )
+        return _copy_result(result)
+
+    def get_calendar_variants_by_lang(self, match_component: Dict[str, Any], lang: str = "en") -> Dict[str, Any]:
+        """Cached ``get_calendar_variants_by_lang(match_component, lang)``."""
+        # Imported here: calendar_variants itself imports the normalizers package
+        from modules.calendar_variants.get_calendar_variants import get_calendar_variants_by_lang
+
+        key = (lang, freeze_component(match_component))
+        result = self.calendar_variants_cache.get_or_compute(
+            key, lambda: get_calendar_variants_by_lang(match_component, lang=lang)
+        )
+        return _copy_result(result)
+
+    def clear(self) -> None:
+        self.date_output_cache.clear()
+        self.calendar_variants_cache.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the stats of both caches."""
+        return {
+            "normalize_date_output": self.date_output_cache.stats(),
+            "get_calendar_variants_by_lang": self.calendar_variants_cache.stats(),
+        }
+
+
+if __name__ == "__main__":
+    cache = LRUCache(maxsize=2)
+    for surface in ["رمضان", "هـ", "رمضان", "الجمعة", "هـ"]:
+        cache.get_or_compute(surface, lambda: surface[::-1])
+    print(cache.stats())
@@ -22,6 +22,7 @@ if __name__ == "__main__":
 from modules.normalizers.normalize_era import normalize_era
 from modules.normalizers.normalize_month import normalize_month
 from modules.normalizers.normalize_weekday import normalize_weekday
+from modules.normalizers.normalize_numeric_words import numeric_value
 from modules.calendar_variants.get_century_from_year import get_century_from_year
 
 # Import type hints for better code clarity
@@ -141,19 +142,23 @@ def normalize_date_output(match_component: Dict[str, Optional[str]], lang="ar")
     else:
         n_match_component["weekday"] = None
     
-    # Process simple components (day, year) - these don't need special normalization
-    # Just clean them up and pass them through
+    # Process simple components (day, year) - clean them up and pass them through
+    # Written numbers become digits: "ألف وأربعمائة وخمسة وأربعين" → "1445"
     for component in ["day", "year"]:
         value = match_component.get(component)
-        n_match_component[component] = safe_strip(value) if value is not None else None
+        n_match_component[component] = numeric_value(safe_strip(value)) if value is not None else None
+    year = n_match_component["year"]
+    # Years numeric_value could not read stay words: no century or calendar from them
+    year_number = int(str(year).strip()) if year is not None and str(year).strip().isdigit() else None
         
     # Auto-calculate century if we have a year but no explicit century
     # Century calculation is universal across calendar systems
-    if (not match_component.get("century")) and match_component.get("year"):        
-        n_match_component["century"] = get_century_from_year(match_component.get("year"))[0]
+    if (not match_component.get("century")) and year_number:        
+        n_match_component["century"] = get_century_from_year(year_number)[0]
     
-    if (calendar or (calendar == "")) and int(str(match_component.get("year")).strip()):   
-        if int(str(match_component.get("year")).strip()) > 1446 :
+    # Matches without a year (month/day components) keep their calendar
+    if year_number and (calendar or (calendar == "")):
+        if year_number > 1446 :
             calendar = 'gregorian'
     
     # Set final calendar - this gets passed along for downstream processing
@@ -4,7 +4,22 @@ Created on Sun Jun 22 21:38:10 2025
 
 @author: m.lotfi
 
-@description: This module provides calendar conversion utilities and functions to get calendar variants.
+@description: Arabic numeric words: the regex pattern of ``numeric_words_keywords``
+and an evaluator turning written numbers into their value.
+
+``parse_numeric_words`` reads a phrase token by token through a prefix tree of
+the words in ``numeric_words_values_ar`` (multi-word entries such as
+"أحد عشر" or "الحادي عشر" are one path) and composes the values with the
+Arabic number grammar: units, teens, tens and hundreds add up within a group
+("خمسة وأربعين" -> 45), a scale word multiplies the group before it
+("ثلاثة آلاف" -> 3000) and groups add up ("ألف وأربعمائة وخمسة وأربعين"
+-> 1445). Results are memoised, repeated phrases are evaluated once.
+
+Example::
+
+    parse_numeric_words("ألف وأربعمائة وخمسة وأربعين")    # 1445
+    parse_numeric_words("الخامس عشر")                      # 15
+    parse_numeric_words("رمضان")                           # None
 """
 
 if __name__ == "__main__":
@@ -17,7 +32,167 @@ if __name__ == "__main__":
     add_modules_to_sys_path()
 
 # Import necessary modules
-from modules.keywords import numeric_words_keywords
+from modules.keywords import numeric_words_keywords, numeric_words_values_ar
 from modules.regex_patterns import get_numeric_words_pattern
+from modules.normalizers.normalize_text import TextNormalizer
+
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+numeric_words_pattern_ar = get_numeric_words_pattern(numeric_words_keywords)
+
+# ===================================================================================
+# CONSTANTS
+# ===================================================================================
+# The text normaliser, folding teh marbuta and yeh forms too: inside a written
+# number they are spelling variants ("اثنتا عشرة", "احدى عشر")
+_FOLDER = TextNormalizer(fold_ta_marbuta=True, fold_yeh=True)
+
+# Conjunction written attached to the next number ("وأربعين")
+_CONJUNCTION = "و"
+
+# Scale words multiply the group before them
+_SCALES = (10**9, 10**6, 1000)
+
+_TOKEN_SPLIT = re.compile(r"[\s،,.\-]+")
+
+
+def _fold(word: str) -> str:
+    """Orthographic key of a word: the same for every spelling variant."""
+    return _FOLDER.translate(word)
+
+
+def _word_class(value: int) -> str:
+    """Grammar class of a number word value."""
+    if value < 11:
+        return "unit"
+    if value < 20:
+        return "teen"
+    if value < 100:
+        return "ten"
+    if value < 1000:
+        return "hundred"
+    return "scale"
+
+
+# ===================================================================================
+# TOKEN TRIE
+# ===================================================================================
+class _TokenTrie:
+    """Prefix tree over the folded tokens of the numeric words; a node's ``value`` ends a word."""
+    __slots__ = ("children", "value")
+
+    def __init__(self):
+        self.children: Dict[str, "_TokenTrie"] = {}
+        self.value: Optional[int] = None
+
+
+def _build_token_trie(values: Dict[str, int]) -> _TokenTrie:
+    root = _TokenTrie()
+    for word, value in values.items():
+        node = root
+        for token in _fold(word).split():
+            node = node.children.setdefault(token, _TokenTrie())
+        node.value = value
+    return root
+
+
+_NUMERIC_WORDS_TRIE_AR = _build_token_trie(numeric_words_values_ar)
+
+
+def _longest_word(tokens: Tuple[str, ...], start: int) -> Tuple[Optional[int], int]:
+    """(value, end) of the longest numeric word starting at ``tokens[start]``; (None, start) without one."""
+    node, value, end = _NUMERIC_WORDS_TRIE_AR, None, start
+    for i in range(start, len(tokens)):
+        node = node.children.get(tokens[i])
+        if node is None:
+            break
+        if node.value is not None:
+            value, end = node.value, i + 1
+    return value, end
+
+
+def _tokenize(phrase: str) -> Tuple[str, ...]:
+    """
+    Folded tokens of ``phrase`` with conjunctions split off: a standalone "و"
+    is dropped and a token starting with "و" loses it when the token itself
+    is not a number word ("واحد" stays, "وأربعين" becomes "اربعين").
+    """
+    tokens = []
+    for token in _TOKEN_SPLIT.split(_fold(phrase)):
+        if not token or token == _CONJUNCTION:
+            continue
+        if (token.startswith(_CONJUNCTION) and token not in _NUMERIC_WORDS_TRIE_AR.children
+                and token[1:] in _NUMERIC_WORDS_TRIE_AR.children):
+            token = token[1:]
+        tokens.append(token)
+    return tuple(tokens)
+
+
+# ===================================================================================
+# EVALUATION
+# ===================================================================================
+@lru_cache(maxsize=4096)
+def parse_numeric_words(phrase: str) -> Optional[int]:
+    """
+    Value of an Arabic written number.
+
+    Args:
+        phrase (str): Cardinal or ordinal number in words, e.g.
+            "ألف وأربعمائة وخمسة وأربعين" or "الخامس والعشرون"
+
+    Returns:
+        int or None: The value, or None when ``phrase`` contains a word that is
+        not a number word or the words do not compose (e.g. "خمسة ستة")
+    """
+    if not isinstance(phrase, str):
+        return None
+    tokens = _tokenize(phrase)
+    if not tokens:
+        return None
+
+    total, group, classes = 0, 0, set()
+    last_scale = None
+    position = 0
+    while position < len(tokens):
+        value, position_end = _longest_word(tokens, position)
+        if value is None:
+            return None
+        position = position_end
+        word_class = _word_class(value)
+
+        if word_class == "scale":
+            scale = next((s for s in _SCALES if value % s == 0), None)
+            if last_scale is not None and scale >= last_scale:
+                return None
+            if value == scale:
+                total += (group or 1) * scale
+            elif group:
+                return None  # a dual ("ألفان") is complete on its own
+            else:
+                total += value
+            group, classes, last_scale = 0, set(), scale
+        elif value == 100 and classes == {"unit"} and group < 10:
+            # Hundreds written apart: "ثلاث مائة"
+            group *= 100
+            classes = {"hundred"}
+        else:
+            if word_class in classes or (word_class == "teen" and classes & {"unit", "ten"}) \
+                    or (word_class in ("unit", "ten") and "teen" in classes):
+                return None
+            group += value
+            classes.add(word_class)
+
+    return total + group
+
 
-numeric_words_pattern_ar = get_numeric_words_pattern(numeric_words_keywords) 
\ No newline at end of file
+def numeric_value(value: Optional[str]) -> Optional[str]:
+    """
+    Digits of a day or year component: digit strings are returned unchanged,
+    written numbers as their value, anything else unchanged.
+    """
+    if not isinstance(value, str) or not value or value.isdigit():
+        return value
+    parsed = parse_numeric_words(value)
+    return value if parsed is None else str(parsed)
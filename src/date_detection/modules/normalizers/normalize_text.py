@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sat Aug 02 10:12:44 2025
+
+@author: m.lotfi
+@description: Fast text pre-normalisation applied before pattern matching.
+
+All foldings are expressed as a single ``str.translate`` table, so the whole
+document is normalised in one C-level pass. Mappings are either one character
+to one character (digits, punctuation, hamza forms) or deletions
+(tatweel, diacritics); the positions of deleted runs are recorded so that any
+span found in the normalised text can be mapped back to the original text.
+
+The keyword lists are folded with the same normaliser before the regex
+alternations are generated (see ``TextNormalizer.fold_keyword_configs``), so
+orthographic variants such as ``أكتوبر`` / ``اكتوبر`` or ``هـ`` / ``هــ`` /
+``هـــ`` collapse into a single alternative.
+
+Example::
+
+    >>> normalized = normalize_text("١٥ رمضان ١٤٤٥ هـ")
+    >>> normalized.text
+    '15 رمضان 1445 ه'
+    >>> normalized.span_to_original(9, 13)
+    (9, 13)
+    >>> normalize_text("جمادى الأولى").text
+    'جمادى الاولى'
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# ===================================================================================
+# CONSTANTS
+# ===================================================================================
+
+ASCII_DIGITS = "0123456789"
+ARABIC_INDIC_DIGITS = "٠١٢٣٤٥٦٧٨٩"      # U+0660 .. U+0669
+PERSIAN_DIGITS = "۰۱۲۳۴۵۶۷۸۹"           # U+06F0 .. U+06F9 (Extended Arabic-Indic)
+
+TATWEEL = "ـ"                       # ـ  Arabic kashida / elongation
+
+# Orthographic variants folded to a single letter
+HAMZA_ALEF_FORMS = "أإآٱ"                # أ إ آ ٱ -> ا
+ALEF = "ا"
+TA_MARBUTA = "ة"                     # ة -> ه
+HEH = "ه"
+YEH_FORMS = "ىی"                     # ى (alef maqsura), ی (Persian yeh) -> ي
+YEH = "ي"
+KAF_FORMS = "ک"                           # ک (Persian kaf) -> ك
+KAF = "ك"
+ZWNJ = "‌"                           # zero-width non-joiner (سه‌شنبه) -> space
+
+# Harakat, shadda, sukun and superscript alef
+ARABIC_DIACRITICS = "".join(chr(code) for code in range(0x064B, 0x0653)) + "ٰ"
+
+# Arabic punctuation variants of the separators listed in ``punctuation_separators``
+ARABIC_SEPARATORS: Dict[str, str] = {
+    "،": ",",  # ،  Arabic comma
+    "؛": ";",  # ؛  Arabic semicolon
+    "٫": ".",  # ٫  Arabic decimal separator
+    "٬": ",",  # ٬  Arabic thousands separator
+    "۔": ".",  # ۔  Arabic full stop
+    "⁄": "/",  # ⁄  fraction slash
+    "∕": "/",  # ∕  division slash
+    "‐": "-",  # ‐  hyphen
+    "‑": "-",  # ‑  non-breaking hyphen
+    "−": "-",  # −  minus sign
+}
+
+# ===================================================================================
+# NORMALISED TEXT WITH OFFSET MAP
+# ===================================================================================
+
+@dataclass
+class NormalizedText:
+    """
+    Result of a normalisation pass.
+
+    Attributes:
+        text (str): Normalised text, the one patterns are matched against.
+        original (str): Text as given by the caller.
+        _breaks (List[int]): Normalised positions where a deleted run started.
+        _shifts (List[int]): Cumulative number of deleted characters at each break.
+    """
+    text: str
+    original: str
+    _breaks: List[int] = field(default_factory=list, repr=False)
+    _shifts: List[int] = field(default_factory=list, repr=False)
+
+    @property
+    def is_identity(self) -> bool:
+        """True when no character was deleted, i.e. offsets are unchanged."""
+        return not self._breaks
+
+    def to_original(self, pos: int) -> int:
+        """
+        Map a position in the normalised text to the original text.
+
+        Args:
+            pos (int): Offset in ``self.text``
+
+        Returns:
+            int: Offset of the same character in ``self.original``
+        """
+        if not self._breaks:
+            return pos
+        idx = bisect_right(self._breaks, pos) - 1
+        return pos if idx < 0 else pos + self._shifts[idx]
+
+    def span_to_original(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Map a ``[start, end)`` span of the normalised text to the original text.
+
+        Deleted characters that directly follow the span (e.g. a tatweel after
+        ``ه``) are included in the original span.
+        """
+        return self.to_original(start), self.to_original(end)
+
+    def original_slice(self, start: int, end: int) -> str:
+        """Return the original text covered by a normalised ``[start, end)`` span."""
+        o_start, o_end = self.span_to_original(start, end)
+        return self.original[o_start:o_end]
+
+
+# ===================================================================================
+# TRANSLATE-TABLE NORMALISER
+# ===================================================================================
+
+@dataclass
+class TextNormalizer:
+    """
+    Configurable ``str.translate`` based normaliser.
+
+    Args:
+        fold_digits (bool): Map Arabic-Indic digits (٠-٩) to ASCII.
+        fold_persian_digits (bool): Map Extended Arabic-Indic digits (۰-۹) to ASCII.
+        strip_tatweel (bool): Delete tatweel (ـ).
+        fold_punctuation (bool): Map Arabic punctuation variants of separators to ASCII.
+        fold_hamza (bool): Map hamza-bearing alef forms (أ إ آ ٱ) to bare alef.
+        fold_ta_marbuta (bool): Map ta marbuta (ة) to heh (ه). Off by default:
+            every word ending in ة would then end in the bare Hijri era
+            keyword ``ه``.
+        fold_yeh (bool): Map alef maqsura (ى) and Persian yeh (ی) to yeh (ي),
+            and Persian kaf (ک) to kaf (ك). Off by default: short Persian
+            month names (``دی``) would then match inside Arabic words
+            (``المدينة``).
+        strip_diacritics (bool): Delete harakat, shadda and sukun.
+        zwnj_to_space (bool): Map the zero-width non-joiner to a space.
+    """
+    fold_digits: bool = True
+    fold_persian_digits: bool = True
+    strip_tatweel: bool = True
+    fold_punctuation: bool = True
+    fold_hamza: bool = True
+    fold_ta_marbuta: bool = False
+    fold_yeh: bool = False
+    strip_diacritics: bool = True
+    zwnj_to_space: bool = True
+
+    def __post_init__(self):
+        self._table: Dict[int, Optional[str]] = self._build_table()
+        deleted = [chr(code) for code, value in self._table.items() if value is None]
+        self._deleted_re = (
+            re.compile("[" + re.escape("".join(deleted)) + "]+") if deleted else None
+        )
+
+    def _build_table(self) -> Dict[int, Optional[str]]:
+        """Build the translate table; every value is a single character or None."""
+        mapping: Dict[str, Optional[str]] = {}
+        if self.fold_digits:
+            mapping.update(zip(ARABIC_INDIC_DIGITS, ASCII_DIGITS))
+        if self.fold_persian_digits:
+            mapping.update(zip(PERSIAN_DIGITS, ASCII_DIGITS))
+        if self.strip_tatweel:
+            mapping[TATWEEL] = None
+        if self.fold_punctuation:
+            mapping.update(ARABIC_SEPARATORS)
+        if self.fold_hamza:
+            mapping.update(dict.fromkeys(HAMZA_ALEF_FORMS, ALEF))
+        if self.fold_ta_marbuta:
+            mapping[TA_MARBUTA] = HEH
+        if self.fold_yeh:
+            mapping.update(dict.fromkeys(YEH_FORMS, YEH))
+            mapping.update(dict.fromkeys(KAF_FORMS, KAF))
+        if self.strip_diacritics:
+            mapping.update(dict.fromkeys(ARABIC_DIACRITICS))
+        if self.zwnj_to_space:
+            mapping[ZWNJ] = " "
+        return {ord(char): value for char, value in mapping.items()}
+
+    @property
+    def ascii_digits(self) -> bool:
+        """True when every digit reaching the patterns is ASCII, so ``[0-9]`` suffices."""
+        return self.fold_digits and self.fold_persian_digits
+
+    def translate(self, text: str) -> str:
+        """Normalise ``text`` without building an offset map."""
+        return text.translate(self._table)
+
+    def fold_keywords(self, keywords: List[str]) -> List[str]:
+        """
+        Fold keywords the same way as the text and drop the resulting duplicates.
+
+        Args:
+            keywords (List[str]): Keyword surface forms
+
+        Returns:
+            List[str]: Folded keywords, first occurrence order preserved
+        """
+        return list(dict.fromkeys(keyword.translate(self._table) for keyword in keywords))
+
+    def fold_keyword_configs(self, configs: List[dict]) -> List[dict]:
+        """
+        Return copies of keyword configurations with folded ``keywords`` lists.
+
+        Args:
+            configs (List[dict]): Keyword configurations (``months_keywords``,
+                ``era_keywords``, ...)
+
+        Returns:
+            List[dict]: Shallow copies with folded and deduplicated keywords
+        """
+        return [
+            {**config, "keywords": self.fold_keywords(config["keywords"])}
+            for config in configs
+        ]
+
+    def normalize(self, text: str) -> NormalizedText:
+        """
+        Normalise ``text`` and record where characters were deleted.
+
+        Args:
+            text (str): Original text
+
+        Returns:
+            NormalizedText: Normalised text with its offset map
+        """
+        normalized = text.translate(self._table)
+        if len(normalized) == len(text) or self._deleted_re is None:
+            return NormalizedText(text=normalized, original=text)
+
+        breaks: List[int] = []
+        shifts: List[int] = []
+        shift = 0
+        for run in self._deleted_re.finditer(text):
+            breaks.append(run.start() - shift)
+            shift += run.end() - run.start()
+            shifts.append(shift)
+        return NormalizedText(text=normalized, original=text, _breaks=breaks, _shifts=shifts)
+
+
+# Default normaliser shared by detectors
+DEFAULT_TEXT_NORMALIZER = TextNormalizer()
+
+
+def normalize_text(text: str, normalizer: Optional[TextNormalizer] = None) -> NormalizedText:
+    """
+    Normalise digits, tatweel and separators of ``text`` in one pass.
+
+    Args:
+        text (str): Original text
+        normalizer (TextNormalizer, optional): Custom configuration, defaults to
+            ``DEFAULT_TEXT_NORMALIZER``
+
+    Returns:
+        NormalizedText: Normalised text with its offset map
+    """
+    return (normalizer or DEFAULT_TEXT_NORMALIZER).normalize(text)
+
+
+if __name__ == "__main__":
+    samples = [
+        "المناسبة كانت في ٢٠٢١/٠٨/١٥.",
+        "١٥ رمضان ١٤٤٥ هـــ",
+        "الإثنين ٣ ربيع الآخرة ١٤٤٥ هجرية",
+        "۱۴۰۲/۰۱/۰۱ ه‍.ش",
+        "٥ يوليو ٢٠٢٠، الموافق ١٤ ذو القعدة ١٤٤١ هـ",
+    ]
+    for sample in samples:
+        result = normalize_text(sample)
+        print(f"{sample!r} -> {result.text!r}")
+        print("  last char maps to", result.to_original(len(result.text) - 1))
@@ -22,9 +22,9 @@ from modules.keywords import weekdays_keywords  # Import weekday keywords
 from modules.keywords import (
     weekdays_variations_list,  # Variations of weekday names
     weekdays_standard_keywords,  # Normalized weekday names
-    search_in_keywords
 )
 
+from functools import lru_cache
 from typing import Union, Tuple, Dict, Optional
 import logging
 from enum import Enum
@@ -98,6 +98,42 @@ def normalize_key(input_key: str) -> Tuple[Optional[str], Optional[str]]:
 
 
 
+@lru_cache(maxsize=None)
+def _weekday_lookup() -> Dict[str, Tuple[str, int]]:
+    """
+    Lower-cased weekday variation -> (keyword list, 0-based index), built once.
+
+    The first list containing a spelling wins, as with ``search_in_keywords``.
+    """
+    lookup: Dict[str, Tuple[str, int]] = {}
+    for key, values in weekdays_variations_list.items():
+        for idx, value in enumerate(values):
+            lookup.setdefault(value.lower().strip(), (key, idx))
+    return lookup
+
+
+def weekday_index(weekday: Union[str, int]) -> Optional[int]:
+    """
+    Weekday index of a weekday name or number, 0 = Sunday ... 6 = Saturday.
+
+    Same numbering as ``ordinal % 7`` of a day ordinal, so a detected weekday
+    can be checked against a date without any name conversion.
+
+    Args:
+        weekday (Union[str, int]): Weekday name in any supported language or
+            weekday number (1-7, Sunday = 1)
+
+    Returns:
+        Optional[int]: Weekday index, or None if not recognised
+    """
+    if isinstance(weekday, int):
+        return weekday - 1 if 1 <= weekday <= WEEKDAY_COUNT else None
+    if not isinstance(weekday, str):
+        return None
+    found = _weekday_lookup().get(weekday.lower().strip())
+    return None if found is None else found[1]
+
+
 def get_weekday_info(weekday: Union[str, int]) -> Tuple[Optional[str], Optional[int]]:
     """
     Extract language and weekday index from weekday name input.
@@ -142,7 +178,7 @@ def get_weekday_info(weekday: Union[str, int]) -> Tuple[Optional[str], Optional[
     search_weekday = str(weekday).lower().strip()
 
     # Search for weekday in keywords
-    matching_key, detected_idx = search_in_keywords(search_weekday, weekdays_variations_list)
+    matching_key, detected_idx = _weekday_lookup().get(search_weekday, (None, None))
     
     if matching_key is None:
         logger.warning(f"weekday '{weekday}' not found in any keyword list")
@@ -56,6 +56,53 @@ from modules.patterns.date_detector import (
     DateDetector
 )
 
+# Language packs shared by all detectors of a process
+from modules.patterns.language_packs import (
+    LanguagePack,
+    get_language_pack,
+    packs_memory_report,
+)
+
+# Single-pass script segmentation ahead of pattern matching
+from modules.patterns.script_router import (
+    ScriptSegment,
+    segment_by_script,
+)
+
+# Text not yet claimed by a higher tier
+from modules.patterns.text_gaps import (
+    TextGaps,
+)
+
+# Patterns indexed by the literals they require
+from modules.patterns.literal_index import (
+    LiteralIndex,
+    required_literals,
+)
+
+# Windows around digits and number words for number-anchored patterns
+from modules.patterns.candidate_windows import (
+    CandidateWindows,
+    NumberAnchors,
+    number_anchored,
+)
+
+from modules.patterns.multi_language_detector import (
+    MultiLanguageDateDetector
+)
+
+from modules.patterns.result_cache import (
+    ResultCache,
+    MemoryResultCache,
+    SQLiteResultCache,
+    SharedResultCache,
+    make_result_key,
+)
+
+from modules.patterns.temporal_index import (
+    TemporalIndex
+)
+
 from modules.patterns.patterns_date_classes import (
     ParsedDate,
     DateAlternative,
@@ -89,6 +136,24 @@ __all__ = [
     'get_date_mixed_patterns',
     'get_date_components_patterns',
     "DateDetector",
+    'LanguagePack',
+    'get_language_pack',
+    'packs_memory_report',
+    'ScriptSegment',
+    'segment_by_script',
+    'TextGaps',
+    'LiteralIndex',
+    'required_literals',
+    'CandidateWindows',
+    'NumberAnchors',
+    'number_anchored',
+    'MultiLanguageDateDetector',
+    'ResultCache',
+    'MemoryResultCache',
+    'SQLiteResultCache',
+    'SharedResultCache',
+    'make_result_key',
+    'TemporalIndex',
     'ParsedDate',
     'DateAlternative',
     'DateRange',
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Thu Aug 07 11:20:08 2025
+
+@author: m.lotfi
+@description: Candidate windows: scan number-anchored patterns only around digits and number words.
+
+Almost every pipeline pattern needs a number: a digit run (``\\d{1,4}``, in
+ASCII, Arabic-Indic or Persian digits) or a written number ("الخامس عشر").
+``number_anchored`` reads a compiled pattern's parse tree and tells whether
+every match of it contains one; ``NumberAnchors`` records this, with the
+pattern's widest match, for the patterns of a pack.
+
+For a document ``CandidateWindows`` finds the digit clusters and number-word
+hits once, widens each by a radius and merges the overlapping windows. A
+number-anchored pattern then runs only inside the windows of its radius (its
+widest match, so every match it can make around a number is inside them), so
+matching costs grow with the number of dates in a document instead of its
+length. Patterns without a number (weekday or month names alone) or without
+a widest match (unbounded repeats) still scan everything.
+
+Almost every pipeline pattern allows unbounded whitespace (``\\s*``) or
+repeats (``+``) between its parts, so it has no widest match: in the Arabic
+pack 1 of the 116 number-anchored patterns does (``NumberAnchors.report``).
+Without a window size the results are exact but hardly any pattern is
+windowed. A detector window size caps the radius of every number-anchored
+pattern: matching then follows the dates of the text, but a match spanning
+more than that many characters on either side of its numbers is missed.
+
+Example::
+
+    anchors = NumberAnchors(date_patterns.words, pack.compiled_patterns())
+    windows = anchors.windows(text)
+    windows.regions(64)        # [(start, end), ...] around every number
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+Span = Tuple[int, int]
+
+_DIGIT = re.compile(r"\d")
+_DIGITS = re.compile(r"\d+")
+_REPEATS = tuple(
+    op for op in (
+        _sre_parse.MAX_REPEAT,
+        _sre_parse.MIN_REPEAT,
+        getattr(_sre_parse, "POSSESSIVE_REPEAT", None),
+    ) if op is not None
+)
+_ATOMIC_GROUP = getattr(_sre_parse, "ATOMIC_GROUP", None)
+# Flags the re parser understands (the regex module adds its own)
+_PARSER_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE | re.UNICODE | re.ASCII
+# Widest match the parser reports for unbounded repeats
+_UNBOUNDED = _sre_parse.MAXREPEAT
+
+
+# ===================================================================================
+# PATTERN ANALYSIS
+# ===================================================================================
+def _digit_class(items) -> bool:
+    """``[...]`` class matching digits only."""
+    if not items:
+        return False
+    for op, av in items:
+        if op == _sre_parse.LITERAL:
+            if not _DIGIT.fullmatch(chr(av)):
+                return False
+        elif op == _sre_parse.RANGE:
+            low, high = av
+            if high - low > 64 or not all(_DIGIT.fullmatch(chr(code)) for code in range(low, high + 1)):
+                return False
+        elif not (op == _sre_parse.CATEGORY and av == _sre_parse.CATEGORY_DIGIT):
+            return False
+    return True
+
+
+def _literal_text(items) -> Optional[str]:
+    """Text of a keyword alternative (characters and ``\\s*``), ``None`` otherwise."""
+    chars: List[str] = []
+    for op, av in items:
+        if op == _sre_parse.LITERAL:
+            chars.append(chr(av))
+        elif (
+            op in _REPEATS and av[0] == 0
+            and list(av[2]) == [(_sre_parse.IN, [(_sre_parse.CATEGORY, _sre_parse.CATEGORY_SPACE)])]
+        ):
+            chars.append(" ")
+        else:
+            return None
+    return "".join(chars)
+
+
+def _needs_number(items, words: Optional[re.Pattern]) -> bool:
+    """Whether every match of a parsed sequence contains a digit or a number word."""
+    for op, av in items:
+        if op == _sre_parse.LITERAL:
+            if _DIGIT.fullmatch(chr(av)):
+                return True
+        elif op == _sre_parse.IN:
+            if _digit_class(av):
+                return True
+        elif op in _REPEATS:
+            if av[0] >= 1 and _needs_number(av[2], words):
+                return True
+        elif op == _sre_parse.SUBPATTERN:
+            if _needs_number(av[3], words):
+                return True
+        elif op == _ATOMIC_GROUP:
+            if _needs_number(av, words):
+                return True
+        elif op == _sre_parse.BRANCH:
+            if all(_alternative_needs_number(alternative, words) for alternative in av[1]):
+                return True
+    return False
+
+
+def _alternative_needs_number(items, words: Optional[re.Pattern]) -> bool:
+    if _needs_number(items, words):
+        return True
+    # A whole number word of the language ("الخامس\s*عشر")
+    text = _literal_text(items) if words is not None else None
+    return bool(text) and words.fullmatch(text) is not None
+
+
+def number_anchored(compiled, words: Optional[re.Pattern] = None) -> bool:
+    """
+    Whether every match of ``compiled`` contains a digit or, with ``words``,
+    a number word matched by it.
+
+    Args:
+        compiled: Compiled pattern of any backend (``pattern`` and ``flags``
+            hold the ``re`` source and flags it was compiled from)
+        words (re.Pattern, optional): Number words of the language
+
+    Returns:
+        bool: ``False`` when unsure, so the pattern scans the whole text
+    """
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, compiled.flags & _PARSER_FLAGS)
+    except re.error:
+        return False
+    return _needs_number(parsed, words)
+
+
+def max_match_width(compiled) -> Optional[int]:
+    """Widest match of ``compiled``; ``None`` when unbounded or unknown."""
+    try:
+        width = _sre_parse.parse(compiled.pattern, compiled.flags & _PARSER_FLAGS).getwidth()[1]
+    except re.error:
+        return None
+    return None if width >= _UNBOUNDED else width
+
+
+def merge_windows(spans: Iterable[Span], radius: int, length: int) -> List[Span]:
+    """Spans widened by ``radius`` on both sides, clipped to the text and merged."""
+    regions: List[Span] = []
+    for start, end in sorted(spans):
+        start, end = max(start - radius, 0), min(end + radius, length)
+        if regions and start <= regions[-1][1]:
+            if end > regions[-1][1]:
+                regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def intersect_ranges(first: Iterable[Span], second: Iterable[Span]) -> List[Span]:
+    """Intersection of two sorted lists of disjoint ranges."""
+    first, second = list(first), list(second)
+    result: List[Span] = []
+    i = j = 0
+    while i < len(first) and j < len(second):
+        start = max(first[i][0], second[j][0])
+        end = min(first[i][1], second[j][1])
+        if start < end:
+            result.append((start, end))
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+# ===================================================================================
+# CANDIDATE WINDOWS
+# ===================================================================================
+class CandidateWindows:
+    """
+    Digit clusters and number-word hits of one text, widened into windows.
+
+    Args:
+        text (str): Text being matched
+        anchors (List[Span]): Spans of the digit clusters and number words
+    """
+    __slots__ = ("length", "anchors", "_regions")
+
+    def __init__(self, text: str, anchors: List[Span]):
+        self.length = len(text)
+        self.anchors = anchors
+        self._regions: Dict[int, List[Span]] = {}
+
+    def regions(self, radius: int) -> List[Span]:
+        """Merged windows of ``radius`` characters around every anchor."""
+        regions = self._regions.get(radius)
+        if regions is None:
+            regions = self._regions[radius] = merge_windows(self.anchors, radius, self.length)
+        return regions
+
+
+class NumberAnchors:
+    """
+    Number-anchored patterns of a pack and their widest match.
+
+    Args:
+        words (str): Number-words pattern of the language (``DatePatterns.words``);
+            a pattern matching the empty string means none
+        patterns (Iterable): Compiled patterns to analyse
+    """
+
+    def __init__(self, words: str, patterns: Iterable[Any]):
+        self.words = None if re.fullmatch(words, "") else re.compile(words, re.IGNORECASE | re.UNICODE)
+        # id(compiled) -> widest match (None when unbounded)
+        self._anchored: Dict[int, Optional[int]] = {}
+        for compiled in patterns:
+            if id(compiled) not in self._anchored and number_anchored(compiled, self.words):
+                self._anchored[id(compiled)] = max_match_width(compiled)
+
+    def __len__(self) -> int:
+        return len(self._anchored)
+
+    def radius(self, compiled, window: Optional[int] = None) -> Optional[int]:
+        """
+        Window radius of ``compiled``: its widest match, capped by ``window``
+        when given. ``None`` (scan everything) for patterns that are not
+        number-anchored and, without ``window``, for unbounded ones.
+        """
+        if id(compiled) not in self._anchored:
+            return None
+        width = self._anchored[id(compiled)]
+        if window is None:
+            return width
+        return window if width is None else min(width, window)
+
+    def report(self, window: Optional[int] = None) -> Dict[str, int]:
+        """
+        ``anchored`` (number-anchored patterns), ``bounded`` (those with a
+        widest match) and ``windowed`` (those a detector with
+        ``candidate_window=window`` runs in windows; none for ``0``).
+        """
+        widths = list(self._anchored.values())
+        bounded = sum(width is not None for width in widths)
+        if window is None:
+            windowed = bounded
+        else:
+            windowed = len(widths) if window > 0 else 0
+        return {"anchored": len(widths), "bounded": bounded, "windowed": windowed}
+
+    def windows(self, text: str) -> CandidateWindows:
+        """Digit clusters and number-word hits of ``text``, found in one pass each."""
+        anchors = [match.span() for match in _DIGITS.finditer(text)]
+        if self.words is not None:
+            anchors.extend(match.span() for match in self.words.finditer(text) if match.end() > match.start())
+        return CandidateWindows(text, anchors)
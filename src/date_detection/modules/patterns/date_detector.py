@@ -1,4 +1,8 @@
 import re
+import copy
+import hashlib
+import logging
+from dataclasses import asdict
 
 # Import path helper to ensure modules directory is in sys.path
 # ===================================================================================
@@ -7,82 +11,267 @@ if __name__ == "__main__":
     from path_helper import add_modules_to_sys_path
     add_modules_to_sys_path()
 
-from modules.regex_patterns import get_date_patterns
-from modules.patterns.patterns_date_classes import DatePatterns
-from modules.patterns.patterns_dict import (
-    get_date_unknown_calender_patterns,
-    get_date_basic_patterns,
-    get_date_components_patterns,
-    get_date_mixed_patterns,
-    get_date_complex,
-)
+from modules.normalizers.normalize_text import DEFAULT_TEXT_NORMALIZER
+from modules.normalizers.normalize_cache import NormalizationCache
+from modules.patterns.result_cache import make_result_key, copy_detection
+from modules.patterns.language_packs import get_language_pack
+from modules.patterns.text_gaps import TextGaps
+from modules.patterns.candidate_windows import intersect_ranges
+from modules.regex_patterns.pattern_registry import min_match_width
 
+logger = logging.getLogger(__name__)
+
+
+def _splits_run(text, pos):
+    """Whether ``pos`` falls between two digits or two letters of one token."""
+    if pos <= 0 or pos >= len(text):
+        return False
+    before, after = text[pos - 1], text[pos]
+    return (before.isdigit() and after.isdigit()) or (before.isalpha() and after.isalpha())
 
-class DateDetector:
-    def __init__(self, lang="ar"):
-        # Unpack pattern data with explicit naming
-        print(f"\n1. Loading {lang} language patterns...")
 
+class DateDetector:
+    def __init__(self, lang="ar", normalizer=DEFAULT_TEXT_NORMALIZER, normalization_cache=None,
+                 result_cache=None, keyword_trie=False, persian_keywords=True, regex_backend=None,
+                 gap_scan=True, literal_filter=True, candidate_window=None):
+        """
+        Args:
+            lang (str): Language of the keyword patterns ("ar" or "en"); see
+                ``MultiLanguageDateDetector`` to serve several languages
+            normalizer (TextNormalizer, optional): Pre-normaliser applied to the
+                text before matching (digits, tatweel, separators). ``None``
+                matches the raw text.
+            normalization_cache (NormalizationCache, optional): Cache used by
+                ``normalize_component``; a default-sized one is created when
+                omitted. Pass ``NormalizationCache(maxsize=0)`` to disable it.
+            result_cache (ResultCache, optional): Document-level cache in front
+                of ``match`` (memory, SQLite or shared backend).
+            keyword_trie (bool): Build the keyword alternations (months, eras,
+                indicators, ...) as prefix trees instead of flat alternations.
+            persian_keywords (bool): Run the patterns that only match Persian
+                keywords (Solar Hijri months and eras). ``False`` drops them,
+                for Arabic-script text known to contain no Persian.
+            regex_backend (str, optional): Regex engine of the patterns ("re",
+                "regex" or "re2" when installed; unsupported patterns fall back
+                to "re"). The current backend when omitted.
+            gap_scan (bool): Run each tier after the first only over the text
+                no earlier tier matched (see ``TextGaps``). ``False`` runs
+                every tier over the whole text.
+            literal_filter (bool): Skip the patterns whose required literals
+                (era keywords, month names, parentheses, ...) do not occur in
+                the text (see ``LiteralIndex``); results are the same.
+            candidate_window (int, optional): Run the patterns that need a
+                digit or a number word only within this many characters of
+                the digit clusters and number words of the text (see
+                ``CandidateWindows``). Windowing only prunes with an explicit
+                size, at the cost of missing matches wider than it. ``None``
+                keeps results exact by windowing only the patterns with a
+                bounded match width, which almost none have (see
+                ``NumberAnchors.report``); ``0`` scans the whole text.
+        """
         # Unpack pattern data with explicit naming
-        (
-            base_patterns,
-            month_patterns,
-            era_patterns,
-            indicator_patterns,
-            numeric_patterns
-        ) = get_date_patterns(lang="ar")      
-        #
-        self.date_patterns = DatePatterns(
-            base_patterns=base_patterns,
-            month_patterns=month_patterns,
-            era_patterns=era_patterns,
-            indicator_patterns=indicator_patterns,
-            numeric_patterns=numeric_patterns
-        )
-        self.date_unknown_calender = get_date_unknown_calender_patterns(
-            self.date_patterns
-        )
-        self.date_basic_pattern_dict = get_date_basic_patterns(
-            self.date_patterns
+        logger.debug("Loading %s language patterns", lang)
+        self.lang = lang
+        self.normalizer = normalizer
+        self.normalization_cache = (
+            normalization_cache if normalization_cache is not None else NormalizationCache()
         )
-        self.date_components_patterns_dict = get_date_components_patterns(
-            self.date_patterns
-        )
-        self.date_mixed_patterns_dict = get_date_mixed_patterns(
-            self.date_patterns
-        )
-        self.date_complex_dict = get_date_complex(
-            self.date_patterns
+        self.result_cache = result_cache
+        self._fingerprint = None
+
+        # Compiled tiers are shared by every detector with the same language,
+        # normaliser settings and keyword form
+        self.pack = get_language_pack(
+            lang, normalizer=normalizer, keyword_trie=keyword_trie, regex_backend=regex_backend
         )
-        self.pipeline = {
-            "complex"           : self.date_complex_dict,
-            "mixed"             : self.date_mixed_patterns_dict,
-            "components"        : self.date_components_patterns_dict,
-            "unknown_calender"  : self.date_unknown_calender,
-        }
+        self.date_patterns = self.pack.date_patterns
+        self.date_unknown_calender = self.pack.date_unknown_calender
+        self.date_basic_pattern_dict = self.pack.date_basic_pattern_dict
+        self.date_components_patterns_dict = self.pack.date_components_patterns_dict
+        self.date_mixed_patterns_dict = self.pack.date_mixed_patterns_dict
+        self.date_complex_dict = self.pack.date_complex_dict
+        self.date_numeric_words_dict = self.pack.date_numeric_words_dict
+        self.persian_keywords = persian_keywords
+        self.gap_scan = gap_scan
+        self.literal_filter = literal_filter
+        self.candidate_window = candidate_window
+        self.pipeline = self.pack.pipeline if persian_keywords else self.pack.pipeline_without_persian()
 
     def get_pipeline(self):
         return self.pipeline.keys()
 
+    @property
+    def fingerprint(self):
+        """
+        Digest of everything that affects ``match`` results: language,
+        normaliser configuration, regex backend (its fallbacks can change
+        matches), gap scanning, candidate window, tier order
+        and every pattern name and source (hence the keyword lists they were
+        generated from).
+        """
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr((
+                self.lang, asdict(self.normalizer) if self.normalizer else None, self.pack.regex_backend,
+                self.gap_scan, self.candidate_window,
+            )).encode("utf-8"))
+            for key, value in self.pipeline.items():
+                digest.update(f"\0{key}\0{value['metadata']}".encode("utf-8"))
+                for patterns_info in value["patterns"]:
+                    compiled = patterns_info['pattern']
+                    digest.update(f"\0{patterns_info['name']}\0{compiled.flags}\0".encode("utf-8"))
+                    digest.update(compiled.pattern.encode("utf-8"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
     def match(self, text):
+        """
+        Run every tier of the pipeline over ``text``.
+
+        With ``gap_scan`` the first tier sees the whole text and every later
+        tier only the gaps left between the matches of the tiers before it.
+        With ``candidate_window`` the patterns that need a number only run in
+        the windows around the digits and number words of the text.
+        Patterns are matched against the normalised text; spans and surface
+        strings in the result refer to the original ``text``. With a
+        ``result_cache`` the result is looked up by text hash and detector
+        fingerprint first.
+
+        Returns:
+            list: One dict per matching pattern with ``tier``, ``metadata``,
+            ``pattern_name``, the pattern's component-to-group maps ``date`` /
+            ``date_end`` and ``matches`` (see ``_match_record``).
+        """
+        if self.result_cache is None:
+            return self._run_pipeline(text)
+
+        key = make_result_key(text, self.fingerprint)
+        detection = self.result_cache.get(key)
+        if detection is None:
+            detection = self._run_pipeline(text)
+            self.result_cache.put(key, detection)
+        return copy_detection(detection)
+
+    def _run_pipeline(self, text):
+        """Run every tier over ``text`` without consulting the result cache."""
+        normalized = self.normalizer.normalize(text) if self.normalizer else None
+        search_text = normalized.text if normalized else text
+        gaps = TextGaps(len(search_text)) if self.gap_scan else None
+        # One literal scan of the text decides which patterns can match at all
+        runnable = self.pack.literal_index.runnable(search_text) if self.literal_filter else None
+        # Digit clusters and number words, found once for every anchored pattern
+        windows = self.pack.number_anchors.windows(search_text) if self.candidate_window != 0 else None
+
         detection = []
         for key, value in self.pipeline.items():
             metadata = value["metadata"]
+            claimed = []
             for patterns_info in value["patterns"]:
                 compiled = patterns_info['pattern']
-                # Step 4: Use finditer (returns iterator)
-                matches = list(compiled.finditer(text))
+                if runnable is not None and id(compiled) not in runnable:
+                    continue
+                # Step 4: Use finditer (returns iterator), over the gaps only
+                # once a tier has claimed part of the text, and only around
+                # numbers for the patterns that need one
+                radius = (
+                    self.pack.number_anchors.radius(compiled, self.candidate_window)
+                    if windows is not None else None
+                )
+                regions = windows.regions(radius) if radius is not None else None
+                found = list(self._finditer(compiled, search_text, gaps, regions))
+                matches = [self._match_record(match, text, normalized) for match in found]
                 # Step 5: Get the first match safely
                 if matches:
-                    print("text :", text)
-                    print("pattern name :", patterns_info['name'])
+                    logger.debug("Pattern %s matched %d time(s)", patterns_info['name'], len(matches))
+                    claimed.extend(match.span() for match in found)
                     detection.append({
+                        "tier": key,
                         "metadata" : metadata,
                         "pattern_name": patterns_info['name'],
+                        # Copies: the maps belong to the shared compiled tiers
+                        "date": copy.deepcopy(patterns_info.get('date')),
+                        "date_end": copy.deepcopy(patterns_info.get('date_end')),
                         "matches": matches
                     })
-        return matches
+            if gaps is not None:
+                gaps.claim(claimed)
+                if not gaps:
+                    break
+        return detection
+
+    @staticmethod
+    def _finditer(compiled, search_text, gaps=None, regions=None):
+        """
+        ``compiled.finditer`` over the whole text, or over each gap (and
+        candidate region) wide enough for the pattern's shortest match.
+
+        A range is not a string of its own: a match ending at the end of a
+        range is matched again with the rest of the text in view and dropped
+        when it runs on into the claimed text ("20" of "2024"), and a match
+        starting at the start of a range is dropped when that start splits a
+        digit or letter run.
+        """
+        whole = [(0, len(search_text))]
+        ranges = list(gaps) if gaps is not None else whole
+        if regions is not None:
+            ranges = intersect_ranges(ranges, regions)
+        if ranges == whole:
+            yield from compiled.finditer(search_text)
+            return
+        width = max(min_match_width(compiled), 1)
+        for start, end in ranges:
+            if end - start < width:
+                continue
+            for match in compiled.finditer(search_text, start, end):
+                if match.start() == start and _splits_run(search_text, start):
+                    continue
+                if match.end() == end < len(search_text):
+                    match = compiled.match(search_text, match.start())
+                    if match is None or match.end() > end:
+                        continue
+                yield match
 
+    def normalize_component(self, match_component):
+        """
+        Normalise a match component dict (era, month, weekday, century) through
+        the detector's normalisation cache.
+
+        Args:
+            match_component (dict): Raw date components of a match
+
+        Returns:
+            dict: Output of ``normalize_date_output`` for the detector language
+        """
+        return self.normalization_cache.normalize_date_output(match_component, lang=self.lang)
+
+    @staticmethod
+    def _match_record(match, text, normalized=None):
+        """
+        Convert a match on the normalised text into a plain record.
+
+        Returns:
+            dict: ``text`` and ``span`` in the original text, ``groups`` as
+            matched (ASCII digits when normalised) and ``raw_groups`` as they
+            appear in the original text.
+        """
+        if normalized is None or normalized.is_identity:
+            start, end = match.span()
+            raw_groups = tuple(
+                None if group is None else text[match.start(i):match.end(i)]
+                for i, group in enumerate(match.groups(), start=1)
+            )
+        else:
+            start, end = normalized.span_to_original(*match.span())
+            raw_groups = tuple(
+                None if group is None else normalized.original_slice(*match.span(i))
+                for i, group in enumerate(match.groups(), start=1)
+            )
+        return {
+            "text": text[start:end],
+            "span": (start, end),
+            "groups": match.groups(),
+            "raw_groups": raw_groups,
+        }
 
 if __name__ == "__main__":
     # Demonstrate DateDetector with Arabic patterns
@@ -106,9 +295,11 @@ if __name__ == "__main__":
     ]
     for text in test_texts:
         print(f"\nDetecting dates in: '{text}'")
-        matches = detector.match(text)
-        if matches:
-            for match in matches:
-                print(f"Matched: {match.group(0)} at positions {match.start()}-{match.end()}")
+        detection = detector.match(text)
+        if detection:
+            for item in detection:
+                for match in item["matches"]:
+                    start, end = match["span"]
+                    print(f"Matched: {match['text']} at positions {start}-{end} ({item['pattern_name']})")
         else:
             print("No date detected.")
\ No newline at end of file
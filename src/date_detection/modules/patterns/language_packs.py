@@ -0,0 +1,295 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Tue Aug 05 09:27:51 2025
+
+@author: m.lotfi
+@description: Language packs: the pattern tiers of one language, built once per process.
+
+A ``LanguagePack`` holds everything ``DateDetector`` needs to match one
+language: the ``DatePatterns`` and the compiled tiers (complex, mixed,
+components, unknown calendar). Packs are cached per language, normaliser
+configuration and keyword form, so every detector (and every tenant) of a
+process uses the same compiled patterns. Patterns are compiled through the
+process-wide ``pattern_registry``, so a source used by several tiers or
+packs (numeric dates, the overlap of the basic and mixed tiers) is compiled
+once however many languages are loaded. Each pack also indexes its patterns
+by the literals they require (``literal_index``) and records which need a
+digit or a number word (``number_anchors``).
+
+Example::
+
+    ar = get_language_pack("ar")
+    en = get_language_pack("en")
+    get_language_pack("ar") is ar          # True
+    ar.memory_report()                     # patterns and compiled bytes
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+import sys
+import threading
+from dataclasses import astuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from modules.regex_patterns import get_date_patterns
+from modules.regex_patterns.regex_backend import get_regex_backend, using_regex_backend
+from modules.regex_patterns.pattern_registry import get_pattern_registry
+from modules.patterns.literal_index import LiteralIndex
+from modules.patterns.candidate_windows import NumberAnchors
+from modules.patterns.patterns_date_classes import DatePatterns
+from modules.patterns.patterns_dict import (
+    get_date_unknown_calender_patterns,
+    get_date_basic_patterns,
+    get_date_components_patterns,
+    get_date_mixed_patterns,
+    get_date_complex,
+    get_date_numeric_words_pattern,
+)
+
+# Languages ``get_date_patterns`` builds complete tiers for. Each covers a
+# script: "ar" also selects the Persian (Arabic-script) keywords, "en" the
+# transliterated ones.
+PACK_LANGUAGES = ("ar", "en")
+
+def _persian_only(source: str, date_patterns: DatePatterns) -> bool:
+    """
+    True when ``source`` embeds a Persian-only keyword alternation (Solar Hijri
+    months or eras) and no Hijri or Gregorian one, so it cannot match text
+    without Persian keywords.
+    """
+    persian = (date_patterns.mm.julian, date_patterns.era.julian)
+    others = (date_patterns.mm.hijri, date_patterns.mm.gregorian,
+              date_patterns.era.hijri, date_patterns.era.gregorian)
+    return (
+        any(alternation and alternation in source for alternation in persian)
+        and not any(alternation and alternation in source for alternation in others)
+    )
+
+
+def _tier_patterns(tiers: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Every pattern entry of ``tiers``."""
+    for tier in tiers:
+        yield from tier["patterns"]
+
+
+# ===================================================================================
+# LANGUAGE PACK
+# ===================================================================================
+class LanguagePack:
+    """
+    Pattern tiers of one language.
+
+    Args:
+        lang (str): Language of the keyword patterns, one of ``PACK_LANGUAGES``
+        normalizer (TextNormalizer, optional): Pre-normaliser the keywords are folded with
+        keyword_trie (bool): Build keyword alternations as prefix trees
+        regex_backend (str, optional): Engine the patterns are compiled with
+            ("re", "regex", "re2"; see ``regex_backend``), the current backend
+            when omitted
+    """
+
+    def __init__(self, lang: str = "ar", normalizer=None, keyword_trie: bool = False,
+                 regex_backend: Optional[str] = None):
+        if lang not in PACK_LANGUAGES:
+            raise ValueError(f"Unsupported pack language: '{lang}'. Supported: {PACK_LANGUAGES}")
+        self.lang = lang
+        self.regex_backend = get_regex_backend(regex_backend).name
+
+        # Unpack pattern data with explicit naming
+        (
+            base_patterns,
+            month_patterns,
+            era_patterns,
+            indicator_patterns,
+            numeric_patterns
+        ) = get_date_patterns(lang=lang, normalizer=normalizer, trie=keyword_trie)
+        self.date_patterns = DatePatterns(
+            base_patterns=base_patterns,
+            month_patterns=month_patterns,
+            era_patterns=era_patterns,
+            indicator_patterns=indicator_patterns,
+            numeric_patterns=numeric_patterns
+        )
+        with using_regex_backend(self.regex_backend):
+            self.date_unknown_calender = get_date_unknown_calender_patterns(self.date_patterns)
+            self.date_basic_pattern_dict = get_date_basic_patterns(self.date_patterns)
+            self.date_components_patterns_dict = get_date_components_patterns(self.date_patterns)
+            self.date_mixed_patterns_dict = get_date_mixed_patterns(self.date_patterns)
+            self.date_complex_dict = get_date_complex(self.date_patterns)
+            self.date_numeric_words_dict = get_date_numeric_words_pattern(self.date_patterns)
+        # Written years before the single components: with gap scanning the
+        # one-letter era hits of "components" (م, ش) would otherwise claim
+        # parts of the number phrases ("عام ألف ...")
+        self.pipeline = {
+            "complex"           : self.date_complex_dict,
+            "mixed"             : self.date_mixed_patterns_dict,
+            "numeric_words"     : self.date_numeric_words_dict,
+            "components"        : self.date_components_patterns_dict,
+            "unknown_calender"  : self.date_unknown_calender,
+        }
+        registry = get_pattern_registry()
+        for patterns_info in _tier_patterns(self._tiers()):
+            registry.label(patterns_info["pattern"], f"{lang}:{patterns_info['name']}")
+        # Literals each pipeline pattern needs, to skip the ones a text lacks
+        self.literal_index = LiteralIndex(self.compiled_patterns())
+        # Patterns that need a digit or a number word, run only around them
+        self.number_anchors = NumberAnchors(self.date_patterns.words, self.compiled_patterns())
+        self._pipeline_without_persian = None
+        self._persian_index = None
+
+    def _tiers(self) -> List[Dict[str, Any]]:
+        """Every tier the pack compiled, the basic one (not in the pipeline) included."""
+        return list(self.pipeline.values()) + [self.date_basic_pattern_dict]
+
+    def release(self) -> None:
+        """Give the pack's references back to the pattern registry."""
+        get_pattern_registry().release(
+            patterns_info["pattern"] for patterns_info in _tier_patterns(self._tiers())
+        )
+
+    def pipeline_without_persian(self) -> Dict[str, Dict[str, Any]]:
+        """
+        The pipeline without the patterns that only match Persian keywords
+        (Solar Hijri months and eras), built on first use. Used for
+        Arabic-script text without Persian letters (see ``script_router``).
+        """
+        if self._pipeline_without_persian is None:
+            self._pipeline_without_persian = {
+                key: {
+                    **tier,
+                    "patterns": [
+                        patterns_info for patterns_info in tier["patterns"]
+                        if not _persian_only(patterns_info["pattern"].pattern, self.date_patterns)
+                    ],
+                }
+                for key, tier in self.pipeline.items()
+            }
+        return self._pipeline_without_persian
+
+    def persian_keywords_in(self, text: str) -> bool:
+        """
+        Whether a Persian-only pattern can match ``text`` (normalised like the
+        text being matched): all the literals one of them requires, such as a
+        Solar Hijri month name or era, occur in it. Persian months like مهر or
+        آبان and the era هـ.ش use no Persian-specific letter, so the letters
+        alone cannot tell.
+        """
+        if self._persian_index is None:
+            self._persian_index = LiteralIndex(
+                compiled for compiled in self.compiled_patterns()
+                if _persian_only(compiled.pattern, self.date_patterns)
+            )
+        return bool(self._persian_index.runnable(text))
+
+    def compiled_patterns(self) -> Iterator[re.Pattern]:
+        """Distinct compiled patterns of the pipeline tiers."""
+        seen = set()
+        for tier in self.pipeline.values():
+            for patterns_info in tier["patterns"]:
+                compiled = patterns_info["pattern"]
+                if id(compiled) not in seen:
+                    seen.add(id(compiled))
+                    yield compiled
+
+    def memory_report(self) -> Dict[str, int]:
+        """
+        Size of the pack.
+
+        Returns:
+            Dict[str, int]: ``patterns`` (pipeline entries), ``compiled``
+            (distinct compiled patterns) and ``compiled_bytes`` (their size,
+            ``sys.getsizeof`` includes the compiled code)
+        """
+        compiled = list(self.compiled_patterns())
+        return {
+            "patterns": sum(len(tier["patterns"]) for tier in self.pipeline.values()),
+            "compiled": len(compiled),
+            "compiled_bytes": sum(sys.getsizeof(pattern) for pattern in compiled),
+        }
+
+
+def packs_memory_report(packs: Iterable[LanguagePack]) -> Dict[str, Dict[str, int]]:
+    """
+    Per-language memory of several packs, with the patterns they share counted once.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Per language ``patterns``, ``compiled``,
+        ``own_bytes`` (patterns used by this pack only) and ``shared`` (patterns
+        also used by another pack); under ``"shared"`` the ``compiled`` count
+        and ``bytes`` of those shared patterns, and under ``"total"`` the
+        distinct ``compiled`` patterns and ``bytes`` of all packs
+    """
+    packs = list(packs)
+    users: Dict[int, List[str]] = {}
+    sizes: Dict[int, int] = {}
+    for pack in packs:
+        for compiled in pack.compiled_patterns():
+            users.setdefault(id(compiled), []).append(pack.lang)
+            sizes[id(compiled)] = sys.getsizeof(compiled)
+
+    report: Dict[str, Dict[str, int]] = {}
+    for pack in packs:
+        ids = [id(compiled) for compiled in pack.compiled_patterns()]
+        report[pack.lang] = {
+            "patterns": pack.memory_report()["patterns"],
+            "compiled": len(ids),
+            "own_bytes": sum(sizes[i] for i in ids if len(users[i]) == 1),
+            "shared": sum(1 for i in ids if len(users[i]) > 1),
+        }
+    shared = [i for i, langs in users.items() if len(langs) > 1]
+    report["shared"] = {"compiled": len(shared), "bytes": sum(sizes[i] for i in shared)}
+    report["total"] = {"compiled": len(users), "bytes": sum(sizes.values())}
+    return report
+
+
+# ===================================================================================
+# SHARED PACKS
+# ===================================================================================
+_packs: Dict[Tuple[Any, ...], LanguagePack] = {}
+_packs_lock = threading.Lock()
+
+
+def _pack_key(lang: str, normalizer, keyword_trie: bool, regex_backend: str) -> Tuple[Any, ...]:
+    settings = None if normalizer is None else (type(normalizer), astuple(normalizer))
+    return (lang, settings, bool(keyword_trie), regex_backend)
+
+
+def get_language_pack(lang: str = "ar", normalizer=None, keyword_trie: bool = False,
+                      regex_backend: Optional[str] = None) -> LanguagePack:
+    """
+    Process-wide ``LanguagePack``, built on first use.
+
+    Packs are keyed by language, normaliser settings, keyword form and regex
+    backend, so detectors created with equal arguments share one pack.
+    """
+    regex_backend = get_regex_backend(regex_backend).name
+    key = _pack_key(lang, normalizer, keyword_trie, regex_backend)
+    pack = _packs.get(key)
+    if pack is None:
+        with _packs_lock:
+            pack = _packs.get(key)
+            if pack is None:
+                pack = LanguagePack(lang, normalizer, keyword_trie, regex_backend)
+                _packs[key] = pack
+    return pack
+
+
+def loaded_language_packs() -> List[LanguagePack]:
+    """Packs built so far in this process."""
+    return list(_packs.values())
+
+
+def clear_language_packs() -> None:
+    """Drop the cached packs and release their compiled patterns (e.g. after keyword changes)."""
+    with _packs_lock:
+        for pack in _packs.values():
+            pack.release()
+        _packs.clear()
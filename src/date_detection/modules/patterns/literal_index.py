@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Wed Aug 06 16:02:45 2025
+
+@author: m.lotfi
+@description: Required-literal index: run only the patterns whose literals occur in the text.
+
+Most pipeline patterns cannot match without some fixed text: a Hijri era
+keyword, a Persian month name, a range starter like "من", a parenthesis.
+``required_literals`` reads a compiled pattern's parse tree once and returns
+what it needs as a tuple of requirements, each a set of literals of which at
+least one must occur in the text (a keyword alternation gives one set, a
+fixed word one single-literal set).
+
+``LiteralIndex`` indexes the patterns of a pack by those literals. For a
+document it scans the text once for every literal of the pack and returns the
+patterns whose requirements are all met; the others cannot match and are not
+run. The analysis only drops patterns that cannot match, so results are the
+same with and without the index.
+
+Example::
+
+    index = LiteralIndex(pack.compiled_patterns())
+    runnable = index.runnable("ولد في 15 رمضان 1445 هـ")
+    # Persian months, Gregorian eras, parenthesised dual dates... are not in it
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from modules.regex_patterns.keywords_to_regex import keywords_to_regex
+
+try:
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+# A set of literals, one of which must occur in the text
+Requirement = FrozenSet[str]
+
+_REPEATS = tuple(
+    op for op in (
+        _sre_parse.MAX_REPEAT,
+        _sre_parse.MIN_REPEAT,
+        getattr(_sre_parse, "POSSESSIVE_REPEAT", None),
+    ) if op is not None
+)
+_ATOMIC_GROUP = getattr(_sre_parse, "ATOMIC_GROUP", None)
+# Flags the re parser understands (the regex module adds its own)
+_PARSER_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE | re.UNICODE | re.ASCII
+
+
+# ===================================================================================
+# PATTERN ANALYSIS
+# ===================================================================================
+def _is_literal_char(code: int) -> bool:
+    # Whitespace stays out of literals: keyword spaces are matched flexibly
+    return not chr(code).isspace()
+
+
+def _class_literals(items) -> Optional[Requirement]:
+    """Characters of a ``[...]`` class made of plain characters only."""
+    chars = set()
+    for op, av in items:
+        if op != _sre_parse.LITERAL or not _is_literal_char(av):
+            return None
+        chars.add(chr(av))
+    return frozenset(chars) or None
+
+
+def _minimal(literals: Set[str], ignorecase: bool) -> Requirement:
+    """
+    Drop literals containing a shorter one of the set: any text with the
+    longer literal has the shorter one too.
+    """
+    fold = str.lower if ignorecase else (lambda s: s)
+    kept: List[str] = []
+    for literal in sorted(literals, key=len):
+        if not any(fold(shorter) in fold(literal) for shorter in kept):
+            kept.append(literal)
+    return frozenset(kept)
+
+
+def _selectivity(requirement: Requirement) -> Tuple[int, int]:
+    # Longer shortest literal first, then fewer alternatives
+    return min(len(literal) for literal in requirement), -len(requirement)
+
+
+def _branch_requirement(alternatives, ignorecase: bool) -> Optional[Requirement]:
+    """
+    One literal set for an alternation: the most selective requirement of
+    every alternative, merged. ``None`` when an alternative needs no literal.
+    """
+    literals: Set[str] = set()
+    for alternative in alternatives:
+        requirements = _sequence_requirements(alternative, ignorecase)
+        if not requirements:
+            return None
+        literals |= max(requirements, key=_selectivity)
+    return _minimal(literals, ignorecase)
+
+
+def _sequence_requirements(items, ignorecase: bool) -> List[Requirement]:
+    """Requirements of a parsed sequence; consecutive characters form one literal."""
+    requirements: List[Requirement] = []
+    run: List[str] = []
+
+    def flush():
+        if run:
+            requirements.append(frozenset(["".join(run)]))
+            run.clear()
+
+    for op, av in items:
+        if op == _sre_parse.LITERAL and _is_literal_char(av):
+            run.append(chr(av))
+            continue
+        flush()
+        if op == _sre_parse.IN:
+            chars = _class_literals(av)
+            if chars:
+                requirements.append(chars)
+        elif op in _REPEATS:
+            minimum, _, body = av
+            if minimum >= 1:
+                requirements.extend(_sequence_requirements(body, ignorecase))
+        elif op == _sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, body = av
+            # Inline flags could change case sensitivity: leave those groups out
+            if not (add_flags or del_flags):
+                requirements.extend(_sequence_requirements(body, ignorecase))
+        elif op == _ATOMIC_GROUP:
+            requirements.extend(_sequence_requirements(av, ignorecase))
+        elif op == _sre_parse.ASSERT:
+            # Positive lookaround: its text must be somewhere in the text too
+            requirements.extend(_sequence_requirements(av[1], ignorecase))
+        elif op == _sre_parse.BRANCH:
+            requirement = _branch_requirement(av[1], ignorecase)
+            if requirement:
+                requirements.append(requirement)
+    flush()
+    return requirements
+
+
+def required_literals(compiled) -> Tuple[Requirement, ...]:
+    """
+    Literals ``compiled`` needs in the text to match.
+
+    Args:
+        compiled: Compiled pattern of any backend (``pattern`` and ``flags``
+            hold the ``re`` source and flags it was compiled from)
+
+    Returns:
+        Tuple[FrozenSet[str], ...]: Requirements, each a set of literals of
+        which one must occur; empty when the pattern needs no fixed text
+        (or cannot be analysed)
+    """
+    flags = compiled.flags & _PARSER_FLAGS
+    try:
+        parsed = _sre_parse.parse(compiled.pattern, flags)
+    except re.error:
+        return ()
+    requirements = _sequence_requirements(parsed, bool(flags & re.IGNORECASE))
+    return tuple(dict.fromkeys(requirements))
+
+
+# ===================================================================================
+# LITERAL INDEX
+# ===================================================================================
+class LiteralIndex:
+    """
+    Patterns indexed by the literals they require.
+
+    Args:
+        patterns (Iterable): Compiled patterns to index
+    """
+
+    def __init__(self, patterns: Iterable[Any]):
+        self._patterns: List[Any] = []
+        self._requirement_counts: List[int] = []
+        self._free: List[Any] = []  # patterns without requirements
+        # literal -> [(pattern index, requirement index)]
+        self._postings: Dict[Tuple[str, bool], List[Tuple[int, int]]] = {}
+        seen = set()
+        for compiled in patterns:
+            if id(compiled) in seen:
+                continue
+            seen.add(id(compiled))
+            ignorecase = bool(compiled.flags & re.IGNORECASE)
+            requirements = required_literals(compiled)
+            if not requirements:
+                self._free.append(compiled)
+                continue
+            index = len(self._patterns)
+            self._patterns.append(compiled)
+            self._requirement_counts.append(len(requirements))
+            for position, requirement in enumerate(requirements):
+                for literal in requirement:
+                    self._postings.setdefault((literal, ignorecase), []).append((index, position))
+
+        self._literals = list(self._postings)
+        self._folded = {
+            literal: re.compile(re.escape(literal), re.IGNORECASE)
+            for literal, ignorecase in self._literals if ignorecase
+        }
+        # One pass over the text: at every position the longest literal
+        # starting there (prefix tree, longest first); the shorter literals
+        # are found inside it (see ``_contained``)
+        alternation = keywords_to_regex([literal for literal, _ in self._literals], trie=True)
+        self._scanner = re.compile(f"(?={alternation})", re.IGNORECASE) if alternation else None
+        self._contained_cache: Dict[str, Tuple[Tuple[str, bool], ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._patterns) + len(self._free)
+
+    @property
+    def literals(self) -> int:
+        """Number of distinct literals indexed."""
+        return len(self._literals)
+
+    def _contained(self, found: str) -> Tuple[Tuple[str, bool], ...]:
+        """Indexed literals occurring in ``found`` (a scanner hit)."""
+        contained = self._contained_cache.get(found)
+        if contained is None:
+            contained = tuple(
+                (literal, ignorecase) for literal, ignorecase in self._literals
+                if (self._folded[literal].search(found) if ignorecase else literal in found)
+            )
+            self._contained_cache[found] = contained
+        return contained
+
+    def present_literals(self, text: str) -> Set[Tuple[str, bool]]:
+        """Indexed ``(literal, ignorecase)`` pairs occurring in ``text``."""
+        if self._scanner is None:
+            return set()
+        hits = {match.group(1) for match in self._scanner.finditer(text)}
+        present: Set[Tuple[str, bool]] = set()
+        for found in hits:
+            present.update(self._contained(found))
+        return present
+
+    def runnable(self, text: str) -> Set[int]:
+        """
+        Patterns that can match ``text``: every requirement has a literal in
+        it. Patterns without requirements are always included.
+
+        Returns:
+            Set[int]: ``id()`` of the runnable compiled patterns
+        """
+        satisfied: Dict[int, Set[int]] = {}
+        for key in self.present_literals(text):
+            for index, position in self._postings[key]:
+                satisfied.setdefault(index, set()).add(position)
+        runnable = {id(compiled) for compiled in self._free}
+        runnable.update(
+            id(self._patterns[index]) for index, positions in satisfied.items()
+            if len(positions) == self._requirement_counts[index]
+        )
+        return runnable
+
+    def report(self) -> Dict[str, int]:
+        """``patterns`` indexed, ``free`` (no requirement) and distinct ``literals``."""
+        return {
+            "patterns": len(self),
+            "free": len(self._free),
+            "literals": self.literals,
+        }
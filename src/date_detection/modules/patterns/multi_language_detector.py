@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Tue Aug 05 09:27:51 2025
+
+@author: m.lotfi
+@description: One detector serving several languages from shared language packs.
+
+``MultiLanguageDateDetector`` loads a ``LanguagePack`` per language (shared
+with every other detector of the process, see ``language_packs``). Documents
+are split into script segments in one pass (``script_router``) and every
+segment is matched only by the pack of its script: English month names are
+never tried on Arabic text and the other way round. Arabic-script segments
+without Persian letters also skip the Persian-only keyword patterns. The
+normalisation and result caches are shared by all languages.
+
+Example::
+
+    detector = MultiLanguageDateDetector(langs=("ar", "en"))
+    detector.match("ولد في 15 رمضان 1445 هـ")             # "ar" pack only
+    detector.match("Born on 15 March 2022 AD")          # "en" pack only
+    detector.match("ولد في 15 رمضان 1445 هـ (born 2024)") # each segment by its pack
+    detector.memory_report()                             # per language
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from modules.normalizers.normalize_text import DEFAULT_TEXT_NORMALIZER
+from modules.normalizers.normalize_cache import NormalizationCache
+from modules.patterns.date_detector import DateDetector
+from modules.patterns.language_packs import PACK_LANGUAGES, packs_memory_report
+from modules.patterns.script_router import SCRIPT_LANGUAGES, ScriptSegment, segment_by_script, script_letter_counts
+
+
+class MultiLanguageDateDetector:
+    """
+    Date detector for several languages sharing one set of compiled patterns.
+
+    Args:
+        langs (Sequence[str]): Languages to load, a subset of ``PACK_LANGUAGES``
+        default_lang (str, optional): Language of texts without letters of any
+            loaded script; the first of ``langs`` when omitted
+        normalizer (TextNormalizer, optional): Pre-normaliser, as for ``DateDetector``
+        normalization_cache (NormalizationCache, optional): Shared by all languages
+        result_cache (ResultCache, optional): Shared by all languages; entries
+            are keyed by each language's detector fingerprint
+        keyword_trie (bool): Build keyword alternations as prefix trees
+        regex_backend (str, optional): Regex engine of the patterns (see ``DateDetector``)
+        persian_gate (bool): Skip the Persian-only keyword patterns in
+            Arabic-script segments with neither Persian letters or digits
+            nor the literals of a Persian month or era
+        gap_scan (bool): Run lower tiers only over text the higher tiers did
+            not match (see ``DateDetector``)
+        literal_filter (bool): Skip patterns whose required literals are not
+            in the text (see ``DateDetector``)
+        candidate_window (int, optional): Run number-anchored patterns only
+            around digits and number words; caps the window radius when
+            given, ``0`` scans the whole text (see ``DateDetector``)
+    """
+
+    def __init__(self, langs: Sequence[str] = PACK_LANGUAGES, default_lang: Optional[str] = None,
+                 normalizer=DEFAULT_TEXT_NORMALIZER, normalization_cache=None, result_cache=None,
+                 keyword_trie: bool = False, persian_gate: bool = True, regex_backend: Optional[str] = None,
+                 gap_scan: bool = True, literal_filter: bool = True,
+                 candidate_window: Optional[int] = None):
+        if not langs:
+            raise ValueError("At least one language is required")
+        self.langs = tuple(dict.fromkeys(langs))
+        self.default_lang = default_lang or self.langs[0]
+        if self.default_lang not in self.langs:
+            raise ValueError(f"Default language '{self.default_lang}' is not one of {self.langs}")
+        self.normalization_cache = (
+            normalization_cache if normalization_cache is not None else NormalizationCache()
+        )
+        self.detectors: Dict[str, DateDetector] = {
+            lang: DateDetector(
+                lang=lang,
+                normalizer=normalizer,
+                normalization_cache=self.normalization_cache,
+                result_cache=result_cache,
+                keyword_trie=keyword_trie,
+                regex_backend=regex_backend,
+                gap_scan=gap_scan,
+                literal_filter=literal_filter,
+                candidate_window=candidate_window,
+            )
+            for lang in self.langs
+        }
+        # Same packs without the Persian-only patterns, for Arabic-script
+        # segments with no Persian evidence
+        self.non_persian_detectors: Dict[str, DateDetector] = {}
+        if persian_gate:
+            self.non_persian_detectors = {
+                lang: DateDetector(
+                    lang=lang,
+                    normalizer=normalizer,
+                    normalization_cache=self.normalization_cache,
+                    result_cache=result_cache,
+                    keyword_trie=keyword_trie,
+                    persian_keywords=False,
+                    regex_backend=regex_backend,
+                    gap_scan=gap_scan,
+                    literal_filter=literal_filter,
+                    candidate_window=candidate_window,
+                )
+                for lang in self.langs
+                if lang == SCRIPT_LANGUAGES["arabic"]
+            }
+
+    def route(self, text: str) -> str:
+        """
+        Language of ``text`` as a whole: the loaded language whose script has
+        the most letters in it, ``default_lang`` on a tie or without letters.
+        """
+        counts = {
+            SCRIPT_LANGUAGES[script]: count
+            for script, count in script_letter_counts(text).items()
+            if SCRIPT_LANGUAGES[script] in self.detectors
+        }
+        best = max(counts, key=counts.get, default=None)
+        if best is None or counts[best] == 0 or counts[best] == counts.get(self.default_lang):
+            return self.default_lang
+        return best
+
+    def _segment_detector(self, segment: ScriptSegment, text: str) -> DateDetector:
+        """
+        Detector of the segment script (default language for unloaded
+        scripts), Persian-gated when the segment ``text`` has no Persian
+        letters or digits and no Persian month or era keyword.
+        """
+        lang = segment.lang if segment.lang in self.detectors else self.default_lang
+        if segment.script == "arabic" and not segment.persian and lang in self.non_persian_detectors:
+            detector = self.detectors[lang]
+            search_text = detector.normalizer.translate(text) if detector.normalizer else text
+            if not detector.pack.persian_keywords_in(search_text):
+                return self.non_persian_detectors[lang]
+        return self.detectors[lang]
+
+    def match(self, text: str, lang: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Detect dates in ``text``.
+
+        With ``lang`` the whole text is matched by that language. Otherwise
+        every script segment is matched by its own pack and the spans are
+        mapped back to ``text``; a match found by two segments (in the neutral
+        text they share) is reported once.
+
+        Returns:
+            list: ``DateDetector.match`` records; every detection also carries
+            the ``lang`` it was matched with
+        """
+        if lang is not None:
+            detector = self.detectors.get(lang)
+            if detector is None:
+                raise ValueError(f"Language '{lang}' is not loaded. Loaded: {self.langs}")
+            detection = detector.match(text)
+            for record in detection:
+                record["lang"] = lang
+            return detection
+
+        segments = segment_by_script(text)
+        if len(segments) == 1:
+            detector = self._segment_detector(segments[0], text)
+            detection = detector.match(text)
+            for record in detection:
+                record["lang"] = detector.lang
+            return detection
+
+        detection = []
+        seen = set()
+        for segment in segments:
+            segment_text = text[segment.start:segment.end]
+            detector = self._segment_detector(segment, segment_text)
+            for record in detector.match(segment_text):
+                matches = []
+                for match in record["matches"]:
+                    start, end = match["span"]
+                    span = (start + segment.start, end + segment.start)
+                    if (record["pattern_name"], span) in seen:
+                        continue
+                    seen.add((record["pattern_name"], span))
+                    match["span"] = span
+                    matches.append(match)
+                if matches:
+                    record["matches"] = matches
+                    record["lang"] = detector.lang
+                    detection.append(record)
+        return detection
+
+    def normalize_component(self, match_component: Dict[str, Any], lang: Optional[str] = None) -> Dict[str, Any]:
+        """``DateDetector.normalize_component`` of the detector of ``lang`` (default language when omitted)."""
+        return self.detectors[lang or self.default_lang].normalize_component(match_component)
+
+    def memory_report(self) -> Dict[str, Dict[str, int]]:
+        """
+        Compiled-pattern memory per loaded language; patterns shared between
+        languages are reported once under ``"shared"`` (see ``packs_memory_report``).
+        """
+        return packs_memory_report(detector.pack for detector in self.detectors.values())
@@ -41,6 +41,27 @@ from modules.patterns.patterns_date_classes.date_patterns import DatePatterns
 
 from modules.patterns.patterns_date_classes.pattern_validator import PatternValidator
 
+# Compact entities
+from modules.patterns.patterns_date_classes.compact_entity import (
+    CalendarCode,
+    EraCode,
+    PrecisionCode,
+    CompactDateEntity,
+    DateEntityBatch
+)
+from modules.patterns.patterns_date_classes.date_format import (
+    FormatPlan,
+    compile_format,
+    strftime_many
+)
+
+# Ordinal intervals
+from modules.patterns.patterns_date_classes.interval_index import (
+    OrdinalIntervalIndex,
+    entity_ordinal,
+    range_span
+)
+
 from modules.patterns.patterns_date_classes import (
     ParsedDate,
     DateAlternative,
@@ -69,6 +90,17 @@ __all__ = [
     'ComplexDayMonthYearPatterns',
     'ComplexNaturalLanguagePatterns',
     'DatePatterns',
+    'CalendarCode',
+    'EraCode',
+    'PrecisionCode',
+    'CompactDateEntity',
+    'DateEntityBatch',
+    'FormatPlan',
+    'compile_format',
+    'strftime_many',
+    'OrdinalIntervalIndex',
+    'entity_ordinal',
+    'range_span',
     'ParsedDate',
     'DateAlternative',
     'DateRange',
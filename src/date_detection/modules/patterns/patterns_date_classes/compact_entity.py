@@ -0,0 +1,452 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Thu Aug 07 11:02:18 2025
+
+@author: m.lotfi
+@description: Compact date entities for high-volume detection output.
+
+``CompactDateEntity`` uses ``__slots__`` (no per-instance ``__dict__`` or
+``metadata`` dict), stores calendar, era and precision as small-int enums and
+resolves month names lazily from precomputed tables; construction does no
+normalisation work beyond integer parsing. ``DateEntityBatch`` keeps many
+entities in parallel typed arrays (``array.array``), i.e. a handful of Python
+objects per batch instead of one object per date.
+
+Example::
+
+    batch = DateEntityBatch()
+    batch.append(CompactDateEntity(day=15, month=9, year=1445, calendar="hijri", era="هـ"))
+    entity = batch[0]
+    entity.month_name          # "Ramadan"
+    entity.precision           # PrecisionCode.EXACT
+    batch.to_numpy()["year"]   # array([1445], dtype=int32)
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+from array import array
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from modules.keywords import months_standard_keywords, weekdays_standard_keywords
+
+# ===================================================================================
+# SMALL-INT ENUMS
+# ===================================================================================
+
+class CalendarCode(IntEnum):
+    """Calendar system as a small int."""
+    UNKNOWN = 0
+    GREGORIAN = 1
+    HIJRI = 2
+    JULIAN = 3  # Solar Hijri
+
+    @classmethod
+    def coerce(cls, value: Union["CalendarCode", int, str, None]) -> "CalendarCode":
+        """Convert a calendar name, alias, int or enum to a ``CalendarCode``."""
+        if value is None or value == "":
+            return cls.UNKNOWN
+        if isinstance(value, int):
+            return cls(value)
+        code = _CALENDAR_ALIASES.get(value.strip().lower())
+        if code is None:
+            raise ValueError(f"Unsupported calendar: {value}. Supported calendars: {sorted(_CALENDAR_ALIASES)}")
+        return code
+
+    @property
+    def label(self) -> Optional[str]:
+        """Calendar name used throughout the package ('gregorian', 'hijri', 'julian')."""
+        return None if self is CalendarCode.UNKNOWN else self.name.lower()
+
+
+class EraCode(IntEnum):
+    """Era designation as a small int."""
+    NONE = 0
+    CE = 1
+    BCE = 2
+    AH = 3
+    BAH = 4
+    SH = 5
+    BSH = 6
+
+    @classmethod
+    def coerce(cls, value: Union["EraCode", int, str, None]) -> "EraCode":
+        """Convert a normalised or surface era string, int or enum to an ``EraCode``."""
+        if value is None or value == "":
+            return cls.NONE
+        if isinstance(value, int):
+            return cls(value)
+        code = _ERA_ALIASES.get(value.strip().upper()) or _ERA_ALIASES.get(value.strip())
+        if code is None:
+            raise ValueError(f"Unsupported era: {value}")
+        return code
+
+
+class PrecisionCode(IntEnum):
+    """Precision level, ordered like the precision hierarchy of ``DateEntity``."""
+    PARTIAL = 0
+    CENTURY = 1
+    YEAR = 2
+    MONTH = 3
+    EXACT = 4
+
+    @classmethod
+    def coerce(cls, value: Union["PrecisionCode", int, str]) -> "PrecisionCode":
+        if isinstance(value, int):
+            return cls(value)
+        return cls[value.strip().upper()]
+
+
+_CALENDAR_ALIASES: Dict[str, CalendarCode] = {
+    "gregorian": CalendarCode.GREGORIAN,
+    "greg": CalendarCode.GREGORIAN,
+    "hijri": CalendarCode.HIJRI,
+    "islamic": CalendarCode.HIJRI,
+    "julian": CalendarCode.JULIAN,
+    "solar_hijri": CalendarCode.JULIAN,
+    "persian": CalendarCode.JULIAN,
+}
+
+_ERA_ALIASES: Dict[str, EraCode] = {
+    "CE": EraCode.CE, "AD": EraCode.CE, "م": EraCode.CE,
+    "BCE": EraCode.BCE, "BC": EraCode.BCE, "ق.م": EraCode.BCE,
+    "AH": EraCode.AH, "هـ": EraCode.AH, "ه": EraCode.AH,
+    "BAH": EraCode.BAH, "BH": EraCode.BAH, "ق.هـ": EraCode.BAH,
+    "SH": EraCode.SH, "هـ.ش": EraCode.SH,
+    "BSH": EraCode.BSH, "ق.هـ.ش": EraCode.BSH,
+}
+
+# Keyword table prefix of each calendar in ``months_standard_keywords``
+_MONTH_TABLE_PREFIX = {
+    CalendarCode.GREGORIAN: "gregorian",
+    CalendarCode.HIJRI: "hijri",
+    CalendarCode.JULIAN: "persian",
+}
+
+# ===================================================================================
+# NAME TABLES
+# ===================================================================================
+
+@lru_cache(maxsize=None)
+def month_name_table(calendar: CalendarCode, lang: str = "en", abbr: bool = False) -> Optional[Tuple[str, ...]]:
+    """
+    Return the 12 month names of a calendar/language, built on first use.
+
+    Abbreviated names exist for Gregorian English only; other combinations
+    fall back to full names, like ``normalize_month(..., output_format="abbr")``.
+    """
+    prefix = _MONTH_TABLE_PREFIX.get(CalendarCode.coerce(calendar))
+    if prefix is None:
+        return None
+    if abbr and f"{prefix}_{lang}_abbr" in months_standard_keywords:
+        return tuple(months_standard_keywords[f"{prefix}_{lang}_abbr"])
+    names = months_standard_keywords.get(f"{prefix}_{lang}")
+    return tuple(names) if names else None
+
+
+def month_name(calendar: CalendarCode, month: Optional[int], lang: str = "en", abbr: bool = False) -> Optional[str]:
+    """Name of month number ``month`` (1-12), or None when unknown."""
+    if not month or not 1 <= month <= 12:
+        return None
+    table = month_name_table(CalendarCode.coerce(calendar), lang, abbr)
+    return table[month - 1] if table else None
+
+
+# Keyword table of each language in ``weekdays_standard_keywords``
+_WEEKDAY_TABLE_KEY = {
+    "ar": "weekdays_ar",
+    "en": "weekdays_en",
+    "fa": "weekdays_fa_ar",
+}
+
+
+@lru_cache(maxsize=None)
+def weekday_name_table(lang: str = "en", abbr: bool = False) -> Optional[Tuple[str, ...]]:
+    """Return the 7 weekday names of a language, Sunday first (index 0)."""
+    key = _WEEKDAY_TABLE_KEY.get(lang)
+    if key is None:
+        return None
+    if abbr and f"{key}_abbr" in weekdays_standard_keywords:
+        key = f"{key}_abbr"
+    return tuple(weekdays_standard_keywords[key])
+
+
+def weekday_name(weekday: Optional[int], lang: str = "en", abbr: bool = False) -> Optional[str]:
+    """Name of weekday index ``weekday`` (0 = Sunday), or None when unknown."""
+    if weekday is None or not 0 <= weekday <= 6:
+        return None
+    table = weekday_name_table(lang, abbr)
+    return table[weekday] if table else None
+
+
+@lru_cache(maxsize=4096)
+def _month_number(month: str) -> Optional[int]:
+    """Month number of a surface month name, memoised per distinct string."""
+    from modules.normalizers import normalize_month
+
+    return normalize_month(month, output_format="num")
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+# ===================================================================================
+# COMPACT ENTITY
+# ===================================================================================
+
+class CompactDateEntity:
+    """
+    Slotted date entity with small-int calendar/era/precision.
+
+    Args:
+        day (int, optional): Day of month
+        month (int, optional): Month number 1-12 (use ``from_components`` for names)
+        year (int, optional): Year in ``calendar``
+        weekday (int, optional): Weekday index, 0 = Sunday
+        century (int, optional): Century number
+        calendar: Calendar name, alias or :class:`CalendarCode`
+        era: Era string or :class:`EraCode`
+        precision: Precision name or :class:`PrecisionCode`; detected when omitted
+        confidence (float, optional): Confidence score 0.0-1.0
+        lang (str, optional): Language used for lazily resolved names
+    """
+
+    __slots__ = (
+        "day", "month", "year", "weekday", "century",
+        "calendar", "era", "precision", "confidence", "lang",
+    )
+
+    def __init__(self, day: Optional[int] = None, month: Optional[int] = None,
+                 year: Optional[int] = None, weekday: Optional[int] = None,
+                 century: Optional[int] = None, calendar=CalendarCode.UNKNOWN,
+                 era=EraCode.NONE, precision=None, confidence: Optional[float] = None,
+                 lang: Optional[str] = None):
+        self.day = day
+        self.month = month
+        self.year = year
+        self.weekday = weekday
+        self.century = century
+        self.calendar = CalendarCode.coerce(calendar)
+        self.era = EraCode.coerce(era)
+        self.precision = (
+            PrecisionCode.coerce(precision) if precision is not None else self.detect_precision()
+        )
+        self.confidence = confidence
+        self.lang = lang
+
+    @classmethod
+    def from_components(cls, components: Dict[str, Any], **kwargs) -> "CompactDateEntity":
+        """
+        Build an entity from a (normalised) match component dict, as returned by
+        ``normalize_date_output``. Month names are resolved to numbers once per
+        distinct surface string.
+        """
+        month = components.get("month")
+        if isinstance(month, str) and not month.strip().isdigit():
+            month = _month_number(month.strip())
+        era = components.get("era")
+        try:
+            era = EraCode.coerce(era)
+        except ValueError:
+            era = EraCode.NONE
+        return cls(
+            day=_to_int(components.get("day")),
+            month=_to_int(month),
+            year=_to_int(components.get("year")),
+            century=_to_int(components.get("century")),
+            calendar=components.get("calendar") or CalendarCode.UNKNOWN,
+            era=era,
+            **kwargs,
+        )
+
+    def detect_precision(self) -> PrecisionCode:
+        """Same rules as ``DateEntity.detect_precision`` on the integer fields."""
+        if self.year is not None:
+            if self.month is not None:
+                return PrecisionCode.EXACT if self.day is not None else PrecisionCode.MONTH
+            if self.day is None:
+                return PrecisionCode.YEAR
+        elif self.century is not None:
+            return PrecisionCode.CENTURY
+        return PrecisionCode.PARTIAL
+
+    # Lazily resolved names
+    # ===============================================================================
+    @property
+    def month_name(self) -> Optional[str]:
+        return month_name(self.calendar, self.month, self.lang or "en")
+
+    @property
+    def month_abbr(self) -> Optional[str]:
+        return month_name(self.calendar, self.month, self.lang or "en", abbr=True)
+
+    @property
+    def weekday_name(self) -> Optional[str]:
+        return weekday_name(self.weekday, self.lang or "en")
+
+    @property
+    def calendar_name(self) -> Optional[str]:
+        return self.calendar.label
+
+    def is_complete(self) -> bool:
+        """Day, month, year and era present (same rule as ``DateEntity.is_complete``)."""
+        return bool(self.day and self.month and self.year and self.era)
+
+    def astuple(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with enum fields rendered as names."""
+        return {
+            "day": self.day,
+            "month": self.month,
+            "year": self.year,
+            "weekday": self.weekday,
+            "century": self.century,
+            "calendar": self.calendar.label,
+            "era": None if self.era is EraCode.NONE else self.era.name,
+            "precision": self.precision.name.lower(),
+            "confidence": self.confidence,
+            "lang": self.lang,
+        }
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompactDateEntity):
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactDateEntity(day={self.day}, month={self.month}, year={self.year}, "
+            f"calendar={self.calendar.name}, era={self.era.name}, precision={self.precision.name})"
+        )
+
+
+# ===================================================================================
+# COLUMNAR BATCH
+# ===================================================================================
+
+# Sentinels for missing values in the typed arrays
+MISSING_INT = -1
+MISSING_YEAR = -(2 ** 31)
+MISSING_CONFIDENCE = float("nan")
+
+# Column name -> array typecode
+_BATCH_COLUMNS = {
+    "day": "b",
+    "month": "b",
+    "year": "i",
+    "weekday": "b",
+    "century": "h",
+    "calendar": "b",
+    "era": "b",
+    "precision": "b",
+    # Double, so confidences read back equal to the entity's float
+    "confidence": "d",
+    # Index into the batch's ``langs`` table
+    "lang_code": "b",
+}
+
+
+class DateEntityBatch:
+    """
+    Columnar store of date entities in parallel ``array.array`` columns.
+
+    Missing day/month/weekday/century are stored as ``MISSING_INT``, a missing
+    year as ``MISSING_YEAR`` and a missing confidence as NaN. The language of
+    every row is a code into ``langs``, so a batch can mix languages. Entities
+    are only materialised when indexed or iterated.
+
+    Args:
+        entities (Iterable[CompactDateEntity], optional): Initial content
+        lang (str, optional): Language of the entities appended without one
+    """
+
+    __slots__ = ("lang", "langs") + tuple(_BATCH_COLUMNS)
+
+    def __init__(self, entities: Optional[Iterable[CompactDateEntity]] = None, lang: Optional[str] = None):
+        self.lang = lang
+        self.langs: List[Optional[str]] = [lang]
+        for name, typecode in _BATCH_COLUMNS.items():
+            setattr(self, name, array(typecode))
+        if entities is not None:
+            self.extend(entities)
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def append(self, entity: CompactDateEntity) -> None:
+        """Append one entity."""
+        self.day.append(MISSING_INT if entity.day is None else entity.day)
+        self.month.append(MISSING_INT if entity.month is None else entity.month)
+        self.year.append(MISSING_YEAR if entity.year is None else entity.year)
+        self.weekday.append(MISSING_INT if entity.weekday is None else entity.weekday)
+        self.century.append(MISSING_INT if entity.century is None else entity.century)
+        self.calendar.append(entity.calendar)
+        self.era.append(entity.era)
+        self.precision.append(entity.precision)
+        self.confidence.append(MISSING_CONFIDENCE if entity.confidence is None else entity.confidence)
+        self.lang_code.append(self._lang_code(self.lang if entity.lang is None else entity.lang))
+
+    def _lang_code(self, lang: Optional[str]) -> int:
+        """Code of ``lang`` in ``langs``, added on first use."""
+        try:
+            return self.langs.index(lang)
+        except ValueError:
+            self.langs.append(lang)
+            return len(self.langs) - 1
+
+    def extend(self, entities: Iterable[CompactDateEntity]) -> None:
+        for entity in entities:
+            self.append(entity)
+
+    def __getitem__(self, index: int) -> CompactDateEntity:
+        """Materialise the entity at ``index``."""
+        def value(column, missing):
+            item = column[index]
+            return None if item == missing else item
+
+        confidence = self.confidence[index]
+        return CompactDateEntity(
+            day=value(self.day, MISSING_INT),
+            month=value(self.month, MISSING_INT),
+            year=value(self.year, MISSING_YEAR),
+            weekday=value(self.weekday, MISSING_INT),
+            century=value(self.century, MISSING_INT),
+            calendar=self.calendar[index],
+            era=self.era[index],
+            precision=self.precision[index],
+            confidence=None if confidence != confidence else confidence,
+            lang=self.langs[self.lang_code[index]],
+        )
+
+    def __iter__(self) -> Iterator[CompactDateEntity]:
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers."""
+        return sum(getattr(self, name).itemsize * len(self) for name in _BATCH_COLUMNS)
+
+    def to_numpy(self):
+        """Return the columns as a NumPy structured array (one copy)."""
+        import numpy as np
+
+        columns = {name: np.frombuffer(getattr(self, name), dtype=getattr(self, name).typecode)
+                   for name in _BATCH_COLUMNS}
+        batch = np.empty(len(self), dtype=[(name, column.dtype) for name, column in columns.items()])
+        for name, column in columns.items():
+            batch[name] = column
+        return batch
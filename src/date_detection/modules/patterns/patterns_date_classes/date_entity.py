@@ -58,6 +58,7 @@ if __name__ == "__main__":
 from date_entity import ParsedDate
 from modules.normalizers import normalize_month, normalize_era, normalize_weekday
 from data._load_data import DateMapping
+from modules.patterns.patterns_date_classes.date_format import compile_format
 
 # Module-level constants
 SUPPORTED_CALENDARS = {
@@ -77,6 +78,10 @@ PRECISION_LEVELS = {
     'partial': 'Some components missing'
 }
 
+def _conversion_method(result: Dict[str, Any]) -> str:
+    """Metadata label of the backend that produced a conversion result."""
+    return 'arithmetic' if result.get('method') == 'arithmetic' else 'csv_mapping'
+
 @dataclass
 class DateEntity(DateEntity):
     """
@@ -550,13 +555,18 @@ class DateEntity(DateEntity):
             return None
         return (self.year, self.month_num, self.day)
 
-    def get_hijri(self) -> 'DateEntity':
+    def get_hijri(self, method: str = 'auto') -> 'DateEntity':
         """
         Convert date to Hijri (Islamic) calendar system.
 
         Uses pre-calculated mapping data to convert from the current calendar
         system to the Hijri calendar. The conversion maintains accuracy by
-        using historical astronomical calculations.
+        using historical astronomical calculations. Dates outside the mapping
+        data are converted with calendar arithmetic.
+
+        Args:
+            method (str): 'auto', 'table' or 'arithmetic'
+                (see ``DateMapping.get_date_alternative_calendar``)
 
         Returns:
             DateEntity: New DateEntity instance in Hijri calendar system
@@ -584,12 +594,13 @@ class DateEntity(DateEntity):
         # Use DateMapping for conversion
         mapper = DateMapping()
         result = mapper.get_date_alternative_calendar(
-            self.calendar, self.day, self.month_num, self.year
+            self.calendar, self.day, self.month_num, self.year, method=method
         )
 
         if result is None:
             raise ValueError(f"Cannot convert date {self.day}/{self.month_num}/{self.year} "
-                           f"from {self.calendar} to Hijri: date not found in mapping data.")
+                           f"from {self.calendar} to Hijri: date does not exist "
+                           f"or is not in the mapping data.")
 
         hijri_data = result['hijri']
         return DateEntity(
@@ -606,17 +617,21 @@ class DateEntity(DateEntity):
             metadata={
                 **(self.metadata if self.metadata else {}),
                 'converted_from': self.calendar,
-                'conversion_method': 'csv_mapping',
+                'conversion_method': _conversion_method(result),
                 'original_date': f"{self.day}/{self.month_num}/{self.year}"
             }
         )
 
-    def get_gregorian(self) -> 'DateEntity':
+    def get_gregorian(self, method: str = 'auto') -> 'DateEntity':
         """
         Convert date to Gregorian calendar system.
 
         Converts the current date to the Gregorian calendar system using
-        pre-calculated mapping data for accuracy.
+        pre-calculated mapping data for accuracy, or calendar arithmetic
+        outside the mapping data.
+
+        Args:
+            method (str): 'auto', 'table' or 'arithmetic'
 
         Returns:
             DateEntity: New DateEntity instance in Gregorian calendar system
@@ -639,7 +654,7 @@ class DateEntity(DateEntity):
 
         mapper = DateMapping()
         result = mapper.get_date_alternative_calendar(
-            self.calendar, self.day, self.month_num, self.year
+            self.calendar, self.day, self.month_num, self.year, method=method
         )
 
         if result is None:
@@ -660,14 +675,17 @@ class DateEntity(DateEntity):
             metadata={
                 **(self.metadata if self.metadata else {}),
                 'converted_from': self.calendar,
-                'conversion_method': 'csv_mapping'
+                'conversion_method': _conversion_method(result)
             }
         )
 
-    def get_julian(self) -> 'DateEntity':
+    def get_julian(self, method: str = 'auto') -> 'DateEntity':
         """
         Convert date to Solar Hijri (Persian/Julian) calendar system.
 
+        Args:
+            method (str): 'auto', 'table' or 'arithmetic'
+
         Returns:
             DateEntity: New DateEntity instance in Solar Hijri calendar system
 
@@ -682,7 +700,7 @@ class DateEntity(DateEntity):
 
         mapper = DateMapping()
         result = mapper.get_date_alternative_calendar(
-            self.calendar, self.day, self.month_num, self.year
+            self.calendar, self.day, self.month_num, self.year, method=method
         )
 
         if result is None:
@@ -703,7 +721,7 @@ class DateEntity(DateEntity):
             metadata={
                 **(self.metadata if self.metadata else {}),
                 'converted_from': self.calendar,
-                'conversion_method': 'csv_mapping'
+                'conversion_method': _conversion_method(result)
             }
         )
 
@@ -791,65 +809,12 @@ class DateEntity(DateEntity):
             partial = DateEntity(month="March", year=2023)
             print(partial.strftime("%B %Y"))    # "March 2023"
             print(partial.strftime("%Y-%m-%d")) # "2023-03-??"
-        """
-        result = format_string
-
-        # Day formatting
-        if self.day:
-            result = result.replace('%d', f"{self.day:02d}")
-            result = result.replace('%e', str(self.day))
-        else:
-            result = result.replace('%d', '??')
-            result = result.replace('%e', '?')
-
-        # Month formatting
-        if self.month_num:
-            result = result.replace('%m', f"{self.month_num:02d}")
-            result = result.replace('%n', str(self.month_num))
-
-            # Get month names
-            full_month = normalize_month(self.month_num,
-                                       to_lang=self.lang or 'en',
-                                       to_calendar=self.calendar or 'gregorian',
-                                       output_format="full")
-            abbr_month = normalize_month(self.month_num,
-                                       to_lang=self.lang or 'en',
-                                       to_calendar=self.calendar or 'gregorian',
-                                       output_format="abbr")
-
-            result = result.replace('%B', full_month or '???')
-            result = result.replace('%b', abbr_month or '???')
-        else:
-            result = result.replace('%m', '??')
-            result = result.replace('%n', '?')
-            result = result.replace('%B', '???')
-            result = result.replace('%b', '???')
-
-        # Year formatting
-        if self.year:
-            result = result.replace('%Y', str(self.year))
-            result = result.replace('%y', f"{abs(self.year) % 100:02d}")
-            result = result.replace('%C', str((abs(self.year) // 100) + 1))
-        else:
-            result = result.replace('%Y', '????')
-            result = result.replace('%y', '??')
-            result = result.replace('%C', '??')
 
-        # Weekday formatting
-        if self.weekday:
-            result = result.replace('%A', self.weekday)
-            result = result.replace('%a', self.weekday[:3] if len(self.weekday) >= 3 else self.weekday)
-        else:
-            result = result.replace('%A', '???')
-            result = result.replace('%a', '???')
-
-        # Extension formatting
-        result = result.replace('%E', self.era or '')
-        result = result.replace('%S', self.calendar or '')
-        result = result.replace('%P', self.precision or '')
-        result = result.replace('%%', '%')
-
-        return result
+        Use ``strftime_many`` from ``date_format`` to render many entities
+        with the same format string.
+        """
+        # Parsed once per format string; month names only looked up for %B/%b
+        return compile_format(format_string).render_entity(self)
 
     def get_readable(self) -> str:
         """
@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Fri Aug 08 09:36:12 2025
+
+@author: m.lotfi
+@description: Precompiled strftime-style format plans for date entities.
+
+A format string is parsed once into a tuple of literal and directive ops
+(``compile_format`` is memoised), so rendering is a single pass over the ops.
+Month and weekday names are only looked up when the plan contains ``%B``,
+``%b``, ``%A`` or ``%a``, and they come from the precomputed name tables of
+``compact_entity`` instead of ``normalize_month``.
+
+Supported directives are those of ``DateEntity.strftime``:
+``%d %e %m %n %b %B %y %Y %C %A %a %E %S %P %%``. Unknown directives are
+kept verbatim.
+
+Example::
+
+    plan = compile_format("%d %B %Y %E")
+    plan.render_entity(entity)                  # "15 Ramadan 1445 AH"
+    strftime_many(batch, "%Y-%m-%d")            # one string per entity
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+from functools import lru_cache
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from modules.patterns.patterns_date_classes.compact_entity import (
+    CalendarCode,
+    EraCode,
+    PrecisionCode,
+    CompactDateEntity,
+    DateEntityBatch,
+    MISSING_INT,
+    MISSING_YEAR,
+    month_name,
+    weekday_name,
+)
+
+# ===================================================================================
+# CONSTANTS
+# ===================================================================================
+
+DIRECTIVES = frozenset("deEmnbByYCAaSP%")
+FORMAT_CACHE_SIZE = 256
+
+# Directives that need a name table lookup
+NAME_DIRECTIVES = frozenset("bBAa")
+
+# ===================================================================================
+# FIELDS
+# ===================================================================================
+
+class FormatFields(NamedTuple):
+    """
+    Date fields a plan renders from.
+
+    ``weekday`` is either a weekday name (``DateEntity``) or an index with
+    0 = Sunday (``CompactDateEntity``); the other fields are plain values.
+    """
+    day: Optional[int] = None
+    month: Optional[int] = None
+    year: Optional[int] = None
+    weekday: Union[str, int, None] = None
+    era: Optional[str] = None
+    calendar: Optional[str] = None
+    precision: Optional[str] = None
+    lang: Optional[str] = None
+
+
+def entity_fields(entity: Any) -> FormatFields:
+    """Extract the format fields of a ``DateEntity`` or ``CompactDateEntity``."""
+    if isinstance(entity, CompactDateEntity):
+        return FormatFields(
+            day=entity.day,
+            month=entity.month,
+            year=entity.year,
+            weekday=entity.weekday,
+            era=None if entity.era is EraCode.NONE else entity.era.name,
+            calendar=entity.calendar.label,
+            precision=entity.precision.name.lower(),
+            lang=entity.lang,
+        )
+    return FormatFields(
+        day=entity.day,
+        month=getattr(entity, "month_num", None),
+        year=entity.year,
+        weekday=entity.weekday,
+        era=entity.era,
+        calendar=entity.calendar,
+        precision=entity.precision,
+        lang=entity.lang,
+    )
+
+
+# ===================================================================================
+# DIRECTIVE RENDERERS
+# ===================================================================================
+
+def _month_name(fields: FormatFields, abbr: bool) -> str:
+    try:
+        calendar = CalendarCode.coerce(fields.calendar or "gregorian")
+    except ValueError:
+        return "???"
+    return month_name(calendar, fields.month, fields.lang or "en", abbr=abbr) or "???"
+
+
+def _weekday(fields: FormatFields, abbr: bool) -> str:
+    weekday = fields.weekday
+    if isinstance(weekday, int):
+        return weekday_name(weekday, fields.lang or "en", abbr=abbr) or "???"
+    if not weekday:
+        return "???"
+    return weekday[:3] if abbr else weekday
+
+
+_RENDERERS = {
+    "d": lambda f: f"{f.day:02d}" if f.day else "??",
+    "e": lambda f: str(f.day) if f.day else "?",
+    "m": lambda f: f"{f.month:02d}" if f.month else "??",
+    "n": lambda f: str(f.month) if f.month else "?",
+    "B": lambda f: _month_name(f, abbr=False) if f.month else "???",
+    "b": lambda f: _month_name(f, abbr=True) if f.month else "???",
+    "Y": lambda f: str(f.year) if f.year else "????",
+    "y": lambda f: f"{abs(f.year) % 100:02d}" if f.year else "??",
+    "C": lambda f: str(abs(f.year) // 100 + 1) if f.year else "??",
+    "A": lambda f: _weekday(f, abbr=False),
+    "a": lambda f: _weekday(f, abbr=True),
+    "E": lambda f: f.era or "",
+    "S": lambda f: f.calendar or "",
+    "P": lambda f: f.precision or "",
+    "%": lambda f: "%",
+}
+
+# ===================================================================================
+# FORMAT PLAN
+# ===================================================================================
+
+class FormatPlan:
+    """
+    Parsed format string.
+
+    Attributes:
+        format_string (str): Source format string
+        ops (Tuple[Tuple[bool, str], ...]): ``(is_directive, value)`` pairs;
+            literal runs are merged
+        directives (frozenset): Directive characters used by the plan
+    """
+
+    __slots__ = ("format_string", "ops", "directives")
+
+    def __init__(self, format_string: str):
+        self.format_string = format_string
+        ops: List[Tuple[bool, str]] = []
+        literal: List[str] = []
+        i, n = 0, len(format_string)
+        while i < n:
+            char = format_string[i]
+            if char == "%" and i + 1 < n and format_string[i + 1] in DIRECTIVES:
+                if literal:
+                    ops.append((False, "".join(literal)))
+                    literal = []
+                ops.append((True, format_string[i + 1]))
+                i += 2
+            else:
+                literal.append(char)
+                i += 1
+        if literal:
+            ops.append((False, "".join(literal)))
+        self.ops = tuple(ops)
+        self.directives = frozenset(value for is_directive, value in ops if is_directive)
+
+    @property
+    def needs_names(self) -> bool:
+        """True when rendering looks up month or weekday names."""
+        return bool(self.directives & NAME_DIRECTIVES)
+
+    def render(self, fields: FormatFields) -> str:
+        """Render one set of fields."""
+        return "".join(
+            _RENDERERS[value](fields) if is_directive else value
+            for is_directive, value in self.ops
+        )
+
+    def render_entity(self, entity: Any) -> str:
+        """Render a ``DateEntity`` or ``CompactDateEntity``."""
+        return self.render(entity_fields(entity))
+
+    def render_batch(self, batch: DateEntityBatch) -> List[str]:
+        """
+        Render every row of a ``DateEntityBatch`` straight from its columns,
+        without materialising entities.
+        """
+        calendars = [code.label for code in CalendarCode]
+        eras = [None if code is EraCode.NONE else code.name for code in EraCode]
+        precisions = [code.name.lower() for code in PrecisionCode]
+
+        def value(item, missing):
+            return None if item == missing else item
+
+        render = self.render
+        return [
+            render(FormatFields(
+                day=value(day, MISSING_INT),
+                month=value(month, MISSING_INT),
+                year=value(year, MISSING_YEAR),
+                weekday=value(weekday, MISSING_INT),
+                era=eras[era],
+                calendar=calendars[calendar],
+                precision=precisions[precision],
+                lang=batch.langs[lang_code],
+            ))
+            for day, month, year, weekday, era, calendar, precision, lang_code in zip(
+                batch.day, batch.month, batch.year, batch.weekday,
+                batch.era, batch.calendar, batch.precision, batch.lang_code,
+            )
+        ]
+
+    def __repr__(self) -> str:
+        return f"FormatPlan({self.format_string!r})"
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def compile_format(format_string: str) -> FormatPlan:
+    """
+    Parse ``format_string`` into a ``FormatPlan``, memoised per format string.
+
+    Args:
+        format_string (str): Format string with % codes
+
+    Returns:
+        FormatPlan: Reusable plan
+    """
+    return FormatPlan(format_string)
+
+
+def strftime_many(entities: Union[DateEntityBatch, Iterable[Any]], format_string: str) -> List[str]:
+    """
+    Render many entities with one compiled plan.
+
+    Args:
+        entities: ``DateEntityBatch`` or iterable of ``DateEntity`` /
+            ``CompactDateEntity``
+        format_string (str): Format string with % codes
+
+    Returns:
+        List[str]: One formatted string per entity
+    """
+    plan = compile_format(format_string)
+    if isinstance(entities, DateEntityBatch):
+        return plan.render_batch(entities)
+    return [plan.render_entity(entity) for entity in entities]
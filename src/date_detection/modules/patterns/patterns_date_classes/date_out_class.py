@@ -20,6 +20,11 @@ from modules.normalizers import normalize_month
 from modules.normalizers import normalize_era
 from modules.normalizers import normalize_weekday
 from data._load_data import DateMapping
+from data._load_data.calendar_table import CalendarTable, get_calendar_table
+from modules.patterns.patterns_date_classes.interval_index import range_span, alternative_ordinal
+
+# Marker for "ordinal span not computed yet"
+_UNRESOLVED = object()
 
 '''
 Examples:
@@ -931,38 +936,73 @@ class DateRange:
     end_date: DateAlternative
     range_type: Optional[str] = None  # "exact", "approximate", "seasonal", etc.
 
+    def ordinal_span(self, table: Optional[CalendarTable] = None) -> Optional[Tuple[int, int]]:
+        """
+        Half-open day-ordinal interval ``[start, end)`` of the range.
+
+        Both ends are resolved through the calendar mapping table, so the two
+        ends may be written in different calendars. The result is cached per
+        range; None when an end is partial, outside the table or reversed.
+        """
+        if table is None:
+            cached = self.__dict__.get('_ordinal_span', _UNRESOLVED)
+            if cached is _UNRESOLVED:
+                cached = self.__dict__['_ordinal_span'] = range_span(self)
+            return cached
+        return range_span(self, table)
+
     def is_single_day(self) -> bool:
         """Check if this represents a single day (start == end)."""
-        start_primary = self.start_date.primary
-        end_primary = self.end_date.primary
-
-        return (start_primary.day == end_primary.day and
-                start_primary.month == end_primary.month and
-                start_primary.year == end_primary.year)
+        span = self.ordinal_span()
+        return span is not None and span[1] - span[0] == 1
 
     def get_duration_estimate(self) -> Optional[dict]:
         """
-        Estimate duration between start and end dates.
-        Returns dict with 'days', 'months', 'years' estimates.
-        """
-        start = self.start_date.primary
-        end = self.end_date.primary
+        Exact duration between start and end dates.
 
-        if not (start.is_complete() and end.is_complete()):
+        Returns dict with 'days' (exact day count from start to end), plus
+        whole 'months' and 'years' elapsed in the start date's calendar.
+        """
+        span = self.ordinal_span()
+        if span is None:
             return None
+        start, end = span[0], span[1] - 1
 
-        # This is a simplified calculation - real implementation would need
-        # proper date arithmetic considering calendar systems
-        year_diff = (end.year or 0) - (start.year or 0)
-        month_diff = (end.month or 0) - (start.month or 0)
-        day_diff = (end.day or 0) - (start.day or 0)
+        table = get_calendar_table()
+        calendar = getattr(self.start_date, 'raw', self.start_date).calendar or 'gregorian'
+        start_day, start_month, start_year = table.fields_at(calendar, start)
+        end_day, end_month, end_year = table.fields_at(calendar, end)
+        months = (end_year - start_year) * 12 + (end_month - start_month) - (1 if end_day < start_day else 0)
 
         return {
-            'years': year_diff,
-            'months': month_diff,
-            'days': day_diff
+            'years': months // 12,
+            'months': months,
+            'days': end - start
         }
 
+    def contains(self, other: Any) -> bool:
+        """
+        Check whether a date, day ordinal or another range lies within this range.
+
+        Args:
+            other: Day ordinal (int), date entity / ``DateAlternative``, or ``DateRange``
+        """
+        span = self.ordinal_span()
+        if span is None:
+            return False
+        if isinstance(other, DateRange):
+            other_span = other.ordinal_span()
+            return other_span is not None and span[0] <= other_span[0] and other_span[1] <= span[1]
+        ordinal = other if isinstance(other, int) else alternative_ordinal(other)
+        return ordinal is not None and span[0] <= ordinal < span[1]
+
+    def overlaps(self, other: 'DateRange') -> bool:
+        """Check whether two ranges share at least one day."""
+        span, other_span = self.ordinal_span(), other.ordinal_span()
+        if span is None or other_span is None:
+            return False
+        return span[0] < other_span[1] and other_span[0] < span[1]
+
 
 
 @dataclass
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sat Aug 09 10:48:27 2025
+
+@author: m.lotfi
+@description: Ordinal day intervals for date ranges and a bulk interval index.
+
+Dates of any calendar are mapped to one day ordinal through ``CalendarTable``
+(``date.toordinal()`` numbering), so a range becomes a half-open integer
+interval ``[start, end)``. Durations, containment and overlap are then integer
+comparisons, independent of the calendars the two ends were written in.
+
+``OrdinalIntervalIndex`` stores many intervals as NumPy arrays sorted by start,
+with the maximum end of every block of intervals, so stabbing ("which ranges
+cover day X"), overlap and containment queries only visit blocks that can
+contain a hit.
+
+Example::
+
+    index = OrdinalIntervalIndex.from_ranges(ranges, ids=doc_ids)
+    day = get_calendar_table().to_ordinal('hijri', 1, 9, 1440)
+    index.stab(day)                  # ids of ranges covering 1 Ramadan 1440
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from data._load_data.calendar_table import CalendarTable, get_calendar_table
+
+# ===================================================================================
+# CONSTANTS
+# ===================================================================================
+
+DEFAULT_BLOCK_SIZE = 64
+
+# ===================================================================================
+# ORDINALS OF ENTITIES AND RANGES
+# ===================================================================================
+
+def month_number(month: Any) -> Optional[int]:
+    """Month number of an int, digit string or month name (any language)."""
+    if month is None or isinstance(month, int):
+        return month
+    month = str(month).strip()
+    if month.isdigit():
+        return int(month)
+    from modules.normalizers import normalize_month
+
+    return normalize_month(month, output_format="num")
+
+
+def entity_ordinal(entity: Any, table: Optional[CalendarTable] = None) -> Optional[int]:
+    """
+    Day ordinal of a complete date entity (``DateEntity``, ``ParsedDate``,
+    ``CompactDateEntity`` or any object with day/month/year/calendar).
+
+    Args:
+        entity: Date entity; a missing calendar means Gregorian
+        table (CalendarTable, optional): Conversion table, defaults to the shared one
+
+    Returns:
+        Optional[int]: Ordinal, or None for partial dates and dates outside the table
+    """
+    day = getattr(entity, "day", None)
+    month = month_number(getattr(entity, "month_num", None) or getattr(entity, "month", None))
+    year = getattr(entity, "year", None)
+    if not (day and month and year):
+        return None
+    calendar = getattr(entity, "calendar", None)
+    calendar = getattr(calendar, "label", calendar) or "gregorian"
+    return (table or get_calendar_table()).to_ordinal(calendar, day, month, year)
+
+
+def alternative_ordinal(alternative: Any, table: Optional[CalendarTable] = None) -> Optional[int]:
+    """
+    Day ordinal of a ``DateAlternative``: its ``raw`` date, else its ``alternative``.
+    Plain entities are accepted as well.
+    """
+    if hasattr(alternative, "raw"):
+        ordinal = entity_ordinal(alternative.raw, table)
+        if ordinal is None and getattr(alternative, "alternative", None) is not None:
+            ordinal = entity_ordinal(alternative.alternative, table)
+        return ordinal
+    return entity_ordinal(alternative, table)
+
+
+def range_span(date_range: Any, table: Optional[CalendarTable] = None) -> Optional[Tuple[int, int]]:
+    """
+    Half-open ordinal interval ``[start, end)`` of a ``DateRange``.
+
+    The end day is included in the range, so ``end = ordinal(end_date) + 1``.
+    Returns None when either end cannot be resolved or the range is reversed.
+    """
+    start = alternative_ordinal(date_range.start_date, table)
+    end = alternative_ordinal(date_range.end_date, table)
+    if start is None or end is None or end < start:
+        return None
+    return start, end + 1
+
+
+# ===================================================================================
+# BULK INTERVAL INDEX
+# ===================================================================================
+
+class OrdinalIntervalIndex:
+    """
+    Static index of half-open ordinal intervals.
+
+    Args:
+        starts (Sequence[int]): Interval starts (inclusive)
+        ends (Sequence[int]): Interval ends (exclusive)
+        ids (Sequence, optional): Payload per interval (document ids, ...);
+            defaults to the insertion position
+        block_size (int): Intervals per block of the max-end summary
+    """
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int],
+                 ids: Optional[Sequence[Any]] = None, block_size: int = DEFAULT_BLOCK_SIZE):
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if starts.shape != ends.shape or starts.ndim != 1:
+            raise ValueError("starts and ends must be 1-D arrays of the same length")
+        if np.any(ends < starts):
+            raise ValueError("Interval ends must not precede their starts")
+        ids = np.arange(len(starts)) if ids is None else np.asarray(ids)
+        if len(ids) != len(starts):
+            raise ValueError("ids must have one entry per interval")
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1")
+
+        order = np.argsort(starts, kind="stable")
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.ids = ids[order]
+        self.block_size = block_size
+        self.block_max_end = (
+            np.maximum.reduceat(self.ends, np.arange(0, len(self.ends), block_size))
+            if len(self.ends) else np.empty(0, dtype=np.int64)
+        )
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[Any], ids: Optional[Iterable[Any]] = None,
+                    table: Optional[CalendarTable] = None, **kwargs) -> "OrdinalIntervalIndex":
+        """
+        Build from ``DateRange`` objects; ranges that cannot be resolved are skipped.
+
+        Args:
+            ranges: ``DateRange`` objects (or ``(start, end)`` ordinal tuples)
+            ids: Payload per range, defaults to the range position
+            table (CalendarTable, optional): Conversion table
+        """
+        starts, ends, kept = [], [], []
+        ids = iter(ids) if ids is not None else None
+        for position, date_range in enumerate(ranges):
+            payload = next(ids) if ids is not None else position
+            span = date_range if isinstance(date_range, tuple) else range_span(date_range, table)
+            if span is None:
+                continue
+            starts.append(span[0])
+            ends.append(span[1])
+            kept.append(payload)
+        return cls(starts, ends, np.array(kept, dtype=object) if kept else None, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _candidates(self, limit: int, min_end: int) -> np.ndarray:
+        """Positions among the first ``limit`` intervals whose end exceeds ``min_end``."""
+        if limit <= 0:
+            return np.empty(0, dtype=np.int64)
+        n_blocks = -(-limit // self.block_size)
+        blocks = np.flatnonzero(self.block_max_end[:n_blocks] > min_end)
+        if not len(blocks):
+            return np.empty(0, dtype=np.int64)
+        positions = (blocks[:, None] * self.block_size + np.arange(self.block_size)).ravel()
+        positions = positions[positions < limit]
+        return positions[self.ends[positions] > min_end]
+
+    def stab_positions(self, ordinal: int) -> np.ndarray:
+        """Sorted-order positions of the intervals containing ``ordinal``."""
+        limit = int(np.searchsorted(self.starts, ordinal, side="right"))
+        return self._candidates(limit, ordinal)
+
+    def overlap_positions(self, start: int, end: int) -> np.ndarray:
+        """Sorted-order positions of the intervals sharing a day with ``[start, end)``."""
+        if end <= start:
+            return np.empty(0, dtype=np.int64)
+        limit = int(np.searchsorted(self.starts, end, side="left"))
+        return self._candidates(limit, start)
+
+    def within_positions(self, start: int, end: int) -> np.ndarray:
+        """Sorted-order positions of the intervals lying inside ``[start, end)``."""
+        lo = int(np.searchsorted(self.starts, start, side="left"))
+        hi = int(np.searchsorted(self.starts, end, side="left"))
+        return lo + np.flatnonzero(self.ends[lo:hi] <= end)
+
+    def containing_positions(self, start: int, end: int) -> np.ndarray:
+        """Sorted-order positions of the intervals covering all of ``[start, end)``."""
+        limit = int(np.searchsorted(self.starts, start, side="right"))
+        return self._candidates(limit, end - 1)
+
+    def stab(self, ordinal: int) -> np.ndarray:
+        """Ids of the intervals containing day ``ordinal``."""
+        return self.ids[self.stab_positions(ordinal)]
+
+    def overlapping(self, start: int, end: int) -> np.ndarray:
+        """Ids of the intervals overlapping ``[start, end)``."""
+        return self.ids[self.overlap_positions(start, end)]
+
+    def within(self, start: int, end: int) -> np.ndarray:
+        """Ids of the intervals lying inside ``[start, end)``."""
+        return self.ids[self.within_positions(start, end)]
+
+    def containing(self, start: int, end: int) -> np.ndarray:
+        """Ids of the intervals covering all of ``[start, end)``."""
+        return self.ids[self.containing_positions(start, end)]
@@ -567,10 +567,11 @@ class MonthYearPatterns(PatternValidator):
                 errors in the pattern construction process.
         """
 
-        # Base numeric month/year pattern
+        # Base numeric month/year pattern; month and year are set apart by a
+        # separator or a space, so "1445" is not month 14 of year 45
         self.numeric = (
-            rf"{self.numeric_patterns.month}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.month}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.numeric_patterns.year}"
         )
 
@@ -581,14 +582,14 @@ class MonthYearPatterns(PatternValidator):
 
         # Build Hijri month-year patterns
         self.hijri['numeric'] = (
-            rf"{self.numeric_patterns.month}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.month}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.hijri['numeric']}"
         )
 
         self.hijri['numeric_optional'] = (
-            rf"{self.numeric_patterns.month}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.month}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.hijri['numeric_optional']}"
         )
 
@@ -608,14 +609,14 @@ class MonthYearPatterns(PatternValidator):
 
         # Build Gregorian month-year patterns
         self.gregorian['numeric'] = (
-            rf"{self.numeric_patterns.month}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.month}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.gregorian['numeric']}"
         )
 
         self.gregorian['numeric_optional'] = (
-            rf"{self.numeric_patterns.month}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.month}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.gregorian['numeric_optional']}"
         )
 
@@ -635,14 +636,14 @@ class MonthYearPatterns(PatternValidator):
 
         # Build julian month-year patterns
         self.julian['numeric'] = (
-            rf"{self.numeric_patterns.month}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.month}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.julian['numeric']}"
         )
 
         self.julian['numeric_optional'] = (
-            rf"{self.numeric_patterns.month}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.month}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.julian['numeric_optional']}"
         )
 
@@ -807,10 +808,10 @@ class DayMonthYearPatterns(PatternValidator):
                 typically indicating issues in the complex pattern assembly.
         """
 
-        # Base numeric day/month/year pattern
+        # Base numeric day/month/year pattern (a separator or a space after the day)
         self.numeric = (
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.month_year_patterns.numeric}"
         )
 
@@ -821,14 +822,14 @@ class DayMonthYearPatterns(PatternValidator):
 
         # Build Hijri day-month-year patterns
         self.hijri['numeric'] = (
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.month_year_patterns.hijri['numeric']}"
         )
 
         self.hijri['numeric_optional'] = (
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.month_year_patterns.hijri['numeric_optional']}"
         )
 
@@ -841,8 +842,8 @@ class DayMonthYearPatterns(PatternValidator):
         self.hijri['named2'] = (
             rf"{self.month_patterns.hijri}"
             rf"{self.indicator_patterns.separator}?\s*"
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.hijri['numeric_optional']}"
         )
 
@@ -860,14 +861,14 @@ class DayMonthYearPatterns(PatternValidator):
 
         # Build Gregorian day-month-year patterns
         self.gregorian['numeric'] = (
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.month_year_patterns.gregorian['numeric']}"
         )
 
         self.gregorian['numeric_optional'] = (
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.month_year_patterns.gregorian['numeric_optional']}"
         )
 
@@ -880,8 +881,8 @@ class DayMonthYearPatterns(PatternValidator):
         self.gregorian['named2'] = (
             rf"{self.month_patterns.gregorian}"
             rf"{self.indicator_patterns.separator}?\s*"
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.gregorian['numeric_optional']}"
         )
 
@@ -899,14 +900,14 @@ class DayMonthYearPatterns(PatternValidator):
 
         # Build julian day-month-year patterns
         self.julian['numeric'] = (
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.month_year_patterns.julian['numeric']}"
         )
 
         self.julian['numeric_optional'] = (
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.month_year_patterns.julian['numeric_optional']}"
         )
 
@@ -919,8 +920,8 @@ class DayMonthYearPatterns(PatternValidator):
         self.julian['named2'] = (
             rf"{self.month_patterns.julian}"
             rf"{self.indicator_patterns.separator}?\s*"
-            rf"{self.numeric_patterns.day}\s*"
-            rf"{self.indicator_patterns.separator}?\s*"
+            rf"{self.numeric_patterns.day}"
+            rf"(?:\s*{self.indicator_patterns.separator}\s*|\s+)"
             rf"{self.year_patterns.julian['numeric_optional']}"
         )
 
@@ -2,6 +2,11 @@
 # ========================
 import re
 
+try:
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
 
 class PatternValidator:
     """Mixin providing regex pattern validation and compilation checking.
@@ -57,7 +62,9 @@ class PatternValidator:
         
         1. Iterates through all non-private instance attributes
         2. Identifies string attributes using :meth:`_looks_like_regex`
-        3. Attempts compilation with ``re.IGNORECASE | re.UNICODE`` flags
+        3. Parses them with ``re.IGNORECASE | re.UNICODE`` flags (syntax check
+           only: no compiled copy is built and thrown away; the tiers compile
+           each pattern once through the pattern registry)
         4. Collects and reports all validation errors with context
         
         Raises:
@@ -80,7 +87,7 @@ class PatternValidator:
             # Validate string attributes that look like regex patterns
             if isinstance(attr_value, str) and self._looks_like_regex(attr_value):
                 try:
-                    re.compile(attr_value, flags=re.IGNORECASE | re.UNICODE)
+                    _sre_parse.parse(attr_value, re.IGNORECASE | re.UNICODE)
                 except re.error as e:
                     raise ValueError(f"Invalid regex pattern in {attr_name}: {e}")
     
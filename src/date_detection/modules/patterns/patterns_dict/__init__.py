@@ -8,6 +8,7 @@ from modules.patterns.patterns_dict.get_date_unknown_calender_patterns import ge
 from modules.patterns.patterns_dict.get_date_mixed_patterns import get_date_mixed_patterns
 from modules.patterns.patterns_dict.get_date_components_patterns import get_date_components_patterns
 from modules.patterns.patterns_dict.get_date_numeric_words_pattern import get_date_numeric_words_pattern
+from modules.patterns.patterns_dict.group_maps import derive_group_maps, fill_group_maps
 
 __all__ = [
     'get_date_basic_patterns', 
@@ -15,6 +16,8 @@ __all__ = [
     'get_date_unknown_calender_patterns', 
     'get_date_mixed_patterns', 
     'get_date_components_patterns',
-    "get_date_numeric_words_pattern"
+    "get_date_numeric_words_pattern",
+    "derive_group_maps",
+    "fill_group_maps"
 ]
 
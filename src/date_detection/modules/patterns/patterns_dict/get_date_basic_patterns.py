@@ -8,6 +8,9 @@ if __name__ == "__main__":
     add_modules_to_sys_path()
 
 import re
+
+from modules.regex_patterns.pattern_registry import compile_pattern
+
 # All date patterns
 from modules.patterns.patterns_date_classes.date_patterns import DatePatterns
 
@@ -20,7 +23,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
         },
         "patterns": [
             {  # Pattern 0 - Day/Month/Year with Weekday Prefix
-                "pattern": re.compile(date_patterns.natural_language.numeric, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.natural_language.numeric, flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.natural_language.numeric",
                 "description": "Weekday-prefixed numeric date format - weekday can help validate calendar accuracy",
                 "examples": [
@@ -34,7 +37,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 "date": { "weekday": 1, "day": 2,  "month": 3, "year": 4, "century": None, "era": None, "calendar": ""},
             },
             {  # Pattern 1 - Basic Hijri Year with Era Marker
-                "pattern": re.compile(date_patterns.yy.hijri['numeric'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.yy.hijri['numeric'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.yy.hijri.numeric",
                 "description": "Hijri year with explicit era marker - unambiguous calendar identification",
                 "examples": [
@@ -56,7 +59,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 2 - Basic Gregorian Year with Era Marker
-                "pattern": re.compile(date_patterns.yy.gregorian['numeric'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.yy.gregorian['numeric'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.yy.gregorian.numeric",
                 "description": "Gregorian year with explicit era marker - unambiguous calendar identification",
                 "examples": [
@@ -78,7 +81,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 3 - Basic julian Year with Era Marker
-                "pattern": re.compile(date_patterns.yy.julian['numeric'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.yy.julian['numeric'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.yy.julian.numeric",
                 "description": "julian/Solar Hijri year with explicit era marker - unambiguous calendar identification",
                 "examples": [
@@ -101,7 +104,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
             },
             # ================================================= #
             {  # Pattern 4 - Hijri Month/Year with Era Marker
-                "pattern": re.compile(date_patterns.mm_yy.hijri['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.mm_yy.hijri['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.mm_yy.hijri.combined",
                 "description": "Hijri month/year with explicit era marker - supports both numeric and named months",
                 "examples": [
@@ -123,7 +126,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 5 - Gregorian Month/Year with Era Marker
-                "pattern": re.compile(date_patterns.mm_yy.gregorian['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.mm_yy.gregorian['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.mm_yy.gregorian.combined",
                 "description": "Gregorian month/year with explicit era marker - supports Arabic and English month names",
                 "examples": [
@@ -145,7 +148,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 6 - julian Month/Year with Era Marker
-                "pattern": re.compile(date_patterns.mm_yy.julian['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.mm_yy.julian['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.mm_yy.julian.combined",
                 "description": "julian month/year with explicit era marker - supports Persian month names",
                 "examples": [
@@ -168,7 +171,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
             },
             # ===================================================== #
             {  # Pattern 7 - Complete Hijri Date with Era Marker
-                "pattern": re.compile(date_patterns.dd_mm_yy.hijri['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dd_mm_yy.hijri['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd_mm_yy.hijri.combined",
                 "description": "Complete Hijri date with day/month/year and explicit era marker",
                 "examples": [
@@ -190,7 +193,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 8 - Complete Gregorian Date with Era Marker
-                "pattern": re.compile(date_patterns.dd_mm_yy.gregorian['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dd_mm_yy.gregorian['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd_mm_yy.gregorian.combined",
                 "description": "Complete Gregorian date with day/month/year and explicit era marker",
                 "examples": [
@@ -212,7 +215,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 9 - Complete julian Date with Era Marker
-                "pattern": re.compile(date_patterns.dd_mm_yy.julian['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dd_mm_yy.julian['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd_mm_yy.julian.combined",
                 "description": "Complete julian date with day/month/year and explicit era marker",
                 "examples": [
@@ -237,7 +240,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
 
             # ===================================================== #
             {  # Pattern 7 - Complete Hijri Date with Era Marker
-                "pattern": re.compile(date_patterns.dd_mm_yy.hijri['named'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dd_mm_yy.hijri['named'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd_mm_yy.hijri.named",
                 "description": "Complete Hijri date with day/month/year and explicit era marker",
                 "examples": [
@@ -259,7 +262,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 8 - Complete Gregorian Date with Era Marker
-                "pattern": re.compile(date_patterns.dd_mm_yy.gregorian['named'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dd_mm_yy.gregorian['named'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd_mm_yy.gregorian.named",
                 "description": "Complete Gregorian date with day/month/year and explicit era marker",
                 "examples": [
@@ -281,7 +284,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 9 - Complete julian Date with Era Marker
-                "pattern": re.compile(date_patterns.dd_mm_yy.julian['named'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dd_mm_yy.julian['named'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd_mm_yy.julian.named",
                 "description": "Complete julian date with day/month/year and explicit era marker",
                 "examples": [
@@ -308,7 +311,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
 
             # ===================================================== #
             {  # Pattern 10 - Natural Language Hijri Date
-                "pattern": re.compile(date_patterns.natural_language.hijri['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.natural_language.hijri['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.natural_language.hijri.combined",
                 "description": "Natural language Hijri date with weekday, day, month name, year, and era marker",
                 "examples": [
@@ -330,7 +333,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 11 - Natural Language Gregorian Date
-                "pattern": re.compile(date_patterns.natural_language.gregorian['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.natural_language.gregorian['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.natural_language.gregorian.combined",
                 "description": "Natural language Gregorian date with weekday, day, month name, year, and era marker",
                 "examples": [
@@ -352,7 +355,7 @@ def get_date_basic_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 12 - Natural Language julian Date
-                "pattern": re.compile(date_patterns.natural_language.julian['combined'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.natural_language.julian['combined'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.natural_language.julian.combined",
                 "description": "Natural language julian date with weekday, day, month name, year, and era marker",
                 "examples": [
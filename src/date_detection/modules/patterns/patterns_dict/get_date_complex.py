@@ -8,6 +8,10 @@ if __name__ == "__main__":
     add_modules_to_sys_path()
 
 import re
+
+from modules.regex_patterns.pattern_registry import compile_pattern
+from modules.patterns.patterns_dict.group_maps import fill_group_maps
+
 # All date patterns
 from modules.patterns.patterns_date_classes.date_patterns import (
     DatePatterns
@@ -22,7 +26,7 @@ def get_date_complex(date_patterns: DatePatterns):
         },
         "patterns": [
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.mixed",
                 "description": "Matches a range from Hijri year to Hijri year",
                 "examples": [
@@ -39,7 +43,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.mixed",
                 "description": "Matches a range from Gregorian year to Gregorian year",
                 "examples": [
@@ -56,7 +60,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.mixed_parenthetical",
                 "description": "Matches a range from Hijri year to Hijri year with parentheses for the second year",
                 "examples": [
@@ -72,7 +76,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.mixed_parenthetical",
                 "description": "",
                 "examples": [
@@ -90,7 +94,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -105,7 +109,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -122,7 +126,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.mixed_alternative",
                 "description": "",
                 "examples": [
@@ -137,7 +141,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.mixed_alternative",
                 "description": "",
                 "examples": [
@@ -152,7 +156,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.mixed_alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -167,7 +171,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.mixed_alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -183,7 +187,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -198,7 +202,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -213,7 +217,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.alternative",
                 "description": "",
                 "examples": [
@@ -228,7 +232,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.alternative",
                 "description": "",
                 "examples": [
@@ -244,7 +248,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -259,7 +263,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -274,7 +278,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.hijri.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -289,7 +293,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_yy.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_yy.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_yy.gregorian.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -304,7 +308,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.mixed",
                 "description": "",
                 "examples": [
@@ -323,7 +327,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.mixed",
                 "description": "",
                 "examples": [
@@ -344,7 +348,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.mixed_parenthetical",
                 "description": "",
                 "examples": [
@@ -362,7 +366,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.mixed_parenthetical",
                 "description": "",
                 "examples": [
@@ -383,7 +387,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -400,7 +404,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -421,7 +425,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.mixed_alternative",
                 "description": "",
                 "examples": [
@@ -438,7 +442,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.mixed_alternative",
                 "description": "",
                 "examples": [
@@ -455,7 +459,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.mixed_alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -472,7 +476,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.mixed_alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -489,7 +493,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -507,7 +511,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -524,7 +528,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.alternative",
                 "description": "",
                 "examples": [
@@ -539,7 +543,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.alternative",
                 "description": "",
                 "examples": [
@@ -557,7 +561,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -574,7 +578,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -591,7 +595,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.hijri.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -609,7 +613,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_mm_yy.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_mm_yy.gregorian.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -626,7 +630,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.mixed",
                 "description": "",
                 "examples": [
@@ -645,18 +649,14 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
-                "name": "date_patterns.dual_mm_yy.gregorian.mixed",
-                "description": "dual_mm_yy_gregorian",
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "name": "date_patterns.dual_dd_mm_yy.gregorian.mixed",
+                "description": "Matches a range of Gregorian day-month-year dates followed by a second Gregorian range",
                 "examples": [
-                    "from January 2023 CE to February 2024 CE - March 2025 CE - April 2026 CE", 
-                    "From January 2023 CE to February 2024 CE - March 2025 CE - April 2026 CE",
-                    "from March 2020 CE to April 2022 CE - May 2023 CE - June 2024 CE", 
-                    "From March 2020 CE to April 2022 CE - May 2023 CE - June 2024 CE",
-                    "يناير 2024 م - فبراير 2025 م - مارس 2026 م - أبريل 2027 م", 
-                    "January 2024 CE - February 2025 CE - March 2026 CE - April 2027 CE",
-                    "مايو 2023 م - يونيو 2024 م - يوليو 2025 م - أغسطس 2026 م", 
-                    "May 2023 CE - June 2024 CE - July 2025 CE - August 2026 CE"                
+                    "from 15/January/2023 CE to 10/February/2024 CE - 25/March/2025 CE - 01/April/2026 CE", 
+                    "From 15th January 2023 CE to 10th February 2024 CE - 25th March 2025 CE - 1st April 2026 CE",
+                    "15/يناير/2024 م - 10/فبراير/2025 م - 25/مارس/2026 م - 01/أبريل/2027 م", 
+                    "15th January 2024 CE - 10th February 2025 CE - 25th March 2026 CE - 1st April 2027 CE"
                 ],
                 "date": {
                     "weekday": None, "day": None, "month": None, "year": None, "century": None, "era": None, "calendar" : None
@@ -666,7 +666,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.mixed_parenthetical",
                 "description": "",
                 "examples": [
@@ -684,7 +684,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.gregorian.mixed_parenthetical",
                 "description": "",
                 "examples": [
@@ -706,7 +706,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -723,7 +723,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.gregorian.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -744,7 +744,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.mixed_alternative",
                 "description": "",
                 "examples": [
@@ -761,7 +761,41 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "name": "date_patterns.dual_dd_mm_yy.gregorian.mixed_alternative",
+                "description": "Matches a range of Gregorian day-month-year dates followed by the same range in Hijri",
+                "examples": [
+                    "15/يناير/2023 م - 10/فبراير/2024 م - 20/محرم/1445 هـ - 25/صفر/1446 هـ", 
+                    "15th January 2023 CE - 10th February 2024 CE - 20th Muharram 1445 AH - 25th Safar 1446 AH",
+                    "20/مارس/2020 م - 15/أبريل/2022 م - 27/رجب/1440 هـ - 01/شعبان/1445 هـ", 
+                    "20th March 2020 CE - 15th April 2022 CE - 27th Rajab 1440 AH - 1st Sha'ban 1445 AH"
+                ],
+                "date": {
+                    "weekday": None, "day": None, "month": None, "year": None, "century": None, "era": None, "calendar" : None
+                },
+                "date_end": {
+                    "weekday": None, "day": None, "month": None, "year": None, "century": None, "era": None, "calendar" : None
+                },
+            },
+            {
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "name": "date_patterns.dual_dd_mm_yy.hijri.mixed_alternative_parenthetical",
+                "description": "Matches a range of Hijri day-month-year dates followed by the same range in Gregorian between parentheses",
+                "examples": [
+                    "27/رمضان/1445 هـ - 01/شوال/1446 هـ - (15/مارس/2024 م - 10/أبريل/2025 م)", 
+                    "27th Ramadan 1445 AH - 1st Shawwal 1446 AH - (15th March 2024 CE - 10th April 2025 CE)",
+                    "15/محرم/1440 هـ - 10/صفر/1445 هـ - (20/يناير/2023 م - 25/فبراير/2024 م)", 
+                    "15th Muharram 1440 AH - 10th Safar 1445 AH - (20th January 2023 CE - 25th February 2024 CE)"
+                ],
+                "date": {
+                    "weekday": None, "day": None, "month": None, "year": None, "century": None, "era": None, "calendar" : None
+                },
+                "date_end": {
+                    "weekday": None, "day": None, "month": None, "year": None, "century": None, "era": None, "calendar" : None
+                },
+            },
+            {
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.gregorian.mixed_alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -780,7 +814,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -797,7 +831,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.gregorian.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -817,7 +851,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.alternative",
                 "description": "",
                 "examples": [
@@ -832,7 +866,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.gregorian.alternative",
                 "description": "",
                 "examples": [
@@ -851,7 +885,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -868,7 +902,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.gregorian.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -887,7 +921,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.hijri.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -904,7 +938,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_dd_mm_yy.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_dd_mm_yy.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_dd_mm_yy.gregorian.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -923,7 +957,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.mixed",
                 "description": "",
                 "examples": [
@@ -940,7 +974,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.mixed",
                 "description": "",
                 "examples": [
@@ -963,7 +997,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.mixed_parenthetical",
                 "description": "",
                 "examples": [
@@ -981,7 +1015,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.mixed_parenthetical",
                 "description": "",
                 "examples": [
@@ -1005,7 +1039,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -1022,7 +1056,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['mixed_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.mixed_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -1045,7 +1079,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.mixed_alternative",
                 "description": "",
                 "examples": [
@@ -1062,7 +1096,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['mixed_alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.mixed_alternative",
                 "description": "",
                 "examples": [
@@ -1083,7 +1117,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.mixed_alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -1100,7 +1134,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['mixed_alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.mixed_alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -1121,7 +1155,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -1138,7 +1172,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['mixed_alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.mixed_alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -1159,7 +1193,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.alternative",
                 "description": "",
                 "examples": [
@@ -1174,7 +1208,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.alternative",
                 "description": "",
                 "examples": [
@@ -1195,7 +1229,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -1212,7 +1246,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.alternative_parenthetical",
                 "description": "",
                 "examples": [
@@ -1233,7 +1267,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.hijri['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.hijri.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -1251,7 +1285,7 @@ def get_date_complex(date_patterns: DatePatterns):
                 },
             },
             {
-                "pattern": re.compile(date_patterns.dual_natural_language.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dual_natural_language.gregorian['alternative_double_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dual_natural_language.gregorian.alternative_double_parenthetical",
                 "description": "",
                 "examples": [
@@ -1273,5 +1307,6 @@ def get_date_complex(date_patterns: DatePatterns):
             }
         ]
     }
-    return complex_date_patterns_dict
+    # Component groups of every date of the patterns
+    return fill_group_maps(complex_date_patterns_dict, date_patterns)
            
\ No newline at end of file
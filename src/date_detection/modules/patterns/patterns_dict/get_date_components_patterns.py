@@ -9,6 +9,7 @@ if __name__ == "__main__":
 
 import re
 
+from modules.regex_patterns.pattern_registry import compile_pattern
 
 # All date patterns
 from modules.patterns.patterns_date_classes.date_patterns import (
@@ -24,7 +25,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
         },
         "patterns": [
             {  # Pattern 0 - Weekday Component
-                "pattern": re.compile(date_patterns.weekday, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.weekday, flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd",
                 "description": "Day component - requires calendar context for disambiguation",
                 "examples": [
@@ -37,7 +38,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 1 - Numeric Day Component (Ambiguous Calendar)
-                "pattern": re.compile(rf"{date_patterns.indicator.day}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.day}", flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(rf"{date_patterns.indicator.day}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.day}", flags=re.IGNORECASE | re.UNICODE),
                 "name": "day_component",
                 "description": "Day component - requires calendar context for disambiguation",
                 "examples": [
@@ -49,7 +50,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 2 - Numeric Day Component (Ambiguous Calendar)
-                "pattern": re.compile(rf"{date_patterns.indicator.month}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.month}", flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(rf"{date_patterns.indicator.month}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.month}", flags=re.IGNORECASE | re.UNICODE),
                 "name": "month_component",
                 "description": "Day component - ambiguous calendar",
                 "examples": [
@@ -61,7 +62,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 3 - Month Component (Hijri Calendar) 
-                "pattern": re.compile(date_patterns.mm.hijri, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.mm.hijri, flags=re.IGNORECASE | re.UNICODE),
                 "name": "month_component_hijri",
                 "description": "Month component - hijri calendar",
                 "examples": [  
@@ -73,7 +74,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 4 - Month Component (Gregorian Calendar)
-                "pattern": re.compile(date_patterns.mm.gregorian, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.mm.gregorian, flags=re.IGNORECASE | re.UNICODE),
                 "name": "month_component_gregorian",
                 "description": "Month component - gregorian calendar",
                 "examples": [ 
@@ -86,7 +87,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 5 - Month Component (julian Calendar)
-                "pattern": re.compile(date_patterns.mm.julian, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.mm.julian, flags=re.IGNORECASE | re.UNICODE),
                 "name": "month_component_julian",
                 "description": "Month component - julian calendar",
                 "examples": [
@@ -99,7 +100,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 6 - Year Component (Ambiguous Calendar)
-                "pattern": re.compile(rf"{date_patterns.indicator.year}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.year}", flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(rf"{date_patterns.indicator.year}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.year}", flags=re.IGNORECASE | re.UNICODE),
                 "name": "year_component",
                 "description": "Year component - ambiguous calendar",
                 "examples": [
@@ -110,7 +111,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 7 - century Component
-                "pattern": re.compile(rf"{date_patterns.indicator.century}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.century}", flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(rf"{date_patterns.indicator.century}\s*{date_patterns.indicator.separator}?\s*{date_patterns.numeric.century}", flags=re.IGNORECASE | re.UNICODE),
                 "name": "century_component",
                 "description": "Century component - ambiguous calendar",
                 "examples": [
@@ -122,7 +123,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 8 - Era Component
-                "pattern": re.compile(date_patterns.era.hijri, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.era.hijri, flags=re.IGNORECASE | re.UNICODE),
                 "name": "era_component_hijri",
                 "description": "Era component - hijri calendar",
                 "examples": [
@@ -135,7 +136,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 9 - Era Component
-                "pattern": re.compile(date_patterns.era.gregorian, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.era.gregorian, flags=re.IGNORECASE | re.UNICODE),
                 "name": "era_component",
                 "description": "Era component - gregorian calendar",
                 "examples": [
@@ -147,7 +148,7 @@ def get_date_components_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 10 - Era Component
-                "pattern": re.compile(date_patterns.era.julian, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.era.julian, flags=re.IGNORECASE | re.UNICODE),
                 "name": "era_component",
                 "description": "Era component - julian calendar",
                 "examples": [
@@ -8,6 +8,10 @@ if __name__ == "__main__":
     add_modules_to_sys_path()
 
 import re
+
+from modules.regex_patterns.pattern_registry import compile_pattern
+from modules.patterns.patterns_dict.group_maps import fill_group_maps
+
 # All date patterns
 from modules.patterns.patterns_date_classes.date_patterns import (
       DatePatterns
@@ -22,7 +26,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
         },
         "patterns": [
             {  # Pattern 0 - Hijri Year Range (start+end)
-                "pattern": re.compile(date_patterns.cs_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.hijri.mixed",
                 "description": "Hijri year to Hijri year range using 'من .. إلى ..' format",
                 "examples": [
@@ -40,7 +44,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 1 - Gregorian Year Range
-                "pattern": re.compile(date_patterns.cs_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.gregorian.mixed",
                 "description": "Gregorian year to Gregorian year range using Arabic connectors",
                 "examples": [
@@ -63,7 +67,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             
             {
                 # Pattern 3 - 
-                "pattern": re.compile(date_patterns.cs_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.hijri.mixed_parenthetical",
                 "description": "Hijri year to Hijri year range using parentheses for the second year",
                 "examples": [
@@ -82,7 +86,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 4 -
-                "pattern": re.compile(date_patterns.cs_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.gregorian.mixed_parenthetical",
                 "description": "Gregorian year to Gregorian year range using parentheses for the second year",
                 "examples": [
@@ -97,7 +101,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 ],
             },
             {  # Pattern 4 - Hijri/Gregorian Combined (Hijri First)
-                "pattern": re.compile(date_patterns.cs_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.hijri.alternative",
                 "description": "Hijri year followed by Gregorian year (parallel calendar style)",
                 "examples": [
@@ -112,7 +116,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },   
             {  # Pattern 5 - Gregorian/Hijri Combined (Gregorian First)
-                "pattern": re.compile(date_patterns.cs_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.gregorian.alternative",
                 "description": "Gregorian year followed by Hijri year (parallel calendar style)",
                 "examples": [
@@ -128,7 +132,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 6 - Hijri/Gregorian Combined with Parentheses (Hijri First)
-                "pattern": re.compile(date_patterns.cs_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.hijri.alternative_parenthetical",
                 "description": "Hijri year followed by Gregorian year in parentheses (parallel calendar style)",
                 "examples": [
@@ -144,7 +148,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 7 - Gregorian/Hijri Combined with Parentheses (Gregorian First)
-                "pattern": re.compile(date_patterns.cs_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_yy.gregorian.alternative_parenthetical",
                 "description": "Gregorian year followed by Hijri year in parentheses (parallel calendar style)",
                 "examples": [
@@ -163,7 +167,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             # 7. MONTH-YEAR PATTERNS (RANGES & MIXED CALENDARS)
             # ===================================================================================
             {  # Pattern 6 - Hijri Month-Year to Hijri Month-Year
-                "pattern": re.compile(date_patterns.cs_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_mm_yy.hijri.mixed",
                 "description": "Matches Hijri month/year range using Arabic connectors like 'من .. إلى ..'",
                 "examples": [
@@ -182,7 +186,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 7 - Gregorian Month-Year to Gregorian Month-Year
-                "pattern": re.compile(date_patterns.cs_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_mm_yy.gregorian.mixed",
                 "description": "Matches Gregorian month/year range using Arabic connectors",
                 "examples": [
@@ -202,7 +206,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 8 - Hijri Month-Year to Hijri Month-Year with Parentheses
-                "pattern": re.compile(date_patterns.cs_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_mm_yy.hijri.mixed_parenthetical",
                 "description": "Hijri month/year range using parentheses for the second date",
                 "examples": [
@@ -222,7 +226,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 9 - Gregorian Month-Year to Gregorian Month-Year with Parentheses
-                "pattern": re.compile(date_patterns.cs_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_mm_yy.gregorian.mixed_parenthetical",
                 "description": "Gregorian month/year range using parentheses for the second date",
                 "examples": [
@@ -241,7 +245,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 7 - Hijri + Gregorian M/Y combo (Hijri first)
-                "pattern": re.compile(date_patterns.cs_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_mm_yy.hijri.alternative",
                 "description": "Hijri month/year followed by Gregorian month/year (parallel calendar style)",
                 "examples": [  
@@ -257,7 +261,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 
             },
             {  # Pattern 8 - Gregorian + Hijri M/Y combo (Gregorian first)
-                "pattern": re.compile(date_patterns.cs_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_mm_yy.gregorian.alternative",
                 "description": "Gregorian month/year followed by Hijri month/year (parallel calendar style)",
                 "examples": [  
@@ -272,7 +276,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {   # Pattern 9 - Hijri + Gregorian M/Y combo with Parentheses (Hijri first)
-                "pattern": re.compile(date_patterns.cs_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_mm_yy.hijri.alternative_parenthetical",
                 "description": "Hijri month/year followed by Gregorian month/year in parentheses (parallel calendar style)",
                 "examples": [
@@ -287,7 +291,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {   # Pattern 10 - Gregorian + Hijri M/Y combo with Parentheses (Gregorian first)
-                "pattern": re.compile(date_patterns.cs_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "single_alternative_gregorian_hijri_month_years_parenthetical",
                 "description": "Gregorian month/year followed by Hijri month/year in parentheses (parallel calendar style)",
                 "examples": [
@@ -305,7 +309,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             # 5. FULL DATE PATTERNS (day/month/year)
             # ===================================================================================
             {  # Pattern 6 - Hijri Month-Year to Hijri Month-Year
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.hijri.mixed",
                 "description": "Hijri full date with day/month/year and explicit era marker",
                 "examples": [
@@ -326,7 +330,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 7 - Gregorian Full Date with Era Marker
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.gregorian.mixed",
                 "description": "Gregorian full date with day/month/year and explicit era marker",
                 "examples": [
@@ -346,7 +350,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 8 - Hijri Full Date to Hijri Full Date with Parentheses
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.hijri.mixed_parenthetical",
                 "description": "Hijri full date range using parentheses for the second date",
                 "examples": [
@@ -368,7 +372,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 9 - Gregorian Full Date to Gregorian Full Date with Parentheses
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.gregorian.mixed_parenthetical",
                 "description": "Gregorian full date range using parentheses for the second date",
                 "examples": [
@@ -387,7 +391,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 10 - Hijri full date + Gregorian full date
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.hijri.alternative",
                 "description": "Complete Hijri date followed by Gregorian equivalent",
                 "examples": [
@@ -402,7 +406,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 11 - Gregorian full date + Hijri full date
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.gregorian.alternative",
                 "description": "Complete Gregorian date followed by Hijri equivalent",
                 "examples": [
@@ -419,7 +423,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },            
             },
             {   # Pattern 13 - Natural Language Hijri followed by Gregorian
-                "pattern": re.compile(rf"{date_patterns.weekday}\s*{date_patterns.indicator.separator}?\s*{date_patterns.cs_dd_mm_yy.hijri['alternative']}", flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(rf"{date_patterns.weekday}\s*{date_patterns.indicator.separator}?\s*{date_patterns.cs_dd_mm_yy.hijri['alternative']}", flags=re.IGNORECASE | re.UNICODE),
                 "name": "single_alternative_hijri_gregorian_full_dates_single_weekday", 
                 "description": "Matches a Hijri date in natural Arabic followed by a Gregorian date",
                 "examples": [  
@@ -435,7 +439,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {   # Pattern 14 - Natural Language Gregorian followed by Hijri
-                "pattern": re.compile(rf"{date_patterns.weekday}\s*{date_patterns.indicator.separator}?\s*{date_patterns.cs_dd_mm_yy.gregorian['alternative']}", flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(rf"{date_patterns.weekday}\s*{date_patterns.indicator.separator}?\s*{date_patterns.cs_dd_mm_yy.gregorian['alternative']}", flags=re.IGNORECASE | re.UNICODE),
                 "name": "single_alternative_gregorian_hijri_full_dates_single_weekday",
                 "description": "Matches a Gregorian date in natural Arabic followed by a Hijri date",
                 "examples": [  
@@ -454,7 +458,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 16 - 
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.hijri.alternative_parenthetical",
                 "description": "Complete Hijri date followed by Gregorian equivalent in parentheses",
                 "examples": [
@@ -470,7 +474,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 15 - 
-                "pattern": re.compile(date_patterns.cs_dd_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_dd_mm_yy.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_dd_mm_yy.gregorian.alternative_parenthetical",
                 "description": "Complete Gregorian date followed by Hijri equivalent in parentheses",
                 "examples": [
@@ -489,7 +493,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             # 6. DATE RANGE PATTERNS (Hijri to Hijri, Gregorian to Gregorian)
             # ===================================================================================
             {  # Pattern 54 - Hijri-to-Hijri date range with weekday
-                "pattern": re.compile(date_patterns.cs_natural_language.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.hijri['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.hijri.mixed",
                 "description": "Matches a date range from one Hijri date to another, both possibly with weekdays",
                 "examples": [  
@@ -505,7 +509,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {   # Pattern 55 - Gregorian-to-Gregorian date range with weekday
-                "pattern": re.compile(date_patterns.cs_natural_language.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.gregorian['mixed'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.gregorian.mixed",
                 "description": "Matches Gregorian date ranges with weekday context",
                 "examples": [ 
@@ -522,7 +526,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 55 -  
-                "pattern": re.compile(date_patterns.cs_natural_language.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.hijri['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.hijri.mixed_parenthetical",
                 "description": "Matches a date range from one Hijri date to another, both possibly with weekdays, using parentheses for the second date",
                 "examples": [
@@ -539,7 +543,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 55 -  
-                "pattern": re.compile(date_patterns.cs_natural_language.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.gregorian['mixed_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.gregorian.mixed_parenthetical",
                 "description": "Matches Gregorian date ranges with weekday context, using parentheses for the second date",
                 "examples": [
@@ -555,7 +559,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {   # Pattern 56 - Hijri date in natural Arabic followed by Gregorian date
-                "pattern": re.compile(date_patterns.cs_natural_language.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.hijri['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.hijri.alternative",
                 "description": "Matches a Hijri date in natural Arabic followed by a Gregorian date",
                 "examples": [
@@ -573,7 +577,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
                 },
             },
             {   # Pattern 57 - Gregorian date in natural Arabic followed by Hijri date
-                "pattern": re.compile(date_patterns.cs_natural_language.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.gregorian['alternative'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.gregorian.alternative",
                 "description": "Matches a Gregorian date in natural Arabic followed by a Hijri date",
                 "examples": [
@@ -592,7 +596,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 6 - Hijri/Hijri Combined with Parentheses (Hijri First)
-                "pattern": re.compile(date_patterns.cs_natural_language.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.hijri['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.hijri.alternative_parenthetical",
                 "description": "Hijri date followed by Gregorian date in parentheses (parallel calendar style)",
                 "examples": [
@@ -611,7 +615,7 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
             {
                 # Pattern 7 - Gregorian/Hijri Combined with Parentheses (Gregorian First)
-                "pattern": re.compile(date_patterns.cs_natural_language.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.cs_natural_language.gregorian['alternative_parenthetical'], flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.cs_natural_language.gregorian.alternative_parenthetical",
                 "description": "Gregorian date followed by Hijri date in parentheses (parallel calendar style)",
                 "examples": [
@@ -630,5 +634,6 @@ def get_date_mixed_patterns(date_patterns: DatePatterns):
             },
         ]
     }
-    return date_mixed_patterns_dict
+    # Component groups of every date of the patterns
+    return fill_group_maps(date_mixed_patterns_dict, date_patterns)
             
\ No newline at end of file
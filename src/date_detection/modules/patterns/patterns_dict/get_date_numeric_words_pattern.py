@@ -0,0 +1,91 @@
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+
+from modules.regex_patterns.pattern_registry import compile_pattern
+
+# All date patterns
+from modules.patterns.patterns_date_classes.date_patterns import (
+    DatePatterns
+    )
+
+
+def get_date_numeric_words_pattern(date_patterns: DatePatterns):
+    """
+    Years written out in words after a year indicator ("عام ألف وأربعمائة وخمسة وأربعين").
+
+    The ``year`` group holds the words; ``normalize_date_output`` turns them
+    into digits (see ``parse_numeric_words``). Languages without numeric word
+    keywords get no patterns.
+    """
+    words = date_patterns.words
+    if re.fullmatch(words, ""):
+        return {
+            "metadata": {"priority": 0, "match_type": "numeric_words"},
+            "patterns": [],
+        }
+
+    # Whole number words joined by spaces and the conjunction "و"
+    word = rf"{words}(?!\w)"
+    phrase = rf"({word}(?:\s+و?\s*{word})*)"
+    year_indicator = rf"{date_patterns.indicator.year}\s*{date_patterns.indicator.separator}?\s*"
+    year_group = re.compile(year_indicator).groups + 1
+
+    era_group = year_group + re.compile(phrase).groups
+    hijri = rf"{year_indicator}{phrase}\s*{date_patterns.era.hijri}"
+    gregorian = rf"{year_indicator}{phrase}\s*{date_patterns.era.gregorian}"
+
+    return {
+        "metadata" : {
+            "priority": 0,
+            "match_type": "numeric_words",
+        },
+        "patterns" : [
+            {   # Pattern 0 - Year in Words with Hijri Era
+                "pattern": compile_pattern(hijri, flags=re.IGNORECASE | re.UNICODE),
+                "name": "date_patterns.yy.hijri.words",
+                "description": "Year written in words with Hijri era marker",
+                "examples": [
+                    "عام ألف وأربعمائة وخمسة وأربعين هـ",
+                    "سنة ألف وثلاثمائة هجري",
+                ],
+                "date": {
+                    "weekday": None, "day": None, "month": None, "year": year_group, "century": None,
+                    "era": era_group, "calendar": "hijri"
+                },
+            },
+            {   # Pattern 1 - Year in Words with Gregorian Era
+                "pattern": compile_pattern(gregorian, flags=re.IGNORECASE | re.UNICODE),
+                "name": "date_patterns.yy.gregorian.words",
+                "description": "Year written in words with Gregorian era marker",
+                "examples": [
+                    "عام ألفين وأربعة وعشرين م",
+                    "سنة ألف وتسعمائة وخمسين ميلادي",
+                ],
+                "date": {
+                    "weekday": None, "day": None, "month": None, "year": year_group, "century": None,
+                    "era": era_group, "calendar": "gregorian"
+                },
+            },
+            {   # Pattern 2 - Year in Words (Ambiguous Calendar)
+                "pattern": compile_pattern(rf"{year_indicator}{phrase}", flags=re.IGNORECASE | re.UNICODE),
+                "name": "date_patterns.yy.words",
+                "description": "Year written in words - requires calendar context for disambiguation",
+                "examples": [
+                    "عام ألف وأربعمائة وخمسة وأربعين",
+                    "في سنة ألفين",
+                ],
+                "date": {
+                    "weekday": None, "day": None, "month": None, "year": year_group, "century": None,
+                    "era": None, "calendar": ""
+                },
+            },
+        ]
+    }
@@ -9,6 +9,8 @@ if __name__ == "__main__":
 
 import re
 
+from modules.regex_patterns.pattern_registry import compile_pattern
+
 # All date patterns
 from modules.patterns.patterns_date_classes.date_patterns import (
     DatePatterns
@@ -23,7 +25,7 @@ def get_date_unknown_calender_patterns(date_patterns: DatePatterns):
         },
         "patterns" : [
             {   # Pattern 0 - Numeric Year (Ambiguous Calendar)
-                "pattern": re.compile(date_patterns.yy.numeric, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.yy.numeric, flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.yy.numeric",
                 "description": "Numeric format - requires calendar context for disambiguation",
                 "examples": [  
@@ -39,7 +41,7 @@ def get_date_unknown_calender_patterns(date_patterns: DatePatterns):
                 },
             },
             {  # Pattern 0 - Month/Year Numeric (Ambiguous Calendar)
-                "pattern": re.compile(date_patterns.mm_yy.numeric, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.mm_yy.numeric, flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.mm_yy.numeric",
                 "description": "Numeric/Numeric format - ambiguous calendar detection required",
                 "examples": [  
@@ -54,10 +56,10 @@ def get_date_unknown_calender_patterns(date_patterns: DatePatterns):
                     "1440/2024",  # This could be problematic - year/year format
                     "03-1401"     # Could be julian (year 1401 SH ≈ 2022-2023 CE)
                 ],
-                "date": { "weekday": None, "day": None, "month": 1, "year": 2, "century": None, "era": None, "calendar": "" },
+                "date": { "weekday": None, "day": None, "month": 1, "year": 3, "century": None, "era": None, "calendar": "" },
             },
             {  # Pattern 1 - Day/Month/Year Numeric (Ambiguous Calendar)
-                "pattern": re.compile(date_patterns.dd_mm_yy.numeric, flags=re.IGNORECASE | re.UNICODE),
+                "pattern": compile_pattern(date_patterns.dd_mm_yy.numeric, flags=re.IGNORECASE | re.UNICODE),
                 "name": "date_patterns.dd_mm_yy.numeric",
                 "description": "Numeric day/month/year format - requires calendar context for disambiguation",
                 "examples": [  
@@ -68,7 +70,7 @@ def get_date_unknown_calender_patterns(date_patterns: DatePatterns):
                     "10/06/1445",  # Could be 10th Jumada al-Thani 1445 AH (Hijri)
                     "31/01/1401"   # Could be julian format
                 ],
-                "date": { "weekday": None, "day": 1, "month": 2, "year": 3, "century": None, "era": None,  "calendar": "" },
+                "date": { "weekday": None, "day": 1, "month": 3, "year": 5, "century": None, "era": None,  "calendar": "" },
             },
         ]
     }
@@ -0,0 +1,277 @@
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+# All date patterns
+from modules.patterns.patterns_date_classes.date_patterns import (
+    DatePatterns
+    )
+
+COMPONENT_KEYS = ("weekday", "day", "month", "year", "century", "era", "calendar")
+CALENDARS = ("hijri", "gregorian", "julian")
+
+_REPEATS = tuple(
+    op for op in (
+        _sre_parse.MAX_REPEAT,
+        _sre_parse.MIN_REPEAT,
+        getattr(_sre_parse, "POSSESSIVE_REPEAT", None),
+    ) if op is not None
+)
+# Alternation paths read per pattern at most
+_MAX_PATHS = 4096
+
+
+def _capturing_groups(source: str) -> List[Tuple[int, str]]:
+    """``(group number, group source)`` of every capturing group, in opening order."""
+    groups: List[Tuple[int, int]] = []  # (group number, start) in opening order
+    spans: Dict[int, str] = {}
+    stack: List[Tuple[Optional[int], int]] = []
+    count = 0
+    i = 0
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # "]" right after "[" or "[^" is a literal
+            if source[i + 1:i + 2] == "^":
+                i += 1
+            if source[i + 1:i + 2] == "]":
+                i += 1
+        elif char == "(":
+            capturing = not source.startswith("?", i + 1) or source.startswith("?P<", i + 1)
+            if capturing:
+                count += 1
+                groups.append((count, i))
+            stack.append((count if capturing else None, i))
+        elif char == ")" and stack:
+            number, start = stack.pop()
+            if number is not None:
+                spans[number] = source[start:i + 1]
+        i += 1
+    return [(number, spans[number]) for number, _ in groups if number in spans]
+
+
+def _component_sources(date_patterns: DatePatterns) -> Dict[str, Tuple[str, str]]:
+    """Group source of every component pattern -> (kind, calendar)."""
+    def inner(pattern: str) -> str:
+        # Indicators and number words are wrapped as "(?:(...))"
+        return pattern[3:-1] if pattern.startswith("(?:(") and pattern.endswith("))") else pattern
+
+    sources: Dict[str, Tuple[str, str]] = {}
+    numeric = date_patterns.numeric
+    for field in ("day", "month", "century"):
+        sources[getattr(numeric, field)] = ("number", "")
+    sources[numeric.year] = ("year", "")
+    sources[inner(date_patterns.words)] = ("number", "")
+    sources[date_patterns.weekday] = ("weekday", "")
+    for calendar in CALENDARS:
+        sources[getattr(date_patterns.mm, calendar)] = ("month", calendar)
+        sources[getattr(date_patterns.era, calendar)] = ("era", calendar)
+    for field in ("day", "month", "year", "century"):
+        sources[inner(getattr(date_patterns.indicator, field))] = (f"indicator_{field}", "")
+    return sources
+
+
+class _Date:
+    """Group numbers of one date of a pattern, while it is being read."""
+
+    def __init__(self):
+        self.slots: Dict[str, int] = {}
+        self.calendar = ""
+        self.numbers: List[Tuple[int, Optional[str], bool]] = []  # (group, indicator, after year)
+
+    def empty(self) -> bool:
+        return not self.slots and not self.numbers
+
+    def closed(self) -> bool:
+        return "era" in self.slots
+
+    def number_limit(self) -> int:
+        # Day and month numbers, or only the day when the month is a name
+        return 1 if "month" in self.slots else 2
+
+    def to_map(self, default_calendar: str) -> Dict[str, Any]:
+        slots = dict(self.slots)
+        free = []
+        for group, indicator, after_year in self.numbers:
+            component = indicator[len("indicator_"):] if indicator else None
+            if component in ("day", "month", "century") and component not in slots:
+                slots[component] = group
+            else:
+                free.append((group, after_year))
+        if "month" in slots:
+            order = ["day"]
+        elif len(free) >= 2:
+            # dd/mm/yy, or mm/dd after the year (yy/mm/dd)
+            order = ["month", "day"] if free[0][1] else ["day", "month"]
+        else:
+            order = ["month"] if "year" in slots else ["day"]
+        for (group, _), component in zip(free, [c for c in order if c not in slots]):
+            slots[component] = group
+        date_map: Dict[str, Any] = {key: slots.get(key) for key in COMPONENT_KEYS}
+        date_map["calendar"] = self.calendar or default_calendar
+        return date_map
+
+
+def _tokens(items, kinds: Dict[int, Tuple[str, str]]) -> List[Tuple]:
+    """Component groups of a parsed pattern in source order; alternations as ``("branch", [...])``."""
+    tokens: List[Tuple] = []
+    for op, av in items:
+        if op == _sre_parse.SUBPATTERN:
+            group = av[0]
+            if group in kinds:
+                tokens.append((group,) + kinds[group])
+            else:
+                tokens.extend(_tokens(av[3], kinds))
+        elif op in _REPEATS:
+            tokens.extend(_tokens(av[2], kinds))
+        elif op == _sre_parse.BRANCH:
+            alternatives = [_tokens(alternative, kinds) for alternative in av[1]]
+            if any(alternatives):
+                tokens.append(("branch", alternatives))
+    return tokens
+
+
+def _paths(tokens: List[Tuple]) -> List[List[Tuple]]:
+    """Every sequence of component groups one match can fill, one alternative per alternation."""
+    paths: List[List[Tuple]] = [[]]
+    for token in tokens:
+        if token[0] == "branch":
+            alternatives = [path for alternative in token[1] for path in _paths(alternative)]
+            paths = [path + tail for path in paths for tail in alternatives][:_MAX_PATHS]
+        else:
+            paths = [path + [token] for path in paths]
+    return paths
+
+
+def _read_path(path: List[Tuple], default_calendar: str) -> List[Dict[str, Any]]:
+    """Date maps of one linear sequence of component groups."""
+    dates = [_Date()]
+    indicator = None
+    for group, kind, calendar in path:
+        current = dates[-1]
+        if kind.startswith("indicator_"):
+            if current.closed() or (kind == "indicator_year" and "year" in current.slots):
+                dates.append(_Date())
+            indicator = kind
+            continue
+        if kind == "number":
+            if current.closed() or len(current.numbers) >= current.number_limit():
+                dates.append(_Date())
+                current = dates[-1]
+            current.numbers.append((group, indicator, "year" in current.slots))
+        else:
+            if kind in current.slots or (kind != "era" and current.closed()):
+                dates.append(_Date())
+                current = dates[-1]
+            current.slots[kind] = group
+            if calendar and not current.calendar:
+                current.calendar = calendar
+        indicator = None
+    return [date.to_map(default_calendar) for date in dates if not date.empty()]
+
+
+def _merge_maps(maps: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    One map for the same date read on several paths: a component found in
+    several groups gets the list of them (the first non-empty one wins).
+    """
+    merged: Dict[str, Any] = {}
+    for key in COMPONENT_KEYS[:-1]:
+        groups: List[int] = []
+        for date_map in maps:
+            group = date_map.get(key)
+            if group is not None and group not in groups:
+                groups.append(group)
+        merged[key] = None if not groups else groups[0] if len(groups) == 1 else groups
+    calendars = {date_map["calendar"] for date_map in maps}
+    # Alternatives in different calendars: left to the era / month normalisation
+    merged["calendar"] = calendars.pop() if len(calendars) == 1 else ""
+    return merged
+
+
+def derive_group_maps(source: str, date_patterns: DatePatterns, default_calendar: str = "",
+                      flags: int = 0) -> List[Dict[str, Any]]:
+    """
+    Component-to-group maps of the dates a pattern matches, read from its source.
+
+    Capturing groups are recognised by their source (the weekday, month, era,
+    number and indicator patterns of ``date_patterns``). Every path through
+    the pattern's alternations is read in order: a new date starts after an
+    era or when a component repeats, and numbers become days, months or
+    centuries from the indicator before them and the other components of
+    their date. The dates of all paths are merged by position.
+
+    Args:
+        source (str): Pattern source
+        date_patterns (DatePatterns): Patterns the source was built from
+        default_calendar (str): Calendar of dates without month name or era
+        flags (int): Flags the pattern is compiled with
+
+    Returns:
+        List[Dict[str, Any]]: One ``date`` map per date, in text order
+    """
+    sources = _component_sources(date_patterns)
+    kinds = {
+        group: sources[group_source]
+        for group, group_source in _capturing_groups(source)
+        if group_source in sources
+    }
+    try:
+        parsed = _sre_parse.parse(source, flags & (re.IGNORECASE | re.UNICODE | re.VERBOSE))
+    except re.error:
+        return []
+    paths = [_read_path(path, default_calendar) for path in _paths(_tokens(parsed, kinds))]
+    count = max((len(dates) for dates in paths), default=0)
+    return [
+        _merge_maps([dates[position] for dates in paths if position < len(dates)])
+        for position in range(count)
+    ]
+
+
+def fill_group_maps(patterns_dict: Dict[str, Any], date_patterns: DatePatterns) -> Dict[str, Any]:
+    """
+    Fill the ``date`` / ``date_end`` maps of the patterns of a tier that have
+    no group numbers yet, from ``derive_group_maps``. The first date of a
+    pattern becomes ``date`` and, for patterns with a ``date_end`` map, the
+    end of the range ``date_end``: the second date, or the third one for the
+    ``alternative`` patterns, which give every date in both calendars.
+
+    Returns:
+        Dict[str, Any]: ``patterns_dict``, updated in place
+    """
+    for patterns_info in patterns_dict["patterns"]:
+        date_map = patterns_info.get("date") or {}
+        if any(isinstance(date_map.get(key), (int, list)) for key in COMPONENT_KEYS):
+            continue
+        name = patterns_info.get("name", "")
+        default_calendar = next((calendar for calendar in CALENDARS if f".{calendar}." in name), "")
+        compiled = patterns_info["pattern"]
+        maps = derive_group_maps(compiled.pattern, date_patterns, default_calendar, compiled.flags)
+        if not maps:
+            continue
+        patterns_info["date"] = maps[0]
+        end = 2 if name.rsplit(".", 1)[-1].startswith(("alternative", "single_alternative")) else 1
+        if "date_end" in patterns_info and len(maps) > end:
+            patterns_info["date_end"] = maps[end]
+    return patterns_dict
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Tue Aug 05 09:27:51 2025
+
+@author: m.lotfi
+@description: Document-level result caches for ``DateDetector.match``.
+
+Results are keyed by a BLAKE2b digest of the document text combined with the
+detector fingerprint (language, normaliser configuration, regex backend, tiers
+and every pattern source, so a keyword change invalidates old entries). Three
+backends share the same interface:
+
+* ``MemoryResultCache``  - in-process LRU with optional TTL
+* ``SQLiteResultCache``  - pickled results in a local SQLite file, safe to share
+  between processes on the same machine, bounded by row count and optional TTL
+* ``SharedResultCache``  - a ``multiprocessing.Manager`` dict shared by a pool;
+  every lookup is a round trip to the manager process, so it pays off only
+  when the pipeline run it saves is slower than that. Bounded by entry count
+  (oldest written first) and optional TTL
+
+Example::
+
+    cache = MemoryResultCache(maxsize=10_000)
+    detector = DateDetector(lang="ar", result_cache=cache)
+    detector.match(text)          # miss, runs the pipeline
+    detector.match(text)          # hit, one hash and one lookup
+    cache.stats()
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import copy
+import hashlib
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, MutableMapping, Optional
+
+from modules.normalizers.normalize_cache import LRUCache, CacheStats
+
+# ===================================================================================
+# KEYS AND COPIES
+# ===================================================================================
+
+def make_result_key(text: str, fingerprint: str) -> str:
+    """
+    Build the cache key of a document.
+
+    Args:
+        text (str): Document text
+        fingerprint (str): Detector configuration fingerprint
+
+    Returns:
+        str: Hex digest of ``fingerprint`` and ``text``
+    """
+    digest = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=20)
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.hexdigest()
+
+
+def copy_detection(detection: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy a ``DateDetector.match`` result deep enough that callers cannot alter the cache."""
+    return [
+        {
+            **item,
+            "metadata": dict(item["metadata"]),
+            # Group maps may be lists of groups: copied whole
+            "date": copy.deepcopy(item.get("date")),
+            "date_end": copy.deepcopy(item.get("date_end")),
+            "matches": [dict(match) for match in item["matches"]],
+        }
+        for item in detection
+    ]
+
+
+# ===================================================================================
+# BACKENDS
+# ===================================================================================
+
+class ResultCache:
+    """
+    Base class of result caches; subclasses implement ``_get``/``_put``/``clear``.
+
+    Hit and miss counters are kept per instance (per process for shared backends).
+    """
+
+    def __init__(self):
+        self._stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+
+    def _put(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached result for ``key`` or None."""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self._stats.misses += 1
+            else:
+                self._stats.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a result under ``key``."""
+        self._put(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and hit rate."""
+        return {**self._stats.to_dict(), "backend": type(self).__name__}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MemoryResultCache(ResultCache):
+    """
+    In-process LRU result cache.
+
+    Args:
+        maxsize (int): Maximum number of cached documents
+        ttl (float, optional): Entry lifetime in seconds
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: Optional[float] = None):
+        super().__init__()
+        self._lru = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def _get(self, key):
+        return self._lru.get(key)
+
+    def _put(self, key, value):
+        self._lru.put(key, value)
+
+    def clear(self):
+        self._lru.clear()
+
+    def stats(self):
+        lru_stats = self._lru.stats()
+        return {
+            **super().stats(),
+            "size": lru_stats["size"],
+            "evictions": lru_stats["evictions"],
+            "expirations": lru_stats["expirations"],
+        }
+
+
+class SQLiteResultCache(ResultCache):
+    """
+    Local-disk result cache in a SQLite file; results are pickled.
+
+    Several processes may open the same file. The connection is shared by the
+    threads of a process and serialised by a lock. Rows record when they were
+    written and last read; beyond ``maxsize`` rows the least recently read
+    ones are deleted, and rows older than ``ttl`` are treated as missing and
+    deleted with them. The table is trimmed every ``maxsize // 100`` writes
+    (every write for small caches), so it can briefly exceed ``maxsize`` by
+    that many rows.
+
+    Args:
+        path (str): Database file, created when missing
+        timeout (float): Seconds to wait on a locked database
+        maxsize (int, optional): Maximum number of cached documents;
+            ``None`` for no limit
+        ttl (float, optional): Entry lifetime in seconds
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0, maxsize: Optional[int] = 100_000,
+                 ttl: Optional[float] = None):
+        super().__init__()
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f"maxsize must be positive or None, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive or None, got {ttl}")
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._trim_every = max(1, maxsize // 100) if maxsize else 0
+        self._writes = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "created REAL NOT NULL DEFAULT 0, accessed REAL NOT NULL DEFAULT 0)"
+            )
+            # Files written before the size limit have no timestamp columns
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+            for column in ("created", "accessed"):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE results ADD COLUMN {column} REAL NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    def _get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if self.ttl is not None and row[1] < now - self.ttl:
+                with self._conn:
+                    self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                self._expirations += 1
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        return pickle.loads(row[0])
+
+    def _put(self, key, value):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, blob, now, now),
+            )
+            self._writes += 1
+            if self._trim_every and self._writes % self._trim_every == 0:
+                self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        """Delete expired rows, then the least recently read rows beyond ``maxsize``."""
+        if self.ttl is not None:
+            self._expirations += self._conn.execute(
+                "DELETE FROM results WHERE created < ?", (now - self.ttl,)
+            ).rowcount
+        self._evictions += self._conn.execute(
+            "DELETE FROM results WHERE key IN "
+            "(SELECT key FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.maxsize,),
+        ).rowcount
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def stats(self):
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {
+            **super().stats(),
+            "size": size,
+            "maxsize": self.maxsize,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "path": self.path,
+        }
+
+
+class SharedResultCache(ResultCache):
+    """
+    Result cache over a mapping shared between processes, typically a
+    ``multiprocessing.Manager().dict()`` proxy handed to pool workers.
+
+    A manager dict lives in the manager process: every lookup and store is a
+    round trip to it (the result pickled both ways), not a shared-memory
+    read. The cache object itself is picklable, so it can be passed in pool
+    ``initargs``; every worker then reads and fills the same store.
+
+    Entries record when they were written. Entries older than ``ttl`` are
+    treated as missing and deleted when read. Beyond ``maxsize`` entries the
+    oldest written ones are deleted (a shared read order would cost a write
+    per hit); each process trims every ``maxsize // 100`` of its writes, so
+    the store can briefly exceed ``maxsize`` by that many entries per process.
+
+    Args:
+        mapping (MutableMapping): Shared mapping, e.g. ``manager.dict()``
+        maxsize (int, optional): Maximum number of cached documents;
+            ``None`` for no limit
+        ttl (float, optional): Entry lifetime in seconds
+    """
+
+    def __init__(self, mapping: MutableMapping, maxsize: Optional[int] = 100_000,
+                 ttl: Optional[float] = None):
+        super().__init__()
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f"maxsize must be positive or None, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive or None, got {ttl}")
+        self._mapping = mapping
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._init_counters()
+
+    def _init_counters(self) -> None:
+        self._trim_every = max(1, self.maxsize // 100) if self.maxsize else 0
+        self._writes = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @classmethod
+    def create(cls, manager, maxsize: Optional[int] = 100_000,
+               ttl: Optional[float] = None) -> "SharedResultCache":
+        """Create a cache backed by a new dict of ``manager`` (a started ``SyncManager``)."""
+        return cls(manager.dict(), maxsize=maxsize, ttl=ttl)
+
+    def _get(self, key):
+        entry = self._mapping.get(key)
+        if entry is None:
+            return None
+        created, value = entry
+        if self.ttl is not None and created < time.time() - self.ttl:
+            self._mapping.pop(key, None)
+            self._expirations += 1
+            return None
+        return value
+
+    def _put(self, key, value):
+        self._mapping[key] = (time.time(), value)
+        self._writes += 1
+        if self._trim_every and self._writes % self._trim_every == 0:
+            self._trim()
+
+    def _trim(self) -> None:
+        """Delete the oldest written entries beyond ``maxsize``."""
+        # A manager dict keeps insertion order: the oldest keys come first
+        keys = list(self._mapping.keys())
+        for key in keys[:max(len(keys) - self.maxsize, 0)]:
+            if self._mapping.pop(key, None) is not None:
+                self._evictions += 1
+
+    def clear(self):
+        self._mapping.clear()
+
+    def stats(self):
+        return {
+            **super().stats(),
+            "size": len(self._mapping),
+            "maxsize": self.maxsize,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def __getstate__(self):
+        # Locks and counters are per process
+        return {"_mapping": self._mapping, "maxsize": self.maxsize, "ttl": self.ttl}
+
+    def __setstate__(self, state):
+        ResultCache.__init__(self)
+        self._mapping = state["_mapping"]
+        self.maxsize = state.get("maxsize")
+        self.ttl = state.get("ttl")
+        self._init_counters()
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Tue Aug 05 09:27:51 2025
+
+@author: m.lotfi
+@description: Script router: split text into Arabic-script and Latin segments in one pass.
+
+Keyword patterns of one language cannot match text written in another script:
+English month names never match inside Arabic text and the other way round.
+``segment_by_script`` scans the text once and returns its script segments, so
+a multi-language detector runs each language pack only over the segments of
+its script. Arabic-script segments also record whether they contain
+Persian-specific letters (``پ چ ژ گ ک ی``) or Persian digits. Most Solar Hijri
+month names (مهر, آبان, بهمن...) and the era هـ.ش have none of them, so a
+segment without them only skips the Persian-only keyword patterns when none of
+their keywords occur in it either (``LanguagePack.persian_keywords_in``).
+
+Characters of no script (digits, spaces, punctuation) are shared by the
+segments on both sides of them, so a date written between two scripts
+("15/03/2022") is seen by both packs.
+
+Example::
+
+    segment_by_script("ولد في 15 رمضان 1445 هـ - born 1 March 2024")
+    # [ScriptSegment(start=0, end=26, script='arabic', persian=False),
+    #  ScriptSegment(start=24, end=43, script='latin', persian=False)]
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Script of the keyword patterns of each pack language
+SCRIPT_LANGUAGES: Dict[str, str] = {
+    "arabic": "ar",
+    "latin": "en",
+}
+
+# Letter runs of each script. Arabic script covers the Arabic, Supplement,
+# Extended-A and Presentation Forms blocks, Arabic-Indic and Persian digits
+# included; Latin covers Basic Latin and Latin-1/Extended-A/B letters.
+_SCRIPT_RUNS = re.compile(
+    "(?P<arabic>[ؠ-ي٠-٩ٮ-ۓۺ-ۿ۰-۹ݐ-ݿࢠ-ࣿﭐ-﷿ﹰ-﻿]+)"
+    "|(?P<latin>[A-Za-zÀ-ÖØ-öø-ɏ]+)"
+)
+
+# Letters and digits used in Persian but not in Arabic
+_PERSIAN_EVIDENCE = re.compile("[پچژگکی۰-۹]")
+
+
+# ===================================================================================
+# SCRIPT SEGMENTS
+# ===================================================================================
+@dataclass(frozen=True)
+class ScriptSegment:
+    """
+    Span of text written in one script.
+
+    Attributes:
+        start (int): Start offset in the text
+        end (int): End offset in the text (exclusive)
+        script (str, optional): "arabic", "latin", or None for text without letters
+        persian (bool): Persian-specific letters or digits occur in the segment
+    """
+    start: int
+    end: int
+    script: Optional[str]
+    persian: bool = False
+
+    @property
+    def lang(self) -> Optional[str]:
+        """Pack language of the segment script (see ``SCRIPT_LANGUAGES``)."""
+        return SCRIPT_LANGUAGES.get(self.script)
+
+
+def segment_by_script(text: str) -> List[ScriptSegment]:
+    """
+    Split ``text`` into maximal segments of one script in a single scan.
+
+    Runs of the same script separated only by neutral characters form one
+    segment; the neutral characters between two segments of different
+    scripts belong to both. Text without letters is one segment of script None.
+
+    Args:
+        text (str): Input text
+
+    Returns:
+        List[ScriptSegment]: Segments in text order, covering the whole text
+    """
+    # [script, first run start, last run end, persian] per segment
+    runs: List[list] = []
+    for match in _SCRIPT_RUNS.finditer(text):
+        script = match.lastgroup
+        start, end = match.span()
+        if runs and runs[-1][0] == script:
+            runs[-1][2] = end
+        else:
+            runs.append([script, start, end, False])
+        if script == "arabic" and not runs[-1][3]:
+            runs[-1][3] = _PERSIAN_EVIDENCE.search(text, start, end) is not None
+
+    if not runs:
+        return [ScriptSegment(0, len(text), None)]
+
+    segments = []
+    for i, (script, _, _, persian) in enumerate(runs):
+        start = runs[i - 1][2] if i else 0
+        end = runs[i + 1][1] if i + 1 < len(runs) else len(text)
+        segments.append(ScriptSegment(start, end, script, persian))
+    return segments
+
+
+def script_letter_counts(text: str) -> Dict[str, int]:
+    """Number of letters of each script in ``text``."""
+    counts = {script: 0 for script in SCRIPT_LANGUAGES}
+    for match in _SCRIPT_RUNS.finditer(text):
+        counts[match.lastgroup] += match.end() - match.start()
+    return counts
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sun Aug 10 16:21:09 2025
+
+@author: m.lotfi
+@description: Temporal search index over detected dates and date ranges.
+
+Every detected date or range is normalised to a half-open interval of day
+ordinals through the calendar mapping table, whatever calendar it was written
+in, and stored with the id of the document it came from. Queries run on an
+``OrdinalIntervalIndex`` that is rebuilt lazily after additions:
+
+* ``stab(day)``               - documents mentioning a date that covers ``day``
+* ``overlapping(start, end)`` - documents mentioning a date sharing a day with the query
+* ``within(start, end)``      - documents mentioning a date lying inside the query
+* ``containing(start, end)``  - documents mentioning a date covering the whole query
+
+Partial dates are indexed as the interval they denote: "1440 هـ" covers the
+whole Hijri year, "رمضان 1440" the whole month.
+
+Example::
+
+    index = TemporalIndex()
+    for doc_id, text in documents:
+        index.add_detection(doc_id, detector.match(text), normalizer=detector.normalize_component)
+    start = index.ordinal('hijri', 1, 9, 1440)
+    end = index.ordinal('hijri', 1, 10, 1441)
+    index.overlapping(start, end + 1)
+    index.save("temporal_index.npz")
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from data._load_data.calendar_table import CalendarTable, get_calendar_table
+from modules.exporters.columnar_export import COMPONENTS, component_value
+from modules.patterns.patterns_date_classes.interval_index import (
+    OrdinalIntervalIndex,
+    range_span,
+    month_number,
+)
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Version of the ``save`` file layout
+INDEX_FORMAT_VERSION = 1
+
+# Characters at most between a date and an era match that gives its calendar
+_ERA_GAP = 2
+
+# ===================================================================================
+# COMPONENT RESOLUTION
+# ===================================================================================
+
+def components_span(components: Dict[str, Any], table: CalendarTable,
+                    default_calendar: Optional[str] = None) -> Optional[Tuple[int, int]]:
+    """
+    Ordinal interval ``[start, end)`` of one set of date components.
+
+    Args:
+        components (dict): Surface or normalised components (day, month, year, calendar)
+        table (CalendarTable): Conversion table
+        default_calendar (str, optional): Calendar assumed when none was detected
+
+    Returns:
+        Optional[Tuple[int, int]]: Interval of the date; a month, year or
+        century for partial dates (see ``CalendarTable.partial_span``)
+    """
+    calendar = components.get("calendar") or default_calendar
+    if not calendar:
+        return None
+
+    def as_int(value):
+        value = str(value).strip() if value is not None else ""
+        return int(value) if value.isdigit() else None
+
+    return table.partial_span(
+        calendar,
+        day=as_int(components.get("day")),
+        month=month_number(components.get("month")),
+        year=as_int(components.get("year")),
+        century=as_int(components.get("century")),
+    )
+
+
+def _era_only(date_map: Dict[str, Any]) -> bool:
+    """Map of an era component: an era group and a literal calendar, nothing else."""
+    components = {name for name, value in date_map.items() if value is not None}
+    return components == {"era", "calendar"} and isinstance(date_map["calendar"], str)
+
+
+# ===================================================================================
+# TEMPORAL INDEX
+# ===================================================================================
+
+class TemporalIndex:
+    """
+    Append-then-query index of document date intervals.
+
+    Args:
+        table (CalendarTable, optional): Conversion table, defaults to the shared one
+        block_size (int): Block size of the underlying ``OrdinalIntervalIndex``
+    """
+
+    def __init__(self, table: Optional[CalendarTable] = None, block_size: int = 64):
+        self.table = table or get_calendar_table()
+        self.block_size = block_size
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._doc_ids: List[Any] = []
+        self._index: Optional[OrdinalIntervalIndex] = None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    # Adding intervals
+    # ===============================================================================
+    def add(self, doc_id: Any, start: int, end: int) -> None:
+        """Add the half-open ordinal interval ``[start, end)`` of a document."""
+        if end <= start:
+            raise ValueError(f"Empty interval [{start}, {end})")
+        self._starts.append(int(start))
+        self._ends.append(int(end))
+        self._doc_ids.append(doc_id)
+        self._index = None
+
+    def add_date(self, doc_id: Any, calendar: str, day: int, month: int, year: int) -> bool:
+        """Add a single day; returns False when the date is not in the table."""
+        ordinal = self.table.to_ordinal(calendar, day, month, year)
+        if ordinal is None:
+            return False
+        self.add(doc_id, ordinal, ordinal + 1)
+        return True
+
+    def add_range(self, doc_id: Any, date_range: Any) -> bool:
+        """Add a ``DateRange``; returns False when it cannot be resolved."""
+        span = range_span(date_range, self.table)
+        if span is None:
+            return False
+        self.add(doc_id, *span)
+        return True
+
+    def add_detection(self, doc_id: Any, detection: List[Dict[str, Any]],
+                      normalizer: Optional[Callable] = None,
+                      default_calendar: Optional[str] = None) -> int:
+        """
+        Add every resolvable date of one document's ``DateDetector.match`` result.
+
+        A match is resolved through the pattern's ``date`` map, and through its
+        ``date_end`` map when the pattern describes a range and the match has
+        its end date. A match without a calendar takes the one of an era
+        matched right after it. Patterns without group maps are skipped.
+
+        Args:
+            doc_id: Document id stored with the intervals
+            detection (list): ``DateDetector.match`` output
+            normalizer (callable, optional): ``components -> components``,
+                e.g. ``detector.normalize_component``
+            default_calendar (str, optional): Calendar assumed for matches of
+                the ``unknown_calender`` tier
+
+        Returns:
+            int: Number of intervals added
+        """
+        # A date matched without its era ("عام 1445" then "هـ" in the components
+        # tier) takes the calendar of an era match right after it
+        era_calendars = {
+            match["span"][0]: (item.get("date") or {}).get("calendar")
+            for item in detection if _era_only(item.get("date") or {})
+            for match in item["matches"]
+        }
+        added = 0
+        for item in detection:
+            date_map = item.get("date") or {}
+            end_map = item.get("date_end") or {}
+            if not any(value is not None for value in date_map.values()):
+                continue
+            for match in item["matches"]:
+                end = match["span"][1]
+                calendar = next(
+                    (era_calendars[start] for start in range(end, end + _ERA_GAP + 1) if start in era_calendars),
+                    default_calendar,
+                )
+                span = self._map_span(match, date_map, normalizer, calendar)
+                if span is None:
+                    continue
+                if any(value is not None for value in end_map.values()):
+                    # A match of the first date alone leaves the end groups empty
+                    end_span = self._map_span(match, end_map, normalizer, calendar)
+                    if end_span is not None:
+                        if end_span[1] < span[0]:
+                            continue
+                        span = (span[0], end_span[1])
+                self.add(doc_id, *span)
+                added += 1
+        return added
+
+    def _map_span(self, match, date_map, normalizer, default_calendar) -> Optional[Tuple[int, int]]:
+        components = {
+            name: component_value(match["groups"], match["raw_groups"], date_map.get(name))
+            for name in COMPONENTS
+        }
+        if normalizer is not None and any(components.values()):
+            try:
+                components = {**components, **normalizer(components)}
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Normalisation failed for {components}: {e}")
+        return components_span(components, self.table, default_calendar)
+
+    # Queries
+    # ===============================================================================
+    def ordinal(self, calendar: str, day: int, month: int, year: int) -> Optional[int]:
+        """Day ordinal of a date, for building query bounds."""
+        return self.table.to_ordinal(calendar, day, month, year)
+
+    @property
+    def index(self) -> OrdinalIntervalIndex:
+        """Query structure, rebuilt after additions."""
+        if self._index is None:
+            doc_ids = np.empty(len(self._doc_ids), dtype=object)
+            doc_ids[:] = self._doc_ids
+            self._index = OrdinalIntervalIndex(
+                self._starts, self._ends, doc_ids, block_size=self.block_size
+            )
+        return self._index
+
+    @staticmethod
+    def _documents(ids: np.ndarray) -> List[Any]:
+        return list(dict.fromkeys(ids.tolist()))
+
+    def stab(self, ordinal: int) -> List[Any]:
+        """Documents with a date covering day ``ordinal``."""
+        return self._documents(self.index.stab(ordinal))
+
+    def overlapping(self, start: int, end: int) -> List[Any]:
+        """Documents with a date sharing at least one day with ``[start, end)``."""
+        return self._documents(self.index.overlapping(start, end))
+
+    def within(self, start: int, end: int) -> List[Any]:
+        """Documents with a date lying entirely inside ``[start, end)``."""
+        return self._documents(self.index.within(start, end))
+
+    def containing(self, start: int, end: int) -> List[Any]:
+        """Documents with a date covering all of ``[start, end)``."""
+        return self._documents(self.index.containing(start, end))
+
+    # Persistence
+    # ===============================================================================
+    def save(self, path: str) -> None:
+        """
+        Write the intervals to a NumPy ``.npz`` file.
+
+        Document ids are stored as a plain NumPy array (ints or strings);
+        mixed id types are stored as strings.
+        """
+        doc_ids = np.asarray(self._doc_ids)
+        if doc_ids.dtype == object:
+            doc_ids = doc_ids.astype(str)
+        np.savez_compressed(
+            path,
+            version=np.array(INDEX_FORMAT_VERSION),
+            starts=np.asarray(self._starts, dtype=np.int64),
+            ends=np.asarray(self._ends, dtype=np.int64),
+            doc_ids=doc_ids,
+        )
+        logger.debug(f"Saved {len(self)} intervals to {path}")
+
+    @classmethod
+    def load(cls, path: str, table: Optional[CalendarTable] = None, block_size: int = 64) -> "TemporalIndex":
+        """Read an index written by ``save``."""
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != INDEX_FORMAT_VERSION:
+                raise ValueError(f"Unsupported temporal index version: {version}")
+            index = cls(table=table, block_size=block_size)
+            index._starts = data["starts"].tolist()
+            index._ends = data["ends"].tolist()
+            index._doc_ids = data["doc_ids"].tolist()
+        return index
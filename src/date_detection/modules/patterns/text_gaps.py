@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Wed Aug 06 10:14:32 2025
+
+@author: m.lotfi
+@description: Uncovered ranges of a text, shrinking as detector tiers claim matches.
+
+The detector tiers run from the most specific (``complex``) to the least
+(``unknown_calender``). Once a tier has matched part of the text, the lower
+tiers only need the parts nobody matched yet: ``TextGaps`` keeps those parts
+as a sorted list of disjoint ``(start, end)`` ranges, and ``claim`` removes
+the spans of a tier's matches in one merge pass. A lower tier then runs
+``pattern.finditer(text, start, end)`` over each remaining gap that is at
+least as wide as the pattern's shortest match (``min_match_width``).
+
+Example::
+
+    gaps = TextGaps(40)
+    gaps.claim([(5, 20)])
+    list(gaps)               # [(0, 5), (20, 40)]
+    list(gaps.at_least(6))   # [(20, 40)]
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+from typing import Iterable, Iterator, List, Tuple
+
+Span = Tuple[int, int]
+
+
+class TextGaps:
+    """
+    Sorted, disjoint ``[start, end)`` ranges of a text not claimed by any match.
+
+    Args:
+        length (int): Length of the text; initially one gap covering all of it
+    """
+    __slots__ = ("_gaps",)
+
+    def __init__(self, length: int):
+        self._gaps: List[Span] = [(0, length)] if length > 0 else []
+
+    def __iter__(self) -> Iterator[Span]:
+        return iter(self._gaps)
+
+    def __len__(self) -> int:
+        return len(self._gaps)
+
+    def __bool__(self) -> bool:
+        return bool(self._gaps)
+
+    def __repr__(self) -> str:
+        return f"TextGaps({self._gaps!r})"
+
+    @property
+    def uncovered(self) -> int:
+        """Number of characters not claimed yet."""
+        return sum(end - start for start, end in self._gaps)
+
+    def at_least(self, width: int) -> Iterator[Span]:
+        """Gaps of ``width`` characters or more, in text order."""
+        return (gap for gap in self._gaps if gap[1] - gap[0] >= width)
+
+    def claim(self, spans: Iterable[Span]) -> None:
+        """
+        Remove ``spans`` from the gaps. Spans may overlap each other, reach
+        outside the gaps or be empty.
+        """
+        spans = sorted(span for span in spans if span[1] > span[0])
+        if not spans or not self._gaps:
+            return
+
+        gaps: List[Span] = []
+        first = 0
+        for start, end in self._gaps:
+            # Spans ending before this gap cannot touch the later gaps either
+            while first < len(spans) and spans[first][1] <= start:
+                first += 1
+            cursor = start
+            index = first
+            while index < len(spans) and spans[index][0] < end:
+                span_start, span_end = spans[index]
+                if span_start > cursor:
+                    gaps.append((cursor, span_start))
+                cursor = max(cursor, span_end)
+                index += 1
+            if cursor < end:
+                gaps.append((cursor, end))
+        self._gaps = gaps
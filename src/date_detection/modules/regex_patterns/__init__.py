@@ -1,5 +1,31 @@
 from modules.regex_patterns.keywords_to_regex import keywords_to_regex
 
+# Keyword registry: configurations indexed by (component, language, calendar)
+from modules.regex_patterns.keyword_registry import (
+    KeywordRegistry,  # Indexed keyword configurations with memoised alternations
+    get_keyword_registry,  # Shared registry of a keyword configuration list
+    clear_keyword_registries,  # Drop the shared registries
+)
+
+# Regex engines: stdlib re by default, regex / RE2 when installed
+from modules.regex_patterns.regex_backend import (
+    RegexBackend,  # Engine interface with capability check
+    compile_with_backend,  # Compile with the current backend, falling back to re
+    get_regex_backend,  # Backend by name (current one by default)
+    available_regex_backends,  # Names of the installed backends
+    set_default_regex_backend,  # Process-wide backend
+    using_regex_backend,  # Backend for the patterns compiled in a block
+    regex_backend_report,  # Patterns compiled and fallbacks per backend
+)
+
+# Compiled patterns shared per (source, flags, backend)
+from modules.regex_patterns.pattern_registry import (
+    PatternRegistry,  # Reference-counted compiled patterns with duplicate reports
+    compile_pattern,  # Compile once per process through the registry
+    get_pattern_registry,  # The process-wide registry
+    min_match_width,  # Shortest match of a compiled pattern
+)
+
 # Pattern generation functions
 from modules.regex_patterns.get_pattern import (
     get_era_pattern,  # Era pattern matching
@@ -24,6 +50,20 @@ from .get_date_patterns import (
 
 __all__ = [
     "keywords_to_regex",
+    "KeywordRegistry",
+    "get_keyword_registry",
+    "clear_keyword_registries",
+    "RegexBackend",
+    "compile_with_backend",
+    "get_regex_backend",
+    "available_regex_backends",
+    "set_default_regex_backend",
+    "using_regex_backend",
+    "regex_backend_report",
+    "PatternRegistry",
+    "compile_pattern",
+    "get_pattern_registry",
+    "min_match_width",
     "get_era_pattern",
     "get_month_pattern",
     "get_day_pattern",
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sun Jun 22 21:38:10 2025
+
+@author: m.lotfi
+
+@description: Benchmark of flat and prefix-tree (trie) keyword alternations.
+
+For the keyword alternations of ``get_date_patterns`` (months, eras, weekdays,
+indicators, numeric words) compare the two outputs of ``keywords_to_regex``:
+
+* compile time of the alternation alone and inlined in a composite
+  day-month-year pattern
+* scan time (``finditer``) over text that mentions keywords and over text
+  that does not, where every branch fails at every position
+* agreement: every keyword must match itself in full, and both forms must
+  find the same spans in the sample text
+
+Run from this directory::
+
+    python benchmark_keywords_to_regex.py [repeat]
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+from modules.keywords import era_keywords, months_keywords, indicators_keywords, weekdays_keywords, numeric_words_keywords
+from modules.regex_patterns.keyword_registry import get_keyword_registry
+from modules.regex_patterns.keywords_to_regex import keywords_to_regex
+
+# (name, keyword configurations, component, language, calendar)
+BENCHMARK_ALTERNATIONS: List[Tuple[str, list, Any, str, Any]] = [
+    ("hijri months", months_keywords, "month", "ar", "Hijri"),
+    ("gregorian months", months_keywords, "month", "ar", "Gregorian"),
+    ("julian months", months_keywords, "month", "persian_ar", "julian"),
+    ("hijri eras", era_keywords, None, "ar", "Hijri"),
+    ("gregorian eras", era_keywords, None, "ar", "Gregorian"),
+    ("weekdays", weekdays_keywords, "day", "ar", None),
+    ("year indicators", indicators_keywords, "year_indicator", "ar", None),
+    ("numeric words", numeric_words_keywords, "numeric_words", "ar", None),
+]
+
+# Text without any date keyword: every branch fails at every position
+FILLER = (
+    "قال المتحدث في المؤتمر الصحفي إن الاجتماع تناول عدة ملفات اقتصادية وسياسية "
+    "The committee reviewed the budget and published its findings online. "
+)
+
+
+def _compile_seconds(pattern: str, repeat: int) -> float:
+    """Mean seconds to compile ``pattern`` with the ``re`` cache cleared."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        re.purge()
+        re.compile(pattern, re.IGNORECASE)
+    return (time.perf_counter() - start) / repeat
+
+
+def _scan_seconds(regex: re.Pattern, text: str, repeat: int) -> float:
+    """Mean seconds of one full ``finditer`` scan of ``text``."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for _ in regex.finditer(text):
+            pass
+    return (time.perf_counter() - start) / repeat
+
+
+def _spans(regex: re.Pattern, text: str) -> List[Tuple[int, int]]:
+    return [match.span() for match in regex.finditer(text)]
+
+
+def benchmark_alternation(keywords: List[str], repeat: int = 20) -> Dict[str, Any]:
+    """
+    Compare flat and trie alternations of one keyword list.
+
+    Args:
+        keywords (List[str]): Keyword surface forms
+        repeat (int): Repetitions of every timing
+
+    Returns:
+        Dict[str, Any]: ``branches`` (number of keywords), ``flat``/``trie``
+        rows of ``length``, ``compile_us``, ``composite_compile_us``,
+        ``hit_scan_us`` and ``miss_scan_us``, plus ``mismatched_keywords``
+        and ``same_spans``
+    """
+    flat, trie = keywords_to_regex(keywords), keywords_to_regex(keywords, trie=True)
+    hit_text = " ".join(f"{FILLER} {keyword} 12" for keyword in keywords)
+    miss_text = FILLER * max(1, len(hit_text) // len(FILLER))
+
+    report: Dict[str, Any] = {"branches": len(set(keywords))}
+    compiled = {}
+    for name, pattern in (("flat", flat), ("trie", trie)):
+        composite = rf"(\d{{1,2}})\s*{pattern}\s*(\d{{1,4}})"
+        compiled[name] = re.compile(pattern, re.IGNORECASE)
+        report[name] = {
+            "length": len(pattern),
+            "compile_us": _compile_seconds(pattern, repeat) * 1e6,
+            "composite_compile_us": _compile_seconds(composite, repeat) * 1e6,
+            "hit_scan_us": _scan_seconds(compiled[name], hit_text, repeat) * 1e6,
+            "miss_scan_us": _scan_seconds(compiled[name], miss_text, repeat) * 1e6,
+        }
+
+    normalized = {" ".join(keyword.lower().split()) for keyword in keywords if keyword.strip()}
+    report["mismatched_keywords"] = sorted(
+        keyword for keyword in normalized if not compiled["trie"].fullmatch(keyword)
+    )
+    report["same_spans"] = _spans(compiled["flat"], hit_text) == _spans(compiled["trie"], hit_text)
+    return report
+
+
+def benchmark_keywords_to_regex(repeat: int = 20) -> Dict[str, Dict[str, Any]]:
+    """``benchmark_alternation`` of every alternation in ``BENCHMARK_ALTERNATIONS``."""
+    return {
+        name: benchmark_alternation(
+            list(get_keyword_registry(configs).keywords(component, lang, calendar)), repeat
+        )
+        for name, configs, component, lang, calendar in BENCHMARK_ALTERNATIONS
+    }
+
+
+def main():
+    """Print the benchmark report."""
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print("Keyword Alternation Benchmark (flat vs trie)")
+    print("=" * 50)
+    for name, row in benchmark_keywords_to_regex(repeat).items():
+        flat, trie = row["flat"], row["trie"]
+        print(f"{name.title()} ({row['branches']} keywords):")
+        print(f"   pattern length:    flat {flat['length']:,}, trie {trie['length']:,}")
+        print(f"   compile:           flat {flat['compile_us']:.0f} us, trie {trie['compile_us']:.0f} us")
+        print(f"   composite compile: flat {flat['composite_compile_us']:.0f} us, "
+              f"trie {trie['composite_compile_us']:.0f} us")
+        print(f"   scan with hits:    flat {flat['hit_scan_us']:.0f} us, trie {trie['hit_scan_us']:.0f} us")
+        print(f"   scan, no hits:     flat {flat['miss_scan_us']:.0f} us, trie {trie['miss_scan_us']:.0f} us")
+        print(f"   agreement:         same spans {row['same_spans']}, "
+              f"keywords not matched by trie {len(row['mismatched_keywords'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ Created on Thu Jul 24 20:01:16 2025
 """
 
 import re
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from typing import Pattern, Optional, Tuple
 
 from .keywords_to_regex import keywords_to_regex
@@ -43,13 +43,41 @@ from modules.patterns.patterns_date_classes import (
     NumericPatterns,
 )
 
+# Folded keyword configurations per normaliser configuration. The folded lists
+# must be the same objects on every call so their keyword registries (and the
+# memoised alternations) are shared between detectors.
+_folded_sources = {}
+
+
+def _keyword_sources(normalizer=None):
+    """Return the keyword configurations, folded by ``normalizer`` when given."""
+    sources = (era_keywords, months_keywords, indicators_keywords, weekdays_keywords, numeric_words_keywords)
+    if normalizer is None:
+        return sources
+    key = (type(normalizer), astuple(normalizer))
+    if key not in _folded_sources:
+        _folded_sources[key] = tuple(normalizer.fold_keyword_configs(configs) for configs in sources)
+    return _folded_sources[key]
+
+
 # ===============================
 # Pattern Builder – Dynamic by language
 # ===============================
-def get_date_patterns(lang: str) -> Tuple[BasePatterns, MonthPatterns, EraPatterns, IndicatorPatterns, NumericPatterns]:
+def get_date_patterns(lang: str, normalizer=None, trie: bool = False) -> Tuple[BasePatterns, MonthPatterns, EraPatterns, IndicatorPatterns, NumericPatterns]:
     """    Generate date patterns based on the specified language.
     Args:
         lang (str): Language code (e.g., 'ar', 'en', etc.)
+        normalizer (TextNormalizer, optional): Pre-normaliser applied to the text
+            before matching. Keywords are folded with it so they match the
+            normalised text, which also collapses orthographic variants into
+            one alternative. When it folds every digit to ASCII the numeric
+            patterns use ``[0-9]`` instead of the Unicode ``\d`` class.
+            Folded keywords and the generated alternations are memoised per
+            normaliser configuration and language, so further detectors
+            reuse them.
+        trie (bool): Build keyword alternations as prefix trees (common
+            prefixes matched once, longest keyword still preferred); see
+            ``keywords_to_regex`` and ``benchmark_keywords_to_regex``.
     Returns:
         DatePatterns: A dataclass containing all regex patterns for date components.
     
@@ -61,34 +89,42 @@ def get_date_patterns(lang: str) -> Tuple[BasePatterns, MonthPatterns, EraPatter
         'محرم|صفر|ربيع الأول|ربيع الآخر|جمادى الأولى|جمادى الآخرة|رجب|شعبان|رمضان|شوال|ذو القعدة|ذو الحجة'
         
     """
+    # Digits are already ASCII when the text goes through a folding pre-pass
+    digit = r"[0-9]" if normalizer is not None and normalizer.ascii_digits else r"\d"
+
+    # Keywords must see the same foldings as the text they are matched against
+    era_keywords, months_keywords, indicators_keywords, weekdays_keywords, numeric_words_keywords = (
+        _keyword_sources(normalizer)
+    )
+
     # Return all as compiled regex pattern strings
     return BasePatterns(
-            weekday         =   get_day_pattern(weekdays_keywords, lang),
-            numeric_words   =   get_numeric_words_pattern(numeric_words_keywords, lang)
+            weekday         =   get_day_pattern(weekdays_keywords, lang, trie=trie),
+            numeric_words   =   get_numeric_words_pattern(numeric_words_keywords, lang, trie=trie)
             
         ), MonthPatterns(
-            hijri           = get_month_pattern(months_keywords, lang, calendar="Hijri"),
-            gregorian       = get_month_pattern(months_keywords, lang, calendar="Gregorian"),
-            julian          = get_month_pattern(months_keywords, f"persian_{lang}", calendar="julian")
+            hijri           = get_month_pattern(months_keywords, lang, calendar="Hijri", trie=trie),
+            gregorian       = get_month_pattern(months_keywords, lang, calendar="Gregorian", trie=trie),
+            julian          = get_month_pattern(months_keywords, f"persian_{lang}", calendar="julian", trie=trie)
             
         ), EraPatterns(
-            hijri           = get_era_pattern(era_keywords, lang, calendar="Hijri"),
-            gregorian       = get_era_pattern(era_keywords, lang, calendar="Gregorian"),
-            julian          = get_era_pattern(era_keywords, f"persian_{lang}", calendar="julian")
+            hijri           = get_era_pattern(era_keywords, lang, calendar="Hijri", trie=trie),
+            gregorian       = get_era_pattern(era_keywords, lang, calendar="Gregorian", trie=trie),
+            julian          = get_era_pattern(era_keywords, f"persian_{lang}", calendar="julian", trie=trie)
             
         ), IndicatorPatterns(
-            day             = get_day_indicator_pattern(indicators_keywords, lang),
-            month           = get_month_indicator_pattern(indicators_keywords, lang),
-            year            = get_year_indicator_pattern(indicators_keywords, lang),
-            century         = get_century_pattern(indicators_keywords, lang),
-            separator       = get_separator_pattern(indicators_keywords, lang),
-            range_connector = get_range_connector_pattern(indicators_keywords, lang),
-            range_starter   = get_range_starter_pattern(indicators_keywords, lang)
+            day             = get_day_indicator_pattern(indicators_keywords, lang, trie=trie),
+            month           = get_month_indicator_pattern(indicators_keywords, lang, trie=trie),
+            year            = get_year_indicator_pattern(indicators_keywords, lang, trie=trie),
+            century         = get_century_pattern(indicators_keywords, lang, trie=trie),
+            separator       = get_separator_pattern(indicators_keywords, lang, trie=trie),
+            range_connector = get_range_connector_pattern(indicators_keywords, lang, trie=trie),
+            range_starter   = get_range_starter_pattern(indicators_keywords, lang, trie=trie)
         ), NumericPatterns(
-            year            = r"(\d{1,4})",
-            month           = r"(\d{1,2})",
-            day             = r"(\d{1,2})",
-            century         = r"(\d{1,2})"
+            year            = rf"({digit}{{1,4}})",
+            month           = rf"({digit}{{1,2}})",
+            day             = rf"({digit}{{1,2}})",
+            century         = rf"({digit}{{1,2}})"
         )
     
     '''
@@ -8,328 +8,119 @@ if __name__ == "__main__":
     # Ensure the modules directory is in sys.path for imports
     add_modules_to_sys_path()
 
-from .keywords_to_regex import keywords_to_regex
+from .keyword_registry import get_keyword_registry
+
+# Languages with keyword configurations - Arabic, English, and Persian variants
+SUPPORTED_PATTERN_LANGUAGES = ("ar", "en", "persian_ar", "persian_en")
+
+
+def _keyword_pattern(data, lang: str, component: str = None, calendar: str = None,
+                     group: bool = False, trie: bool = False) -> str:
+    """
+    Memoised alternation of the keywords of ``data`` selected by component,
+    language and calendar (see ``KeywordRegistry.pattern``). ``trie`` selects
+    the prefix-factored form of ``keywords_to_regex``.
+    """
+    # Validate language support
+    if lang not in SUPPORTED_PATTERN_LANGUAGES:
+        print(f"The Language [{lang}] specified not supported...")
+        return r''  # Return empty regex pattern for unsupported languages
+    return get_keyword_registry(data).pattern(component, lang, calendar, group=group, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
-# =================================================================================== 
-def get_era_pattern(data, lang: str = "ar", calendar: str = None) -> str:
+# ===================================================================================
+def get_era_pattern(data, lang: str = "ar", calendar: str = None, trie: bool = False) -> str:
     """Generate regex pattern for era keywords.
-    
+
     Args:
         data: List of data configurations, each containing language, calendar, and keywords
         lang: Language code to filter by (default: "ar" for Arabic, also supports "en")
         calendar: Optional calendar type to filter by (e.g., "hijri", "gregorian")
-    
+        trie: Merge common keyword prefixes (see ``keywords_to_regex``)
+
     Returns:
         str: Regex pattern string that matches era keywords, or empty string if language unsupported
     """
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        # Skip if language specified and doesn't match (exact or suffix match)
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        # Skip if calendar specified and doesn't match
-        if calendar and data_config["calendar"] != calendar:
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return keywords_to_regex(matching_keywords)
+    # Era configurations carry no component: filter by language and calendar only
+    return _keyword_pattern(data, lang, calendar=calendar, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def get_month_pattern(data, lang: str = "ar", calendar: str = None) -> str:
+def get_month_pattern(data, lang: str = "ar", calendar: str = None, trie: bool = False) -> str:
     """Generate regex pattern for month keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "month":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        if calendar and data_config["calendar"] != calendar:
-            continue
-        # Collect keywords for the specified calendar
-        matching_keywords.extend(data_config["keywords"])
-    
-    return keywords_to_regex(matching_keywords)
+    return _keyword_pattern(data, lang, "month", calendar, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
 # data = weekdays_keywords
-def get_day_pattern(data, lang: str = "ar") -> str:
+def get_day_pattern(data, lang: str = "ar", trie: bool = False) -> str:
     """Generate regex pattern for day keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "day":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return keywords_to_regex(matching_keywords)
+    return _keyword_pattern(data, lang, "day", trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-# data = numeric_words_keywords
-def get_numeric_words_pattern(data, lang: str = "ar") -> str:
-    """Generate regex pattern for numeric_words keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "numeric_words":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return keywords_to_regex(matching_keywords)
-
-# ===================================================================================
-# UTILITY FUNCTIONS
-# ===================================================================================
-def get_year_pattern(data, lang: str = "ar") -> str:
+def get_year_pattern(data, lang: str = "ar", trie: bool = False) -> str:
     """Generate regex pattern for year keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "year":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return keywords_to_regex(matching_keywords)
+    return _keyword_pattern(data, lang, "year", trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def get_year_indicator_pattern(data, lang: str = "ar") -> str:
-    """Generate regex pattern for year keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "year_indicator":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for year indicator keywords
-
+def get_year_indicator_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for year indicator keywords."""
+    return _keyword_pattern(data, lang, "year_indicator", group=True, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def get_day_indicator_pattern(data, lang: str = "ar") -> str:
-    """Generate regex pattern for year keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "day_indicator":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for day indicator keywords
+def get_day_indicator_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for day indicator keywords."""
+    return _keyword_pattern(data, lang, "day_indicator", group=True, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def get_month_indicator_pattern(data, lang: str = "ar") -> str:
-    """Generate regex pattern for year keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "month_indicator":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for month indicator keywords
+def get_month_indicator_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for month indicator keywords."""
+    return _keyword_pattern(data, lang, "month_indicator", group=True, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def get_separator_pattern(data, lang: str = "ar") -> str:
-    """"""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "separator_indicator":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for separator keywords
+def get_separator_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for date separator keywords."""
+    return _keyword_pattern(data, lang, "separator_indicator", group=True, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def get_range_connector_pattern(data, lang: str = "ar") -> str:
-    """"""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "range_connector_indicator":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for range connector keywords
+def get_range_connector_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for date range connector keywords."""
+    return _keyword_pattern(data, lang, "range_connector_indicator", group=True, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def get_range_starter_pattern(data, lang: str = "ar") -> str:
-    """"""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "range_starter_indicator":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for range starter keywords
+def get_range_starter_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for date range starter keywords."""
+    return _keyword_pattern(data, lang, "range_starter_indicator", group=True, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
 # data = indicators_keywords
-def get_century_pattern(data, lang: str = "ar") -> str:
-    """Generate regex pattern for year keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "century_indicator":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for century keywords
-
+def get_century_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for century keywords."""
+    return _keyword_pattern(data, lang, "century_indicator", group=True, trie=trie)
 
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
 # data = numeric_words_keywords
-def get_numeric_words_pattern(data, lang: str = "ar") -> str:
-    """Generate regex pattern for year keywords."""
-    
-    # Initialize list to collect matching keywords from filtered data configurations
-    matching_keywords = []
-    
-    # Validate language support - Arabic, English, and Persian variants are currently supported
-    if lang not in ["ar", "en", "persian_ar", "persian_en"]:
-        print(f"The Language [{lang}] specified not supported...")
-        return r''  # Return empty regex pattern for unsupported languages
-    
-    for data_config in data:
-        if data_config["component"] != "numeric_words":
-            continue
-        if lang and not data_config["language"].endswith(lang):
-
-            continue
-        matching_keywords.extend(data_config["keywords"])
-    
-    return rf"(?:{keywords_to_regex(matching_keywords)})"  # Return regex pattern for century keywords
-
-
+def get_numeric_words_pattern(data, lang: str = "ar", trie: bool = False) -> str:
+    """Generate regex pattern for numeric words keywords."""
+    return _keyword_pattern(data, lang, "numeric_words", group=True, trie=trie)
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sun Jun 22 21:38:10 2025
+
+@author: m.lotfi
+
+@description: Keyword configurations indexed by (component, language, calendar).
+
+The keyword configurations (``era_keywords``, ``months_keywords``,
+``weekdays_keywords``, ``indicators_keywords``, ``numeric_words_keywords``)
+are grouped once by their ``(component, language, calendar)`` key. Selecting
+the keywords of a component then scans the handful of distinct keys instead of
+every configuration, and the regex alternation generated for a selection is
+memoised, so detectors built for several languages or tenants share the same
+pattern fragments.
+
+Example::
+
+    registry = get_keyword_registry(months_keywords)
+    registry.pattern("month", "ar", "Hijri")        # built once
+    registry.pattern("month", "ar", "Hijri")        # memoised
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .keywords_to_regex import keywords_to_regex
+
+# (component, language, calendar) of a keyword configuration
+RegistryKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
+
+# ===================================================================================
+# KEYWORD REGISTRY
+# ===================================================================================
+class KeywordRegistry:
+    """
+    Keyword configurations indexed once by (component, language, calendar).
+
+    Selection follows the historical ``get_*_pattern`` filters: a configuration
+    matches when its component equals ``component``, its language ends with
+    ``lang`` (so ``"ar"`` also selects ``"persian_ar"``) and its calendar
+    equals ``calendar``; a filter left as None matches everything.
+
+    Args:
+        configs (Sequence[dict]): Keyword configurations with ``keywords`` and
+            optional ``component``, ``language`` and ``calendar`` entries
+    """
+
+    def __init__(self, configs: Sequence[dict]):
+        self._index: Dict[RegistryKey, List[str]] = {}
+        for config in configs:
+            key = (config.get("component"), config.get("language"), config.get("calendar"))
+            self._index.setdefault(key, []).extend(config["keywords"])
+        self._keywords: Dict[RegistryKey, Tuple[str, ...]] = {}
+        self._patterns: Dict[Tuple[RegistryKey, bool, bool], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self) -> List[RegistryKey]:
+        """Distinct (component, language, calendar) keys, in configuration order."""
+        return list(self._index)
+
+    def keywords(self, component: Optional[str] = None, lang: Optional[str] = None,
+                 calendar: Optional[str] = None) -> Tuple[str, ...]:
+        """Keywords of every configuration matching the filters, memoised."""
+        query = (component, lang, calendar)
+        if query not in self._keywords:
+            selected: List[str] = []
+            for (key_component, key_lang, key_calendar), keywords in self._index.items():
+                if component and key_component != component:
+                    continue
+                if lang and not (key_lang or "").endswith(lang):
+                    continue
+                if calendar and key_calendar != calendar:
+                    continue
+                selected.extend(keywords)
+            self._keywords[query] = tuple(selected)
+        return self._keywords[query]
+
+    def pattern(self, component: Optional[str] = None, lang: Optional[str] = None,
+                calendar: Optional[str] = None, group: bool = False, trie: bool = False) -> str:
+        """
+        Regex alternation of the selected keywords, memoised.
+
+        Args:
+            component (str, optional): Component filter ("month", "day", "year_indicator", ...)
+            lang (str, optional): Language suffix filter
+            calendar (str, optional): Calendar filter
+            group (bool): Wrap the alternation in a non-capturing group, as the
+                indicator patterns are
+            trie (bool): Prefix-factored alternation (see ``keywords_to_regex``)
+
+        Returns:
+            str: ``keywords_to_regex`` output, or ``"(?:...)"`` with ``group``
+        """
+        memo_key = ((component, lang, calendar), group, trie)
+        pattern = self._patterns.get(memo_key)
+        if pattern is None:
+            pattern = keywords_to_regex(list(self.keywords(component, lang, calendar)), trie=trie)
+            if group:
+                pattern = rf"(?:{pattern})"
+            self._patterns[memo_key] = pattern
+        return pattern
+
+
+# ===================================================================================
+# SHARED REGISTRIES
+# ===================================================================================
+# id(configs) -> (configs, registry); the configurations are kept alive so their id is not reused
+_registries: Dict[int, Tuple[Sequence[dict], KeywordRegistry]] = {}
+_registries_lock = threading.Lock()
+
+
+def get_keyword_registry(configs: Sequence[dict]) -> KeywordRegistry:
+    """
+    Shared ``KeywordRegistry`` of a keyword configuration list, built on first use.
+
+    Registries are keyed by the identity of ``configs``: pass the module-level
+    keyword lists (or lists that are themselves cached, like the folded
+    configurations of ``get_date_patterns``), not fresh copies.
+    """
+    entry = _registries.get(id(configs))
+    if entry is None:
+        with _registries_lock:
+            entry = _registries.get(id(configs))
+            if entry is None:
+                entry = (configs, KeywordRegistry(configs))
+                _registries[id(configs)] = entry
+    return entry[1]
+
+
+def clear_keyword_registries() -> None:
+    """Drop every shared registry, e.g. after editing keyword lists at runtime."""
+    with _registries_lock:
+        _registries.clear()
@@ -1,32 +1,107 @@
-
 # -*- coding: utf-8 -*-
 import re
-from typing import List
+from typing import Dict, List
 
 
 from .string_utils import sort_strings_by_word_char_count
 
+# Regex for a space inside a keyword: spaces are matched flexibly
+FLEXIBLE_SPACE = r'\s*'
+
 # ===================================================================================
 # UTILITY FUNCTIONS
 # ===================================================================================
-def keywords_to_regex(keywords: List[str], escape: bool = True) -> str:
+def keywords_to_regex(keywords: List[str], escape: bool = True, trie: bool = False) -> str:
     """
     Convert a list of keywords to a regex pattern.
     Sorts by length (longest first) and handles spaces flexibly.
+
+    With ``trie=True`` the keywords are merged into a prefix tree first, so
+    common prefixes are matched once (``ربيع\\s*(?:الأول|الآخر)``) instead of
+    being retried by every branch. Longer continuations are still tried before
+    shorter ones, so the longest keyword at a position wins as with the flat
+    alternation. ``trie`` only applies to escaped keywords.
     """
     if not keywords:
         return ""
-    
+
     keywords = list(set(keywords))
     # Sort by length (longest first) to avoid partial matches
     # sorted_keywords = sorted(keywords, key=len, reverse=True)
     sorted_keywords = sort_strings_by_word_char_count(keywords)
-    
-    if escape:
+
+    if escape and trie:
+        pattern = _trie_to_regex(_build_trie(k for k in sorted_keywords if k.strip()))
+    elif escape:
         # Escape regex special characters and make spaces flexible
-        escaped_keywords = [re.escape(k).replace(r'\ ', r'\s*') for k in sorted_keywords if k.strip()]
+        escaped_keywords = [re.escape(k).replace(r'\ ', FLEXIBLE_SPACE) for k in sorted_keywords if k.strip()]
         pattern = "|".join(escaped_keywords)
     else:
         pattern = "|".join([k for k in sorted_keywords if k.strip()])
-    
+
     return rf"({pattern})"
+
+
+# ===================================================================================
+# PREFIX TREE
+# ===================================================================================
+class _TrieNode:
+    """Prefix tree node: escaped-token children, end-of-keyword flag, longest tail."""
+    __slots__ = ("children", "end", "depth")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.end = False
+        self.depth = 0  # length of the longest keyword suffix below this node
+
+
+def _build_trie(keywords) -> _TrieNode:
+    """Prefix tree of keywords, one regex token (escaped character or flexible space) per edge."""
+    root = _TrieNode()
+    for keyword in keywords:
+        tokens = [FLEXIBLE_SPACE if char == " " else re.escape(char) for char in keyword]
+        path = [root]
+        for token in tokens:
+            path.append(path[-1].children.setdefault(token, _TrieNode()))
+        path[-1].end = True
+        for remaining, node in enumerate(reversed(path)):
+            node.depth = max(node.depth, remaining)
+    return root
+
+
+def _trie_to_regex(node: _TrieNode) -> str:
+    """
+    Regex of the keywords below ``node``.
+
+    Branches are ordered by their longest continuation, and a keyword ending
+    at ``node`` makes the branches an optional greedy group, so longer
+    keywords are tried first. Single-character leaves are merged into one
+    character class.
+    """
+    return _render(node)[0]
+
+
+def _render(node: _TrieNode):
+    """(regex, atomic) of the keywords below ``node``; ``atomic`` when a quantifier can follow directly."""
+    branches: List[str] = []
+    leaves: List[str] = []
+    for token, child in sorted(node.children.items(), key=lambda item: -item[1].depth):
+        if not child.children and token != FLEXIBLE_SPACE:
+            leaves.append(token)
+        else:
+            branches.append(token + _render(child)[0])
+
+    atomic = False
+    if leaves:
+        atomic = not branches
+        branches.append(leaves[0] if len(leaves) == 1 else f"[{''.join(leaves)}]")
+
+    if not branches:
+        return "", True
+    if len(branches) > 1:
+        body, atomic = "(?:" + "|".join(branches) + ")", True
+    else:
+        body = branches[0]
+    if node.end:
+        return (body if atomic else f"(?:{body})") + "?", True
+    return body, atomic
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sun Jun 22 21:38:10 2025
+
+@author: m.lotfi
+
+@description: Process-wide registry of compiled patterns, one per (source, flags, backend).
+
+The pattern dictionaries build many identical sources: the basic and mixed
+tiers overlap, and every detector of a language builds the same tiers again.
+``compile_pattern`` compiles each distinct (source, flags, backend) once and
+returns the same compiled object to every caller, counting its references.
+Language packs register the names they use a pattern under and release their
+references when they are dropped, so the registry also reports which sources
+are built more than once (``duplicates``) and which differ only in capture
+groups, flags or redundant whitespace (``near_duplicates``).
+``min_match_width`` gives the length of a pattern's shortest possible match,
+so callers can skip text too short for it.
+
+Example::
+
+    a = compile_pattern(r"(\\d{4})\\s*(هـ)", flags=re.IGNORECASE)
+    b = compile_pattern(r"(\\d{4})\\s*(هـ)", flags=re.IGNORECASE)
+    a is b                                   # True, compiled once
+    get_pattern_registry().stats()           # patterns, references, compiles saved
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import re
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .regex_backend import compile_with_backend, get_regex_backend
+
+try:
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+# (source, flags, backend name)
+PatternKey = Tuple[str, int, str]
+
+# Capturing group opener (not escaped, not "(?")
+_CAPTURING_GROUP = re.compile(r"(?<!\\)\((?!\?)")
+# Runs of optional whitespace that match the same as one
+_REPEATED_SPACE = re.compile(r"(?:\\s\*){2,}")
+# Escape sequences (``\\S``, ``\\d``, ``\\(``...): their case is meaningful
+_ESCAPE = re.compile(r"\\.", re.DOTALL)
+# Flags the re parser understands (the regex module adds its own)
+_PARSER_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE | re.UNICODE | re.ASCII
+
+
+def _canonical_source(source: str, flags: int) -> Tuple[str, int]:
+    """
+    Source with capture groups made non-capturing and repeated ``\\s*``
+    collapsed, case-folded under IGNORECASE: equal for patterns that match
+    the same text with different groups or redundant whitespace.
+    """
+    canonical = _REPEATED_SPACE.sub(r"\\s*", _CAPTURING_GROUP.sub("(?:", source))
+    if flags & re.IGNORECASE:
+        canonical = _fold_literals(canonical)
+    return canonical, flags & ~re.UNICODE
+
+
+def _fold_literals(source: str) -> str:
+    """Case-fold ``source`` outside its escapes: ``\\S`` must not become ``\\s``."""
+    parts: List[str] = []
+    last = 0
+    for escape in _ESCAPE.finditer(source):
+        parts.append(source[last:escape.start()].casefold())
+        parts.append(escape.group())
+        last = escape.end()
+    parts.append(source[last:].casefold())
+    return "".join(parts)
+
+
+class _Entry:
+    __slots__ = ("compiled", "refs", "names")
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        self.refs = 0
+        self.names: List[str] = []
+
+
+# ===================================================================================
+# PATTERN REGISTRY
+# ===================================================================================
+class PatternRegistry:
+    """Compiled patterns keyed by (source, flags, backend), with reference counts."""
+
+    def __init__(self):
+        self._entries: Dict[PatternKey, _Entry] = {}
+        # id(compiled) -> keys of the entries holding it; a backend falling
+        # back to ``re`` can hand the same object to two keys
+        self._keys: Dict[int, List[PatternKey]] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._compiles = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def compile(self, pattern: str, flags: int = 0, backend: Optional[str] = None):
+        """
+        Shared compiled ``pattern``: compiled with ``compile_with_backend`` on
+        first request, the same object afterwards. Every call adds a reference.
+        """
+        key = (pattern, int(flags), get_regex_backend(backend).name)
+        with self._lock:
+            self._requests += 1
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(compile_with_backend(pattern, flags, key[2]))
+                self._compiles += 1
+                self._entries[key] = entry
+                self._keys.setdefault(id(entry.compiled), []).append(key)
+            entry.refs += 1
+            return entry.compiled
+
+    def label(self, compiled, name: str) -> None:
+        """Record a name ``compiled`` is used under (for the reports)."""
+        with self._lock:
+            for key in self._keys.get(id(compiled), ()):
+                entry = self._entries[key]
+                if name not in entry.names:
+                    entry.names.append(name)
+
+    def release(self, compiled_patterns: Iterable[Any]) -> int:
+        """
+        Drop one reference per pattern; patterns without references are
+        removed. Returns the number of patterns removed.
+        """
+        removed = 0
+        with self._lock:
+            for compiled in compiled_patterns:
+                keys = self._keys.get(id(compiled))
+                if not keys:
+                    continue
+                # Entries sharing the object are interchangeable: release the
+                # most recently created one first
+                key = keys[-1]
+                entry = self._entries[key]
+                entry.refs -= 1
+                if entry.refs <= 0:
+                    del self._entries[key]
+                    keys.pop()
+                    if not keys:
+                        del self._keys[id(compiled)]
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys.clear()
+            self._requests = 0
+            self._compiles = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: ``patterns`` (distinct compiled), ``references``
+            (live references), ``requests`` (compile calls so far),
+            ``compiles_saved`` (requests served from the registry) and
+            ``compiled_bytes`` (``sys.getsizeof`` of the compiled patterns)
+        """
+        with self._lock:
+            return {
+                "patterns": len(self._entries),
+                "references": sum(entry.refs for entry in self._entries.values()),
+                "requests": self._requests,
+                "compiles_saved": self._requests - self._compiles,
+                "compiled_bytes": sum(sys.getsizeof(entry.compiled) for entry in self._entries.values()),
+            }
+
+    def duplicates(self) -> List[Dict[str, Any]]:
+        """Patterns referenced more than once, most referenced first."""
+        with self._lock:
+            rows = [
+                {"names": list(entry.names), "references": entry.refs, "flags": key[1],
+                 "backend": key[2], "length": len(key[0])}
+                for key, entry in self._entries.items() if entry.refs > 1
+            ]
+        return sorted(rows, key=lambda row: -row["references"])
+
+    def near_duplicates(self) -> List[Dict[str, Any]]:
+        """
+        Groups of distinct patterns that match the same text: equal sources
+        up to capture groups, repeated ``\\s*``, letter case under IGNORECASE
+        and the UNICODE flag.
+        """
+        with self._lock:
+            items = list(self._entries.items())
+        groups: Dict[Tuple[str, int, str], List[Tuple[PatternKey, _Entry]]] = {}
+        for key, entry in items:
+            canonical = _canonical_source(key[0], key[1])
+            groups.setdefault(canonical + (key[2],), []).append((key, entry))
+        return [
+            {
+                "names": [list(entry.names) for _, entry in members],
+                "flags": [key[1] for key, _ in members],
+                "backend": members[0][0][2],
+                "length": len(members[0][0][0]),
+            }
+            for members in groups.values() if len(members) > 1
+        ]
+
+
+# ===================================================================================
+# SHARED REGISTRY
+# ===================================================================================
+_registry = PatternRegistry()
+
+
+def get_pattern_registry() -> PatternRegistry:
+    """The process-wide registry used by ``compile_pattern``."""
+    return _registry
+
+
+def compile_pattern(pattern: str, flags: int = 0, backend: Optional[str] = None):
+    """
+    Compile ``pattern`` once per process with the selected regex backend
+    (see ``regex_backend``); repeated requests share the compiled object.
+
+    Args:
+        pattern (str): Regex source in Python ``re`` syntax
+        flags (int): ``re`` flags
+        backend (str, optional): Backend name; the current backend when omitted
+
+    Returns:
+        Compiled pattern with the ``re.Pattern`` matching interface
+    """
+    return _registry.compile(pattern, flags, backend)
+
+
+@lru_cache(maxsize=None)
+def _min_width(source: str, flags: int) -> int:
+    try:
+        return _sre_parse.parse(source, flags & _PARSER_FLAGS).getwidth()[0]
+    except re.error:
+        return 0
+
+
+def min_match_width(compiled) -> int:
+    """
+    Length of the shortest text ``compiled`` can match (0 when unknown).
+
+    Args:
+        compiled: Compiled pattern of any backend (``pattern`` and ``flags``
+            hold the ``re`` source and flags it was compiled from)
+
+    Returns:
+        int: Minimum match length in characters
+    """
+    return _min_width(compiled.pattern, compiled.flags)
@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+'''
+Created on Sun Jun 22 21:38:10 2025
+
+@author: m.lotfi
+
+@description: Pluggable regex engines for compiling and matching the date patterns.
+
+Every pattern of the pattern dictionaries is compiled through
+``compile_with_backend`` (via the shared ``pattern_registry``). The backend
+is stdlib ``re`` by default; when installed, the third-party ``regex``
+module or an RE2 binding (``re2``, linear-time matching without
+backtracking spikes) can be selected per language pack or process-wide. A backend first checks whether it can handle a pattern
+(``supports``); patterns it cannot handle, and patterns it fails to compile,
+fall back to ``re`` so a detector always gets its full pipeline.
+
+* ``re``: stdlib, handles everything the patterns use
+* ``regex``: drop-in superset of ``re`` (atomic groups, possessive
+  quantifiers, faster large alternations)
+* ``re2``: no lookaround, backreferences, atomic groups or possessive
+  quantifiers; ``\\d``, ``\\s`` and ``\\w`` are rewritten to their Unicode
+  classes (RE2 reads them as ASCII), ``\\b`` and negated classes inside
+  character sets fall back
+
+Example::
+
+    compile_with_backend(r"(\\d{1,2})\\s*(رمضان)", flags=re.IGNORECASE)      # stdlib
+    with using_regex_backend("re2"):
+        compile_with_backend(r"(\\d{1,2})\\s*(رمضان)", flags=re.IGNORECASE)  # RE2 or fallback
+    regex_backend_report()                                                  # compiled / fallbacks
+'''
+
+# Import path helper to ensure modules directory is in sys.path
+# ===================================================================================
+if __name__ == "__main__":
+    print("This module is not intended to be run directly. Import it in your code.")
+    # This is necessary for importing other modules in the package structure
+    from path_helper import add_modules_to_sys_path
+    # Ensure the modules directory is in sys.path for imports
+    add_modules_to_sys_path()
+
+import logging
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import re._parser as _sre_parse
+    import re._constants as _sre_constants
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_constants
+
+try:
+    import regex as _regex_module
+except ImportError:  # pragma: no cover - optional dependency
+    _regex_module = None
+
+try:
+    import re2 as _re2_module
+except ImportError:  # pragma: no cover - optional dependency
+    _re2_module = None
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGEX_BACKEND = "re"
+
+# Opcodes that only exist on newer Pythons
+_POSSESSIVE = tuple(op for op in (getattr(_sre_constants, "POSSESSIVE_REPEAT", None),) if op is not None)
+_ATOMIC = tuple(op for op in (getattr(_sre_constants, "ATOMIC_GROUP", None),) if op is not None)
+
+
+def _pattern_opcodes(parsed) -> Iterator[Tuple[Any, Any]]:
+    """Every (opcode, argument) of a parsed pattern, nested ones included."""
+    for op, av in parsed:
+        yield op, av
+        if op is _sre_constants.SUBPATTERN:
+            yield from _pattern_opcodes(av[-1])
+        elif op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT) + _POSSESSIVE:
+            yield from _pattern_opcodes(av[2])
+        elif op is _sre_constants.BRANCH:
+            for branch in av[1]:
+                yield from _pattern_opcodes(branch)
+        elif op in (_sre_constants.ASSERT, _sre_constants.ASSERT_NOT):
+            yield from _pattern_opcodes(av[1])
+        elif op is _sre_constants.GROUPREF_EXISTS:
+            yield from _pattern_opcodes(av[1])
+            if av[2] is not None:
+                yield from _pattern_opcodes(av[2])
+        elif op in _ATOMIC:
+            yield from _pattern_opcodes(av)
+
+
+# ===================================================================================
+# BACKENDS
+# ===================================================================================
+class RegexBackend:
+    """
+    A regex engine.
+
+    Subclasses set ``name``, implement ``available`` and ``_compile``, and
+    may restrict ``supports``. Compiled objects must offer the ``re.Pattern``
+    interface the detectors use: ``pattern``, ``flags``, ``groups``,
+    ``finditer``, ``search``, ``match`` and ``fullmatch``.
+    """
+    name = ""
+
+    def available(self) -> bool:
+        """True when the engine is installed."""
+        raise NotImplementedError
+
+    def supports(self, pattern: str, flags: int = 0) -> Optional[str]:
+        """None when the engine can run ``pattern``, else the reason it cannot."""
+        return None
+
+    def compile(self, pattern: str, flags: int = 0):
+        return self._compile(pattern, flags)
+
+    def _compile(self, pattern: str, flags: int):
+        raise NotImplementedError
+
+
+class StdlibBackend(RegexBackend):
+    """Python's ``re``: the default and the fallback of every other backend."""
+    name = "re"
+
+    def available(self) -> bool:
+        return True
+
+    def _compile(self, pattern: str, flags: int):
+        return re.compile(pattern, flags)
+
+
+class RegexModuleBackend(RegexBackend):
+    """The third-party ``regex`` module (``re``-compatible VERSION0 semantics)."""
+    name = "regex"
+
+    def available(self) -> bool:
+        return _regex_module is not None
+
+    def _compile(self, pattern: str, flags: int):
+        # re and regex share the values of the flags the patterns use (I, M, S, U, X)
+        return _regex_module.compile(pattern, flags)
+
+
+class _RE2Pattern:
+    """
+    RE2 compiled pattern presenting the source and flags it was requested
+    with, so fingerprints and pattern sharing see the same pattern whatever
+    engine runs it.
+    """
+    __slots__ = ("pattern", "flags", "_compiled")
+
+    def __init__(self, pattern: str, flags: int, compiled):
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled = compiled
+
+    @property
+    def groups(self) -> int:
+        return self._compiled.groups
+
+    def finditer(self, string, *args):
+        return self._compiled.finditer(string, *args)
+
+    def search(self, string, *args):
+        return self._compiled.search(string, *args)
+
+    def match(self, string, *args):
+        return self._compiled.match(string, *args)
+
+    def fullmatch(self, string, *args):
+        return self._compiled.fullmatch(string, *args)
+
+    def __eq__(self, other):
+        return isinstance(other, _RE2Pattern) and (self.pattern, self.flags) == (other.pattern, other.flags)
+
+    def __hash__(self):
+        return hash((_RE2Pattern, self.pattern, self.flags))
+
+    def __repr__(self):
+        return f"re2.compile({self.pattern!r}, {self.flags!r})"
+
+
+# Python's Unicode classes written for RE2, which reads \d \s \w as ASCII
+_PY_WHITESPACE = r"\t\n\x0b\f\r\x1c-\x20\x85\xa0\x{1680}\x{2000}-\x{200a}\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}"
+_RE2_CLASSES = {
+    "d": (r"\p{Nd}", r"\p{Nd}"),
+    "D": (r"\P{Nd}", None),
+    "w": (r"[\p{L}\p{N}_]", r"\p{L}\p{N}_"),
+    "W": (r"[^\p{L}\p{N}_]", None),
+    "s": (f"[{_PY_WHITESPACE}]", _PY_WHITESPACE),
+    "S": (f"[^{_PY_WHITESPACE}]", None),
+}
+
+
+class RE2Backend(RegexBackend):
+    """
+    Linear-time matching through an RE2 binding (``re2`` module).
+
+    Patterns with lookaround, backreferences, conditionals, atomic groups or
+    possessive quantifiers are not supported; Python's Unicode ``\\d``, ``\\s``
+    and ``\\w`` are rewritten to RE2 Unicode classes.
+    """
+    name = "re2"
+
+    _UNSUPPORTED = {
+        _sre_constants.ASSERT: "lookahead/lookbehind",
+        _sre_constants.ASSERT_NOT: "negative lookaround",
+        _sre_constants.GROUPREF: "backreference",
+        _sre_constants.GROUPREF_EXISTS: "conditional group",
+        **{op: "possessive quantifier" for op in _POSSESSIVE},
+        **{op: "atomic group" for op in _ATOMIC},
+    }
+
+    def available(self) -> bool:
+        return _re2_module is not None
+
+    def supports(self, pattern: str, flags: int = 0) -> Optional[str]:
+        try:
+            parsed = _sre_parse.parse(pattern, flags)
+        except re.error as exc:
+            return f"invalid pattern: {exc}"
+        for op, av in _pattern_opcodes(parsed):
+            if op in self._UNSUPPORTED:
+                return self._UNSUPPORTED[op]
+            if op is _sre_constants.AT and av in (_sre_constants.AT_BOUNDARY, _sre_constants.AT_NON_BOUNDARY):
+                return "word boundary"
+        if flags & ~(re.IGNORECASE | re.UNICODE | re.MULTILINE | re.DOTALL):
+            return "flags"
+        try:
+            self.translate(pattern)
+        except ValueError as exc:
+            return str(exc)
+        return None
+
+    @staticmethod
+    def translate(pattern: str) -> str:
+        """
+        ``pattern`` with Python's Unicode ``\\d \\s \\w`` (and negations)
+        written as RE2 classes.
+
+        Raises:
+            ValueError: For a negated class escape inside a character set
+        """
+        out = []
+        in_class = False
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if char == "\\" and i + 1 < len(pattern):
+                escape = pattern[i + 1]
+                if escape in _RE2_CLASSES:
+                    outside, inside = _RE2_CLASSES[escape]
+                    if in_class and inside is None:
+                        raise ValueError(f"negated class \\{escape} in a character set")
+                    out.append(inside if in_class else outside)
+                else:
+                    out.append(pattern[i:i + 2])
+                i += 2
+                continue
+            if in_class:
+                if char == "]" and not (out and out[-1] in ("[", "[^")):
+                    in_class = False
+            elif char == "[":
+                in_class = True
+                if pattern.startswith("[^", i):
+                    out.append("[^")
+                    i += 2
+                    continue
+            out.append(char)
+            i += 1
+        return "".join(out)
+
+    def _compile(self, pattern: str, flags: int):
+        inline = "".join(
+            letter for flag, letter in ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+            if flags & flag
+        )
+        source = self.translate(pattern)
+        if inline:
+            source = f"(?{inline}){source}"
+        return _RE2Pattern(pattern, flags, _re2_module.compile(source))
+
+
+_BACKENDS: Dict[str, RegexBackend] = {
+    backend.name: backend for backend in (StdlibBackend(), RegexModuleBackend(), RE2Backend())
+}
+
+
+# ===================================================================================
+# SELECTION
+# ===================================================================================
+_default_backend = DEFAULT_REGEX_BACKEND
+_local = threading.local()
+
+# backend name -> Counter of "compiled" and fallback reasons
+_report: Dict[str, Counter] = {}
+_report_lock = threading.Lock()
+
+
+def get_regex_backend(name: Optional[str] = None) -> RegexBackend:
+    """
+    Backend by name; the current one (``using_regex_backend`` block, else the
+    process default) when ``name`` is None.
+
+    Raises:
+        ValueError: For an unknown backend name
+    """
+    name = name or getattr(_local, "backend", None) or _default_backend
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown regex backend: '{name}'. Supported: {tuple(_BACKENDS)}")
+    return backend
+
+
+def available_regex_backends() -> Tuple[str, ...]:
+    """Names of the installed backends."""
+    return tuple(name for name, backend in _BACKENDS.items() if backend.available())
+
+
+def set_default_regex_backend(name: str) -> None:
+    """Process-wide backend for patterns compiled outside ``using_regex_backend``."""
+    global _default_backend
+    get_regex_backend(name)
+    _default_backend = name
+
+
+@contextmanager
+def using_regex_backend(name: Optional[str]):
+    """Compile the patterns built in this block (this thread only) with backend ``name``."""
+    if name is not None:
+        get_regex_backend(name)
+    previous = getattr(_local, "backend", None)
+    _local.backend = name or previous
+    try:
+        yield
+    finally:
+        _local.backend = previous
+
+
+def _count(backend: str, outcome: str) -> None:
+    with _report_lock:
+        _report.setdefault(backend, Counter())[outcome] += 1
+
+
+def compile_with_backend(pattern: str, flags: int = 0, backend: Optional[str] = None):
+    """
+    Compile ``pattern`` with the selected backend, falling back to ``re``
+    when the backend is not installed, cannot handle the pattern or fails
+    to compile it.
+
+    Args:
+        pattern (str): Regex source in Python ``re`` syntax
+        flags (int): ``re`` flags
+        backend (str, optional): Backend name; the current backend when omitted
+
+    Returns:
+        Compiled pattern with the ``re.Pattern`` matching interface
+    """
+    engine = get_regex_backend(backend)
+    if engine.name != DEFAULT_REGEX_BACKEND:
+        reason = "not installed" if not engine.available() else engine.supports(pattern, flags)
+        if reason is None:
+            try:
+                compiled = engine.compile(pattern, flags)
+                _count(engine.name, "compiled")
+                return compiled
+            except Exception as exc:  # engine-specific error types
+                reason = f"compile error: {exc}"
+        logger.debug("Regex backend %s falls back to re (%s): %.80s", engine.name, reason, pattern)
+        _count(engine.name, f"fallback: {reason.split(':')[0]}")
+    else:
+        _count(engine.name, "compiled")
+    return re.compile(pattern, flags)
+
+
+def regex_backend_report() -> Dict[str, Dict[str, int]]:
+    """Per backend, the number of patterns compiled by it and of fallbacks to ``re`` by reason."""
+    with _report_lock:
+        return {name: dict(counter) for name, counter in _report.items()}
+
+
+def clear_regex_backend_report() -> None:
+    with _report_lock:
+        _report.clear()
@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+'''
+@description: Make ``modules`` importable the way ``path_helper`` does for the package scripts.
+'''
+
+import sys
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1] / "src" / "date_detection"
+
+for path in (PACKAGE_ROOT, PACKAGE_ROOT / "modules"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
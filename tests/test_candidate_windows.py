@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+'''
+@description: Candidate windows keep results exact by default and only prune with a window size.
+'''
+
+from modules.patterns.date_detector import DateDetector
+
+TEXT = "يوم الجمعة" + " " * 130 + "15 رمضان 1445 هـ"
+
+
+def _matches(detector):
+    return {(record["pattern_name"], match["span"]) for record in detector.match(TEXT) for match in record["matches"]}
+
+
+def test_default_window_gives_the_whole_text_results():
+    assert _matches(DateDetector(lang="ar")) == _matches(DateDetector(lang="ar", candidate_window=0))
+    assert (4, 156) in {span for _, span in _matches(DateDetector(lang="ar"))}
+
+
+def test_report_counts_the_windowed_patterns():
+    anchors = DateDetector(lang="ar").pack.number_anchors
+    report = anchors.report()
+    assert report["windowed"] == report["bounded"] <= report["anchored"]
+    assert anchors.report(128)["windowed"] == report["anchored"]
+    assert anchors.report(0)["windowed"] == 0
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+'''
+@description: Entities read back from a DateEntityBatch equal the entities put in.
+'''
+
+from modules.patterns.patterns_date_classes.compact_entity import CompactDateEntity, DateEntityBatch
+from modules.patterns.patterns_date_classes.date_format import strftime_many
+
+
+def test_batch_round_trip_keeps_confidence_and_lang():
+    entities = [
+        CompactDateEntity(day=15, month=9, year=1445, calendar="hijri", era="هـ", confidence=0.9, lang="ar"),
+        CompactDateEntity(day=1, month=3, year=2024, calendar="gregorian", confidence=0.7, lang="en"),
+        CompactDateEntity(year=2020, calendar="gregorian"),
+    ]
+    batch = DateEntityBatch(entities, lang="en")
+    assert [entity.confidence for entity in batch] == [0.9, 0.7, None]
+    assert [entity.lang for entity in batch] == ["ar", "en", "en"]
+    assert list(batch)[:2] == entities[:2]
+
+
+def test_batch_renders_each_row_in_its_language():
+    batch = DateEntityBatch([
+        CompactDateEntity(day=15, month=9, year=1445, calendar="hijri", lang="ar"),
+        CompactDateEntity(day=15, month=9, year=1445, calendar="hijri", lang="en"),
+    ])
+    names = strftime_many(batch, "%B")
+    assert names == strftime_many(list(batch), "%B")
+    assert names[0] != names[1]
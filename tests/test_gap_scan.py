@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+'''
+@description: Gap scanning must not report fragments of tokens a higher tier claimed.
+'''
+
+import re
+
+from modules.patterns.date_detector import DateDetector
+from modules.patterns.text_gaps import TextGaps
+
+YEAR = re.compile(r"\d{1,4}")
+
+
+def _spans(text, claimed):
+    gaps = TextGaps(len(text))
+    gaps.claim(claimed)
+    return [match.span() for match in DateDetector._finditer(YEAR, text, gaps)]
+
+
+def test_match_running_into_claimed_digits_is_dropped():
+    # "24/03/25" claimed: "20" at the end of the gap is part of "2024"
+    assert _spans("year 2024/03/25", [(7, 15)]) == []
+
+
+def test_match_starting_inside_claimed_digits_is_dropped():
+    # "year 20" claimed: "24" at the start of the gap is part of "2024"
+    assert _spans("year 2024/03/25", [(0, 7)]) == [(10, 12), (13, 15)]
+
+
+def test_gap_edges_next_to_other_text_still_match():
+    assert _spans("2024 ok 1445", [(4, 8)]) == [(0, 4), (8, 12)]
+
+
+def test_gap_scan_reports_no_year_fragment():
+    text = "ولد في 15 رمضان 1445 هـ الموافق 2024/03/25 م"
+    detection = DateDetector(lang="ar", gap_scan=True).match(text)
+    spans = {match["span"] for item in detection for match in item["matches"]}
+    assert (32, 34) not in spans
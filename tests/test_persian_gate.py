@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+'''
+@description: The Persian gate of the multi-language detector must not drop Solar Hijri matches.
+'''
+
+import pytest
+
+from modules.patterns.date_detector import DateDetector
+from modules.patterns.multi_language_detector import MultiLanguageDateDetector
+from modules.patterns.script_router import segment_by_script
+
+
+def _matches(detection):
+    return {(record["pattern_name"], match["span"]) for record in detection for match in record["matches"]}
+
+
+@pytest.fixture(scope="module")
+def router():
+    return MultiLanguageDateDetector()
+
+
+@pytest.mark.parametrize("text", [
+    "في 15 مهر 1402 هـ.ش",
+    "ولد في 3 آبان 1380 هـ.ش",
+    "من بهمن 1399 إلى اسفند 1400 هـ.ش",
+])
+def test_router_matches_arabic_script_solar_hijri_like_the_detector(router, text):
+    assert _matches(router.match(text)) == _matches(DateDetector(lang="ar").match(text))
+
+
+def test_router_gates_text_without_persian_keywords(router):
+    text = "ولد في 15 رمضان 1445 هـ"
+    segment, = segment_by_script(text)
+    assert router._segment_detector(segment, text) is router.non_persian_detectors["ar"]
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+'''
+@description: Result caches must stay bounded and hand out results callers cannot corrupt.
+'''
+
+import time
+
+import pytest
+
+from modules.patterns.date_detector import DateDetector
+from modules.patterns.result_cache import MemoryResultCache, SharedResultCache
+from modules.regex_patterns.regex_backend import available_regex_backends
+
+TEXT = "ولد في 15 رمضان 1445 هـ"
+
+
+def test_mutating_a_result_leaves_the_pipeline_and_cache_intact():
+    detector = DateDetector(lang="ar", result_cache=MemoryResultCache())
+    first = detector.match(TEXT)
+    expected = [(item["date"], item["date_end"]) for item in detector.match(TEXT)]
+    for item in first:
+        for date_map in (item["date"], item["date_end"]):
+            if date_map:
+                date_map.clear()
+    assert [(item["date"], item["date_end"]) for item in detector.match(TEXT)] == expected
+    assert [(item["date"], item["date_end"]) for item in DateDetector(lang="ar").match(TEXT)] == expected
+
+
+def test_shared_cache_keeps_at_most_maxsize_entries():
+    mapping = {}
+    cache = SharedResultCache(mapping, maxsize=10)
+    for i in range(25):
+        cache.put(f"key-{i}", [i])
+    assert len(mapping) <= 10
+    assert cache.get("key-24") == [24]
+    assert cache.get("key-0") is None
+
+
+def test_shared_cache_expires_entries(monkeypatch):
+    cache = SharedResultCache({}, ttl=60)
+    cache.put("key", [1])
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    assert cache.get("key") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_fingerprint_depends_on_the_regex_backend():
+    backends = available_regex_backends()
+    if len(backends) < 2:
+        pytest.skip("a single regex backend is installed")
+    first, second = (DateDetector(lang="ar", regex_backend=name) for name in backends[:2])
+    assert first.fingerprint != second.fingerprint